@@ -1,9 +1,113 @@
 from __future__ import annotations
 
+import asyncio
+import codecs
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Mapping
 from dataclasses import dataclass
+from datetime import datetime, timedelta
+import json
+import logging
+import random
+import time
 from typing import Any
 
-from aiohttp import ClientResponseError, ClientSession
+from aiohttp import (
+    ClientConnectionError,
+    ClientPayloadError,
+    ClientResponse,
+    ClientResponseError,
+    ClientSession,
+    ClientTimeout,
+    ContentTypeError,
+)
+
+from .history import SERVER_TIMESTAMP_FORMAT, EnergyBuckets, parse_server_timestamp, row_flows_w
+from .metrics import SunflowMetrics
+
+_LOGGER = logging.getLogger(__name__)
+
+# Endpoint keys for SunflowClient.async_get_many().
+ENDPOINT_INFO = "info"
+ENDPOINT_REALTIME = "realtime"
+ENDPOINT_ROI = "roi"
+ENDPOINT_BATTERY_HEALTH = "battery_health"
+ENDPOINT_FORECAST = "forecast"
+ENDPOINT_TARIFF_COMPARE = "tariff_compare"
+
+ENDPOINT_PATHS = {
+    ENDPOINT_INFO: "/api/info",
+    ENDPOINT_REALTIME: "/api/data",
+    ENDPOINT_ROI: "/api/roi",
+    ENDPOINT_BATTERY_HEALTH: "/api/battery-health",
+    ENDPOINT_FORECAST: "/api/forecast",
+    # Fixed vs. aWATTar dynamic tariff for the current month (up to the current hour).
+    ENDPOINT_TARIFF_COMPARE: "/api/dynamic-pricing/awattar/compare?period=month",
+}
+
+# /api/energy switches to per-month averages above 62 days; get_energy_range() pages below that.
+ENERGY_RANGE_WINDOW = timedelta(days=31)
+
+# After a failed background refresh, keep serving the stale value and retry after this delay
+# (or the endpoint TTL, whichever is shorter) instead of on every tick.
+RETRY_AFTER_FAILURE_SECONDS = 60
+
+# Request pipeline for JSON GETs:
+# - each attempt gets REQUEST_TIMEOUT_SECONDS, the whole call (retries included) REQUEST_DEADLINE_SECONDS
+# - transient failures are retried with jittered exponential backoff, limited by a retry budget
+#   (each request earns RETRY_BUDGET_DEPOSIT tokens, each retry costs one), so retries stay a
+#   small fraction of traffic during outages
+# - after CIRCUIT_FAILURE_THRESHOLD consecutive transient failures the circuit opens and calls
+#   fail fast; after the open period one probe request is let through (half-open)
+REQUEST_TIMEOUT_SECONDS = 10
+REQUEST_DEADLINE_SECONDS = 20
+RETRY_MAX_ATTEMPTS = 3
+RETRY_BACKOFF_SECONDS = 0.5
+RETRY_BUDGET_MAX_TOKENS = 10.0
+RETRY_BUDGET_DEPOSIT = 0.1
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_OPEN_SECONDS = 30
+CIRCUIT_MAX_OPEN_SECONDS = 300
+
+# Server-Sent Events stream of realtime frames (same shape as /api/data).
+STREAM_PATH = "/api/stream"
+# The server sends keep-alive comments; a silent socket for this long is treated as dead.
+STREAM_READ_TIMEOUT_SECONDS = 60
+STREAM_EVENT_TYPES = ("message", "realtime")
+
+
+# Bulk snapshot: several resources in one request, advertised by the server in
+# /api/info "capabilities". Section names mirror the individual endpoint paths.
+# Only endpoints due in the same async_get_many() call are batched. The realtime coordinator
+# asks for info + realtime, and info is due hourly (INFO_TTL_SECONDS), so in practice
+# this saves the separate /api/info request once an hour. The analytics and forecast tiers
+# fetch on their own schedules and are not batched with realtime ticks.
+SNAPSHOT_PATH = "/api/snapshot"
+SNAPSHOT_CAPABILITY = "snapshot"
+SNAPSHOT_SECTIONS = {
+    ENDPOINT_INFO: "info",
+    ENDPOINT_REALTIME: "data",
+    ENDPOINT_ROI: "roi",
+    ENDPOINT_BATTERY_HEALTH: "battery-health",
+}
+
+
+# Streaming JSON array decoding (e.g. /api/energy rows).
+JSON_STREAM_CHUNK_SIZE = 64 * 1024
+# Upper bound for a single array element; protects against unbounded buffering on bad input.
+JSON_STREAM_MAX_ELEMENT_BYTES = 1024 * 1024
+
+
+class SunflowStreamNotSupported(Exception):
+    """Raised when the Sunflow server does not offer the realtime event stream."""
+
+
+class SunflowSnapshotNotSupported(Exception):
+    """Raised when the Sunflow server does not offer the bulk snapshot endpoint."""
+
+
+class SunflowCircuitOpen(Exception):
+    """Raised without a request while the circuit breaker considers the server down."""
 
 
 @dataclass
@@ -12,43 +116,688 @@ class SunflowSystemInfo:
     update_available: bool
     latest_version: str
     release_url: str | None = None
+    capabilities: tuple[str, ...] = ()
+
+
+def _as_number(value: Any) -> int | float | None:
+    # Keep ints as ints so states don't flip from "1234" to "1234.0".
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _section(data: dict[str, Any], key: str) -> dict[str, Any]:
+    # Missing, null or malformed nested objects read as empty.
+    value = data.get(key)
+    return value if isinstance(value, dict) else {}
+
+
+@dataclass(frozen=True, slots=True)
+class SunflowRealtime:
+    """Decoded /api/data payload.
+
+    Built once per payload by the coordinator; entities only read attributes.
+    """
+
+    pv_power: int | float | None = None
+    load_power: int | float | None = None
+    grid_power: int | float | None = None
+    # Convention (Sunflow UI): positive = discharging, negative = charging.
+    battery_power: float | None = None
+    battery_soc: int | float | None = None
+    battery_state: str | None = None
+    energy_today_production: int | float | None = None
+    autonomy: int | float | None = None
+    self_consumption: int | float | None = None
+
+    @classmethod
+    def from_payload(cls, data: dict[str, Any] | None) -> SunflowRealtime:
+        if data is None:
+            data = {}
+        elif not isinstance(data, dict):
+            raise ValueError(f"Expected a JSON object from /api/data, got {type(data).__name__}")
+        power = _section(data, "power")
+        battery = _section(data, "battery")
+        today = _section(_section(data, "energy"), "today")
+        battery_power = _as_number(power.get("battery"))
+        battery_state = battery.get("state")
+        return cls(
+            pv_power=_as_number(power.get("pv")),
+            load_power=_as_number(power.get("load")),
+            grid_power=_as_number(power.get("grid")),
+            battery_power=float(battery_power) if battery_power is not None else None,
+            battery_soc=_as_number(battery.get("soc")),
+            battery_state=str(battery_state) if battery_state is not None else None,
+            energy_today_production=_as_number(today.get("production")),
+            autonomy=_as_number(data.get("autonomy")),
+            self_consumption=_as_number(data.get("selfConsumption")),
+        )
+
+    @property
+    def battery_charge_power(self) -> float | None:
+        if self.battery_power is None:
+            return None
+        return abs(self.battery_power) if self.battery_power < 0 else 0
+
+    @property
+    def battery_discharge_power(self) -> float | None:
+        if self.battery_power is None:
+            return None
+        return self.battery_power if self.battery_power > 0 else 0
+
+
+@dataclass
+class SunflowSnapshot:
+    info: SunflowSystemInfo | None = None
+    realtime: dict[str, Any] | None = None
+    roi: dict[str, Any] | None = None
+    battery_health: dict[str, Any] | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the sections that were included, keyed by endpoint name."""
+        return {name: getattr(self, name) for name in SNAPSHOT_SECTIONS if getattr(self, name) is not None}
+
+
+def _parse_info(data: dict[str, Any]) -> SunflowSystemInfo:
+    capabilities = data.get("capabilities")
+    return SunflowSystemInfo(
+        version=str(data.get("version", "")),
+        update_available=bool(data.get("updateAvailable", False)),
+        latest_version=str(data.get("latestVersion", "")),
+        release_url=data.get("releaseUrl"),
+        capabilities=tuple(str(c) for c in capabilities) if isinstance(capabilities, list) else (),
+    )
+
+
+async def _iter_json_array(resp: ClientResponse) -> AsyncIterator[dict[str, Any]]:
+    """Yield the objects of a top-level JSON array without loading the whole body.
+
+    Only object elements are supported (which is all Sunflow's row endpoints return);
+    memory use is bounded by the chunk size plus the largest single element.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    buf = ""
+    started = False
+    finished = False
+
+    async for chunk in resp.content.iter_chunked(JSON_STREAM_CHUNK_SIZE):
+        buf += text_decoder.decode(chunk)
+        pos = 0
+        while not finished:
+            while pos < len(buf) and buf[pos] in " \t\r\n,":
+                pos += 1
+            if pos >= len(buf):
+                break
+            if not started:
+                if buf[pos] != "[":
+                    raise ValueError("Expected a JSON array")
+                started = True
+                pos += 1
+                continue
+            if buf[pos] == "]":
+                finished = True
+                break
+            try:
+                obj, pos = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                # Element continues in the next chunk.
+                break
+            if isinstance(obj, dict):
+                yield obj
+
+        buf = buf[pos:]
+        if finished:
+            return
+        if len(buf) > JSON_STREAM_MAX_ELEMENT_BYTES:
+            raise ValueError("JSON array element too large")
+
+    if not finished:
+        raise ValueError("Truncated JSON array")
+
+
+def _log_background_failure(task: asyncio.Task) -> None:
+    # Awaiting callers surface the error themselves; this keeps background refresh
+    # failures (stale value served) from being reported as "exception was never retrieved".
+    if not task.cancelled() and (err := task.exception()) is not None:
+        _LOGGER.debug("Refreshing Sunflow endpoint failed: %s", err)
+
+
+def _is_transient(err: BaseException) -> bool:
+    # ContentTypeError (HTML instead of JSON) and 4xx mean the server answered; don't retry those.
+    if isinstance(err, ClientResponseError):
+        return not isinstance(err, ContentTypeError) and err.status in RETRYABLE_STATUSES
+    return isinstance(err, (ClientConnectionError, ClientPayloadError, asyncio.TimeoutError))
+
+
+class RetryBudget:
+    """Token bucket that caps retries to a fraction of recent requests."""
+
+    __slots__ = ("_tokens",)
+
+    def __init__(self) -> None:
+        self._tokens = RETRY_BUDGET_MAX_TOKENS
+
+    def deposit(self) -> None:
+        self._tokens = min(self._tokens + RETRY_BUDGET_DEPOSIT, RETRY_BUDGET_MAX_TOKENS)
+
+    def try_withdraw(self) -> bool:
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+
+class CircuitBreaker:
+    """Closed -> open after repeated transient failures -> half-open probe -> closed.
+
+    The open period doubles (up to CIRCUIT_MAX_OPEN_SECONDS) each time a probe fails.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self) -> None:
+        self.state = self.CLOSED
+        self.opens = 0
+        self._failures = 0
+        self._opened_at = 0.0
+        self._open_seconds = float(CIRCUIT_OPEN_SECONDS)
+        self._probe_in_flight = False
+
+    def raise_if_open(self) -> None:
+        """Raise SunflowCircuitOpen unless the circuit is closed (for callers that never probe)."""
+        if self.state != self.CLOSED:
+            raise SunflowCircuitOpen("Sunflow unreachable, waiting for the server to recover")
+
+    def before_request(self) -> bool:
+        """Raise SunflowCircuitOpen unless a request may go out now.
+
+        Returns True when the caller is the half-open probe and must call release_probe().
+        """
+        if self.state == self.CLOSED:
+            return False
+        if self.state == self.OPEN:
+            remaining = self._opened_at + self._open_seconds - time.monotonic()
+            if remaining > 0:
+                raise SunflowCircuitOpen(f"Sunflow unreachable, retrying in {remaining:.0f} s")
+            self.state = self.HALF_OPEN
+        if self._probe_in_flight:
+            raise SunflowCircuitOpen("Sunflow unreachable, probe in progress")
+        self._probe_in_flight = True
+        return True
+
+    def release_probe(self) -> None:
+        self._probe_in_flight = False
+
+    def record_success(self) -> None:
+        self.state = self.CLOSED
+        self._failures = 0
+        self._open_seconds = float(CIRCUIT_OPEN_SECONDS)
+
+    def record_failure(self) -> None:
+        if self.state == self.HALF_OPEN:
+            self._open_seconds = min(self._open_seconds * 2, CIRCUIT_MAX_OPEN_SECONDS)
+            self._open()
+            return
+        self._failures += 1
+        if self.state == self.CLOSED and self._failures >= CIRCUIT_FAILURE_THRESHOLD:
+            self._open()
+
+    def _open(self) -> None:
+        self.state = self.OPEN
+        self.opens += 1
+        self._opened_at = time.monotonic()
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"state": self.state, "opens": self.opens, "consecutive_failures": self._failures}
+
+
+@dataclass
+class _InFlight:
+    task: asyncio.Task
+    waiters: int = 0
+
+
+@dataclass
+class _Validator:
+    etag: str | None
+    last_modified: str | None
+    value: Any
+
+
+@dataclass
+class _CacheEntry:
+    value: Any = None
+    has_value: bool = False
+    fetched_at: float = 0.0
+    failed_at: float | None = None
+    task: asyncio.Task | None = None
 
 
 class SunflowClient:
-    def __init__(self, session: ClientSession, base_url: str, admin_token: str | None = None) -> None:
+    def __init__(
+        self,
+        session: ClientSession,
+        base_url: str,
+        admin_token: str | None = None,
+        metrics: SunflowMetrics | None = None,
+    ) -> None:
         self._session = session
         self._base_url = base_url.rstrip("/")
         self._admin_token = admin_token
+        self._cache: dict[str, _CacheEntry] = {}
+        self._validators: dict[str, _Validator] = {}
+        self._snapshot_supported: bool | None = None
+        self.metrics = metrics or SunflowMetrics()
+        self.circuit_breaker = CircuitBreaker()
+        self._retry_budget = RetryBudget()
+        # Single-flight: concurrent GETs of the same path share one request.
+        self._inflight: dict[str, _InFlight] = {}
+        self._fetchers: dict[str, Callable[[], Awaitable[Any]]] = {
+            ENDPOINT_INFO: self.get_info,
+            ENDPOINT_REALTIME: self.get_realtime,
+            ENDPOINT_ROI: self.get_roi,
+            ENDPOINT_BATTERY_HEALTH: self.get_battery_health,
+            ENDPOINT_FORECAST: self.get_forecast,
+            ENDPOINT_TARIFF_COMPARE: self.get_tariff_compare,
+        }
+
+    @property
+    def base_url(self) -> str:
+        return self._base_url
+
+    @property
+    def admin_token(self) -> str | None:
+        return self._admin_token
+
+    def with_base_url(self, base_url: str) -> SunflowClient:
+        """A fresh client for another base URL, sharing this one's session and token."""
+        return SunflowClient(session=self._session, base_url=base_url, admin_token=self._admin_token)
+
+    def set_base_url(self, base_url: str) -> None:
+        """Point this client at a new base URL (e.g. the add-on moved), keeping cached values.
+
+        Requests already in flight are not cancelled (their callers, e.g. a running coordinator
+        refresh, would get a CancelledError); they finish or fail against the old URL, while
+        new requests start fresh against the new one.
+        """
+        self._base_url = base_url.rstrip("/")
+        # Validators and breaker state belong to the old server.
+        self._validators.clear()
+        self.circuit_breaker = CircuitBreaker()
+        # Forget in-flight requests so new calls don't join them.
+        self._inflight.clear()
 
     def _headers(self) -> dict[str, str]:
         if not self._admin_token:
             return {}
         return {"Authorization": f"Bearer {self._admin_token}"}
 
-    async def _get_json(self, path: str) -> Any:
-        url = f"{self._base_url}{path}"
-        async with self._session.get(url, headers=self._headers()) as resp:
-            resp.raise_for_status()
-            return await resp.json()
+    async def _get_json(self, path: str, proxied: bool = False) -> Any:
+        # proxied: the server answers by calling a third-party API (Solcast, aWATTar). An error
+        # status then says nothing about the Sunflow server itself, and retrying would spend
+        # upstream quota (Solcast allows ~10 calls a day), so only connection errors are retried.
+        inflight = self._inflight.get(path)
+        if inflight is None:
+            task = asyncio.create_task(self._get_json_with_retries(path, proxied))
+            task.add_done_callback(_log_background_failure)
+            inflight = self._inflight[path] = _InFlight(task)
+            task.add_done_callback(lambda t: self._inflight.pop(path, None) if inflight is self._inflight.get(path) else None)
+        else:
+            self.metrics.endpoint(path.partition("?")[0]).coalesced += 1
+
+        inflight.waiters += 1
+        try:
+            # Shielded so one caller giving up doesn't cancel the request for the others.
+            return await asyncio.shield(inflight.task)
+        finally:
+            inflight.waiters -= 1
+            if not inflight.waiters and not inflight.task.done():
+                # Nobody is waiting any more (e.g. every caller timed out).
+                inflight.task.cancel()
+
+    async def _get_json_with_retries(self, path: str, proxied: bool) -> Any:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + REQUEST_DEADLINE_SECONDS
+        self._retry_budget.deposit()
+        # Pinned to the server this request started against; set_base_url() swaps both.
+        base_url = self._base_url
+        breaker = self.circuit_breaker
+        attempt = 1
+        while True:
+            try:
+                probe = breaker.before_request()
+            except SunflowCircuitOpen:
+                self.metrics.endpoint(path.partition("?")[0]).circuit_rejections += 1
+                raise
+            try:
+                value = await self._get_json_once(base_url, path, deadline - loop.time())
+            except Exception as err:
+                if not _is_transient(err) or (proxied and isinstance(err, ClientResponseError)):
+                    # The server answered; it's up even if it didn't like the request.
+                    breaker.record_success()
+                    raise
+                breaker.record_failure()
+                delay = RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1) * random.uniform(0.5, 1.5)
+                if (
+                    attempt >= RETRY_MAX_ATTEMPTS
+                    or breaker.state != CircuitBreaker.CLOSED
+                    or loop.time() + delay >= deadline
+                    or not self._retry_budget.try_withdraw()
+                ):
+                    raise
+            else:
+                breaker.record_success()
+                return value
+            finally:
+                if probe:
+                    breaker.release_probe()
+
+            self.metrics.endpoint(path.partition("?")[0]).retries += 1
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def _get_json_once(self, base_url: str, path: str, budget: float) -> Any:
+        url = f"{base_url}{path}"
+        headers = self._headers()
+        # Metrics are keyed by path without the query string.
+        metrics_key = path.partition("?")[0]
+
+        # Conditional request: on 304 Not Modified reuse the previously parsed object,
+        # which also lets the coordinator cheaply detect "nothing changed".
+        validator = self._validators.get(path) if base_url == self._base_url else None
+        if validator is not None:
+            if validator.etag:
+                headers["If-None-Match"] = validator.etag
+            if validator.last_modified:
+                headers["If-Modified-Since"] = validator.last_modified
+
+        timeout = ClientTimeout(total=max(min(REQUEST_TIMEOUT_SECONDS, budget), 0.1))
+        started = time.perf_counter()
+        try:
+            async with self._session.get(url, headers=headers, timeout=timeout) as resp:
+                if resp.status == 304 and validator is not None:
+                    self.metrics.record_request(metrics_key, time.perf_counter() - started, None, None)
+                    return validator.value
+                resp.raise_for_status()
+                body = await resp.read()
+                received = time.perf_counter()
+                # Parses the body read above (and checks the content type).
+                value = await resp.json()
+                self.metrics.record_request(metrics_key, received - started, len(body), time.perf_counter() - received)
+        except Exception:
+            self.metrics.record_request_error(metrics_key)
+            raise
+
+        if base_url != self._base_url:
+            # The base URL changed meanwhile; validators from the old server don't apply.
+            return value
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._validators[path] = _Validator(etag=etag, last_modified=last_modified, value=value)
+        else:
+            self._validators.pop(path, None)
+        return value
 
     async def get_info(self) -> SunflowSystemInfo:
-        data = await self._get_json("/api/info")
-        return SunflowSystemInfo(
-            version=str(data.get("version", "")),
-            update_available=bool(data.get("updateAvailable", False)),
-            latest_version=str(data.get("latestVersion", "")),
-            release_url=data.get("releaseUrl"),
-        )
+        info = _parse_info(await self._get_json(ENDPOINT_PATHS[ENDPOINT_INFO]))
+        # Older add-on versions don't advertise capabilities; they get individual calls.
+        # Once a snapshot request has failed as unsupported, don't re-enable it.
+        if self._snapshot_supported is not False:
+            self._snapshot_supported = SNAPSHOT_CAPABILITY in info.capabilities or None
+        return info
 
     async def get_realtime(self) -> dict[str, Any]:
-        return await self._get_json("/api/data")
+        return await self._get_json(ENDPOINT_PATHS[ENDPOINT_REALTIME])
 
     async def get_roi(self) -> dict[str, Any]:
-        return await self._get_json("/api/roi")
+        return await self._get_json(ENDPOINT_PATHS[ENDPOINT_ROI])
 
     async def get_battery_health(self) -> dict[str, Any]:
-        return await self._get_json("/api/battery-health")
+        return await self._get_json(ENDPOINT_PATHS[ENDPOINT_BATTERY_HEALTH])
+
+    async def get_forecast(self) -> dict[str, Any]:
+        return await self._get_json(ENDPOINT_PATHS[ENDPOINT_FORECAST], proxied=True)
+
+    async def get_tariff_compare(self) -> dict[str, Any]:
+        return await self._get_json(ENDPOINT_PATHS[ENDPOINT_TARIFF_COMPARE], proxied=True)
+
+    async def async_iter_energy(self, start: str, end: str) -> AsyncIterator[dict[str, Any]]:
+        """Stream /api/energy rows between two local "YYYY-MM-DD HH:MM:SS" timestamps.
+
+        Keep ranges at or below 62 days; longer ranges are pre-aggregated per month by the server.
+        """
+        url = f"{self._base_url}/api/energy"
+        # Long transfers are never used as the half-open probe.
+        self.circuit_breaker.raise_if_open()
+        # Bodies can be large and arrive in pieces, so bound connect and per-read time rather than the total.
+        timeout = ClientTimeout(total=None, sock_connect=REQUEST_TIMEOUT_SECONDS, sock_read=REQUEST_TIMEOUT_SECONDS)
+        params = {"start": start, "end": end}
+        async with self._session.get(url, headers=self._headers(), params=params, timeout=timeout) as resp:
+            resp.raise_for_status()
+            async for row in _iter_json_array(resp):
+                yield row
+
+    async def get_energy_range(self, start: datetime, end: datetime, resolution: timedelta) -> EnergyBuckets:
+        """Downsample /api/energy between two naive local datetimes into `resolution` buckets.
+
+        Rows are streamed in windows of ENERGY_RANGE_WINDOW and folded into the buckets as
+        they arrive, so memory depends on the bucket count, not on the number of rows.
+        """
+        buckets = EnergyBuckets(start, end, resolution)
+        window_start = start
+        while window_start < end:
+            window_end = min(window_start + ENERGY_RANGE_WINDOW, end)
+            async for row in self.async_iter_energy(
+                window_start.strftime(SERVER_TIMESTAMP_FORMAT), window_end.strftime(SERVER_TIMESTAMP_FORMAT)
+            ):
+                ts = parse_server_timestamp(row.get("timestamp"))
+                flows = row_flows_w(row)
+                if ts is not None and flows is not None:
+                    buckets.add(ts, flows)
+            window_start = window_end
+        return buckets
+
+    async def get_snapshot(self, sections: Iterable[str]) -> SunflowSnapshot:
+        """Fetch several endpoints (by endpoint name) in a single request."""
+        names = [name for name in SNAPSHOT_SECTIONS if name in set(sections)]
+        query = ",".join(SNAPSHOT_SECTIONS[name] for name in names)
+        try:
+            payload = await self._get_json(f"{SNAPSHOT_PATH}?sections={query}")
+        except ContentTypeError as err:
+            # Unknown paths fall through to the SPA index.html on older servers.
+            raise SunflowSnapshotNotSupported(f"{SNAPSHOT_PATH} did not return JSON") from err
+        except ClientResponseError as err:
+            if err.status in (404, 405, 501):
+                raise SunflowSnapshotNotSupported(f"{SNAPSHOT_PATH} returned {err.status}") from err
+            raise
+
+        if not isinstance(payload, dict):
+            raise SunflowSnapshotNotSupported(f"{SNAPSHOT_PATH} returned an unexpected payload")
+
+        snapshot = SunflowSnapshot()
+        for name in names:
+            section = payload.get(SNAPSHOT_SECTIONS[name])
+            if not isinstance(section, dict):
+                raise SunflowSnapshotNotSupported(f"{SNAPSHOT_PATH} is missing section {SNAPSHOT_SECTIONS[name]}")
+            setattr(snapshot, name, _parse_info(section) if name == ENDPOINT_INFO else section)
+        return snapshot
 
     async def async_validate(self) -> SunflowSystemInfo:
         # A lightweight validation call for the config flow.
         return await self.get_info()
+
+    async def async_stream_realtime(self) -> AsyncIterator[dict[str, Any]]:
+        """Yield realtime frames pushed by the server until the stream ends.
+
+        Raises SunflowStreamNotSupported when the server has no stream endpoint (older
+        versions answer 404 or fall through to the SPA index.html).
+        """
+        url = f"{self._base_url}{STREAM_PATH}"
+        headers = {**self._headers(), "Accept": "text/event-stream"}
+        timeout = ClientTimeout(total=None, sock_connect=10, sock_read=STREAM_READ_TIMEOUT_SECONDS)
+
+        async with self._session.get(url, headers=headers, timeout=timeout) as resp:
+            if resp.status in (404, 405, 501):
+                raise SunflowStreamNotSupported(f"{url} returned {resp.status}")
+            resp.raise_for_status()
+            if resp.content_type != "text/event-stream":
+                raise SunflowStreamNotSupported(f"{url} returned {resp.content_type}")
+
+            event_type = "message"
+            data_lines: list[str] = []
+            async for raw_line in resp.content:
+                line = raw_line.decode("utf-8").rstrip("\r\n")
+
+                if not line:
+                    # A blank line dispatches the event.
+                    if data_lines and event_type in STREAM_EVENT_TYPES:
+                        try:
+                            frame = json.loads("\n".join(data_lines))
+                        except ValueError:
+                            frame = None
+                        if isinstance(frame, dict):
+                            yield frame
+                    event_type = "message"
+                    data_lines = []
+                    continue
+
+                if line.startswith(":"):
+                    # Comment / keep-alive.
+                    continue
+
+                field, _, value = line.partition(":")
+                if value.startswith(" "):
+                    value = value[1:]
+                if field == "data":
+                    data_lines.append(value)
+                elif field == "event":
+                    event_type = value or "message"
+
+    async def async_get_many(self, ttls: Mapping[str, float]) -> dict[str, Any]:
+        """Return the given endpoints, each cached for its own TTL (seconds).
+
+        Endpoints that are due and have no usable value yet (or a TTL of 0) are fetched
+        concurrently and awaited. Endpoints with a stale cached value are refreshed in the
+        background and the stale value is served until the refresh completes, so a tick
+        only waits for the slowest endpoint it actually needs.
+
+        When the server supports it, the due endpoints of this call that have a snapshot
+        section are fetched in one /api/snapshot request (see SNAPSHOT_SECTIONS).
+        """
+        now = time.monotonic()
+        awaited: dict[str, asyncio.Task] = {}
+        due: list[str] = []
+
+        for name, ttl in ttls.items():
+            entry = self._cache.setdefault(name, _CacheEntry())
+            if ttl > 0:
+                # TTL 0 means "always fetch" and is not counted as a cache lookup.
+                endpoint_metrics = self.metrics.endpoint(ENDPOINT_PATHS[name].partition("?")[0])
+                if not entry.has_value:
+                    endpoint_metrics.cache_misses += 1
+                elif not self._is_due(entry, ttl, now):
+                    endpoint_metrics.cache_hits += 1
+                    continue
+                else:
+                    endpoint_metrics.cache_stale_hits += 1
+            if entry.task is None:
+                due.append(name)
+
+        batched = [name for name in due if name in SNAPSHOT_SECTIONS] if self._snapshot_supported else []
+        if len(batched) > 1:
+            # One round trip for everything due that the snapshot covers.
+            task = asyncio.create_task(self._async_refresh_snapshot(batched))
+            task.add_done_callback(_log_background_failure)
+            for name in batched:
+                self._cache[name].task = task
+        for name in due:
+            if self._cache[name].task is None:
+                task = asyncio.create_task(self._async_refresh(name, self._cache[name]))
+                task.add_done_callback(_log_background_failure)
+                self._cache[name].task = task
+
+        for name, ttl in ttls.items():
+            entry = self._cache[name]
+            if entry.task is not None and (not entry.has_value or ttl <= 0):
+                awaited[name] = entry.task
+
+        if awaited:
+            results = await asyncio.gather(*awaited.values(), return_exceptions=True)
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+
+        return {name: self._cache[name].value for name in ttls}
+
+    @staticmethod
+    def _is_due(entry: _CacheEntry, ttl: float, now: float) -> bool:
+        if entry.failed_at is not None:
+            return (now - entry.failed_at) >= min(ttl, RETRY_AFTER_FAILURE_SECONDS)
+        return (now - entry.fetched_at) >= ttl
+
+    async def _async_refresh(self, name: str, entry: _CacheEntry) -> None:
+        try:
+            value = await self._fetchers[name]()
+        except Exception:
+            entry.failed_at = time.monotonic()
+            raise
+        else:
+            entry.value = value
+            entry.has_value = True
+            entry.fetched_at = time.monotonic()
+            entry.failed_at = None
+        finally:
+            entry.task = None
+
+    async def _async_refresh_snapshot(self, names: list[str]) -> None:
+        try:
+            snapshot = await self.get_snapshot(names)
+        except SunflowSnapshotNotSupported as err:
+            _LOGGER.debug("Sunflow snapshot not available, using individual requests: %s", err)
+            self._snapshot_supported = False
+            for name in names:
+                self._cache[name].task = None
+            results = await asyncio.gather(
+                *(self._async_refresh(name, self._cache[name]) for name in names),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            return
+        except Exception:
+            failed_at = time.monotonic()
+            for name in names:
+                self._cache[name].failed_at = failed_at
+            raise
+        finally:
+            for name in names:
+                if self._cache[name].task is asyncio.current_task():
+                    self._cache[name].task = None
+
+        fetched_at = time.monotonic()
+        for name, value in snapshot.as_dict().items():
+            entry = self._cache[name]
+            entry.value = value
+            entry.has_value = True
+            entry.fetched_at = fetched_at
+            entry.failed_at = None
+
+    def async_cancel_pending(self) -> None:
+        """Cancel background refreshes and requests still in flight (e.g. on unload)."""
+        for entry in self._cache.values():
+            if entry.task is not None:
+                entry.task.cancel()
+                entry.task = None
+        for inflight in list(self._inflight.values()):
+            inflight.task.cancel()
+        self._inflight.clear()
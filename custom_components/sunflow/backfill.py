@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+import logging
+from typing import Any
+
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import UnitOfEnergy
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .api import SunflowClient
+from .const import DOMAIN
+from .history import MAX_SAMPLE_GAP_SECONDS, SERVER_TIMESTAMP_FORMAT, parse_server_timestamp, row_flows_w
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+BACKFILL_INTERVAL = timedelta(hours=1)
+# Stay well below the server's 62-day limit, above which /api/energy aggregates per month.
+BACKFILL_WINDOW = timedelta(days=7)
+# How far back the very first run looks for history.
+BACKFILL_INITIAL_LOOKBACK = timedelta(days=3 * 365)
+# After an outage, fetch the missed window in one request when it fits (below the 62-day limit).
+CATCH_UP_MAX_WINDOW = timedelta(days=60)
+
+# Statistic key -> display name. Order matches history.ENERGY_FLOWS.
+ENERGY_STATISTICS: dict[str, str] = {
+    "pv_energy": "PV energy",
+    "load_energy": "Load energy",
+    "grid_import_energy": "Grid import energy",
+    "grid_export_energy": "Grid export energy",
+    "battery_charge_energy": "Battery charge energy",
+    "battery_discharge_energy": "Battery discharge energy",
+}
+
+
+def _floor_hour(ts: datetime) -> datetime:
+    return ts.replace(minute=0, second=0, microsecond=0)
+
+
+class HourlyEnergyAccumulator:
+    """Integrate power rows into per-hour energy (Wh).
+
+    Each row's power holds until the next row and is booked to the hour the interval
+    starts in. Only hours before the latest row are complete; memory is bounded by the
+    number of hours between flushes.
+    """
+
+    __slots__ = ("_hours", "_last_ts", "_last_flows")
+
+    def __init__(self) -> None:
+        self._hours: dict[datetime, list[float]] = {}
+        self._last_ts: datetime | None = None
+        self._last_flows: tuple[float, ...] | None = None
+
+    @property
+    def last_timestamp(self) -> datetime | None:
+        return self._last_ts
+
+    def add(self, ts: datetime, flows: tuple[float, ...]) -> None:
+        if self._last_ts is not None and self._last_flows is not None:
+            dt = (ts - self._last_ts).total_seconds()
+            if dt <= 0:
+                # Duplicate (window boundaries overlap) or out of order.
+                return
+            if dt <= MAX_SAMPLE_GAP_SECONDS:
+                bucket = self._hours.setdefault(_floor_hour(self._last_ts), [0.0] * len(flows))
+                for i, w in enumerate(self._last_flows):
+                    bucket[i] += w * dt / 3600
+
+        self._last_ts = ts
+        self._last_flows = flows
+
+    def pop_complete(self, before: datetime | None = None) -> list[tuple[datetime, list[float]]]:
+        """Remove and return (hour, Wh per flow) for all hours before `before`.
+
+        Defaults to the hour of the latest row, which later rows may still extend.
+        """
+        if before is None:
+            if self._last_ts is None:
+                return []
+            before = _floor_hour(self._last_ts)
+        complete = sorted(hour for hour in self._hours if hour < before)
+        return [(hour, self._hours.pop(hour)) for hour in complete]
+
+
+class SunflowHistoryBackfill:
+    """Import Sunflow's stored history into HA long-term statistics, incrementally.
+
+    Pages through /api/energy in bounded windows, streams the rows into hourly sums and
+    imports them as external statistics. A persisted high-water mark (start of the first
+    incomplete hour) and the running sums make each run fetch only new rows.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, client: SunflowClient) -> None:
+        self._hass = hass
+        self._entry = entry
+        self._client = client
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, f"{DOMAIN}.backfill.{entry.entry_id}")
+        self._state: dict[str, Any] | None = None
+        self._lock = asyncio.Lock()
+
+    def statistic_id(self, key: str) -> str:
+        return f"{DOMAIN}:{self._entry.entry_id.lower()}_{key}"
+
+    @property
+    def high_water_mark(self) -> datetime | None:
+        if self._state is None:
+            return None
+        return parse_server_timestamp(self._state.get("high_water_mark"))
+
+    async def async_run(self, *_: Any) -> None:
+        """Run one backfill pass; overlapping calls are skipped."""
+        await self._async_run_locked(BACKFILL_WINDOW)
+
+    async def async_catch_up(self) -> None:
+        """Fill the window missed while Sunflow was unreachable.
+
+        Resumes from the high-water mark, so the cost scales with the outage length. This
+        repairs the imported statistics; the energy sensors' own totals are filled by
+        SunflowDataUpdateCoordinator.async_fill_energy_gap.
+        """
+        await self._async_run_locked(CATCH_UP_MAX_WINDOW)
+
+    async def _async_run_locked(self, window: timedelta) -> None:
+        if self._lock.locked():
+            return
+        async with self._lock:
+            try:
+                await self._async_backfill(window)
+            except Exception as err:
+                # Progress up to the last completed window is kept; retry on the next pass.
+                _LOGGER.warning("Sunflow history backfill failed: %s", err)
+
+    async def _async_backfill(self, window: timedelta) -> None:
+        if self._state is None:
+            self._state = await self._store.async_load() or {}
+
+        # Server timestamps are naive local time; assume the add-on shares HA's time zone.
+        now = dt_util.now().replace(tzinfo=None)
+        start = self.high_water_mark or _floor_hour(now - BACKFILL_INITIAL_LOOKBACK)
+        sums: dict[str, float] = {key: float(v) for key, v in (self._state.get("sums") or {}).items()}
+
+        accumulator = HourlyEnergyAccumulator()
+        while start < now:
+            end = min(start + window, now)
+
+            async for row in self._client.async_iter_energy(
+                start.strftime(SERVER_TIMESTAMP_FORMAT), end.strftime(SERVER_TIMESTAMP_FORMAT)
+            ):
+                ts = parse_server_timestamp(row.get("timestamp"))
+                flows = row_flows_w(row)
+                if ts is not None and flows is not None:
+                    accumulator.add(ts, flows)
+
+            last_ts = accumulator.last_timestamp
+            if last_ts is None or (end - last_ts).total_seconds() > MAX_SAMPLE_GAP_SECONDS:
+                # No later row can extend the pending hour any more (no data yet, or an outage).
+                self._import_hours(accumulator.pop_complete(before=end), sums)
+                accumulator = HourlyEnergyAccumulator()
+                high_water_mark = _floor_hour(end)
+            else:
+                self._import_hours(accumulator.pop_complete(), sums)
+                high_water_mark = _floor_hour(last_ts)
+
+            self._state = {
+                "high_water_mark": high_water_mark.strftime(SERVER_TIMESTAMP_FORMAT),
+                "sums": sums,
+            }
+            await self._store.async_save(self._state)
+            start = end
+
+    def _import_hours(self, hours: list[tuple[datetime, list[float]]], sums: dict[str, float]) -> None:
+        if not hours:
+            return
+
+        series: dict[str, list[StatisticData]] = {key: [] for key in ENERGY_STATISTICS}
+        for hour, wh in hours:
+            start = dt_util.as_utc(hour.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE))
+            for i, key in enumerate(ENERGY_STATISTICS):
+                sums[key] = sums.get(key, 0.0) + wh[i] / 1000
+                series[key].append(StatisticData(start=start, state=wh[i] / 1000, sum=sums[key]))
+
+        for key, name in ENERGY_STATISTICS.items():
+            metadata = StatisticMetaData(
+                has_mean=False,
+                has_sum=True,
+                name=f"{self._entry.title} {name}",
+                source=DOMAIN,
+                statistic_id=self.statistic_id(key),
+                unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+            )
+            async_add_external_statistics(self._hass, metadata, series[key])
@@ -8,16 +8,40 @@ from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import SunflowClient
 from .const import (
+    CONF_ADAPTIVE_POLLING,
     CONF_ADMIN_TOKEN,
     CONF_BASE_URL,
+    CONF_FLIGHT_RECORDER_DUMP,
+    CONF_IMPORT_STATISTICS,
+    CONF_MAX_SCAN_INTERVAL_SECONDS,
+    CONF_MIN_SCAN_INTERVAL_SECONDS,
+    CONF_PUBLISH_DEADBAND_PERCENT,
+    CONF_PUBLISH_DEADBAND_W,
+    CONF_PUBLISH_HEARTBEAT_SECONDS,
+    CONF_PUBLISH_MIN_INTERVAL_SECONDS,
+    CONF_PUSH_UPDATES,
     CONF_SCAN_INTERVAL_SECONDS,
-    DEFAULT_LOCAL_ADDON_PORT,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_FLIGHT_RECORDER_DUMP,
+    DEFAULT_IMPORT_STATISTICS,
+    DEFAULT_MAX_SCAN_INTERVAL_SECONDS,
+    DEFAULT_MIN_SCAN_INTERVAL_SECONDS,
     DEFAULT_OPTIONS_SCAN_INTERVAL_SECONDS,
+    DEFAULT_PUBLISH_DEADBAND_PERCENT,
+    DEFAULT_PUBLISH_DEADBAND_W,
+    DEFAULT_PUBLISH_HEARTBEAT_SECONDS,
+    DEFAULT_PUBLISH_MIN_INTERVAL_SECONDS,
+    DEFAULT_PUSH_UPDATES,
     DEFAULT_SCAN_INTERVAL_SECONDS,
     DOMAIN,
+    MAX_SCAN_INTERVAL_CHOICES_SECONDS,
+    PUBLISH_DEADBAND_PERCENT_CHOICES,
+    PUBLISH_DEADBAND_W_CHOICES,
+    PUBLISH_HEARTBEAT_CHOICES_SECONDS,
+    PUBLISH_MIN_INTERVAL_CHOICES_SECONDS,
     SCAN_INTERVAL_CHOICES_SECONDS,
 )
-from .supervisor import async_get_addon_info, async_get_sunflow_addon_slug, async_is_supervised
+from .supervisor import async_discover_addon_base_url, async_get_sunflow_addon_slug, async_is_supervised
 
 
 class SunflowConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -89,69 +113,30 @@ class SunflowConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             else:
                 session = async_get_clientsession(self.hass)
 
-                # On HA OS / Supervised, add-ons are reachable from HA Core via Docker DNS.
-                # Unfortunately the exact hostname can vary between installations.
-                # Try a small set of known-good patterns.
-                slug_tail = addon_slug.split("_")[-1] if addon_slug else ""
-                candidates: list[str] = []
-
-                def _add_candidate(host: str) -> None:
-                    h = (host or "").strip()
-                    if not h:
-                        return
-                    url = f"http://{h}:{DEFAULT_LOCAL_ADDON_PORT}"
-                    if url not in candidates:
-                        candidates.append(url)
-
-                # Common patterns:
-                # - <full_slug>:3000 (e.g. a0d7b954_sunflow)
-                # - addon_<full_slug>:3000
-                # - <slug_tail>:3000 (e.g. sunflow)
-                # - addon_<slug_tail>:3000
-                _add_candidate(addon_slug)
-                _add_candidate(f"addon_{addon_slug}")
-                if slug_tail and slug_tail != addon_slug:
-                    _add_candidate(slug_tail)
-                    _add_candidate(f"addon_{slug_tail}")
-
-                # Fallback: use Supervisor info (IP address) when available.
-                try:
-                    addon_info = await async_get_addon_info(self.hass, addon_slug)
-                except Exception:
-                    addon_info = {}
-
-                ip_address = addon_info.get("ip_address")
-                if isinstance(ip_address, str) and ip_address.strip():
-                    _add_candidate(ip_address.strip())
-
-                last_exc: Exception | None = None
-                for base_url in candidates:
+                async def _probe(base_url: str):
                     client = SunflowClient(session=session, base_url=base_url, admin_token=admin_token)
-                    try:
-                        info = await client.async_validate()
-                    except Exception as e:
-                        last_exc = e
-                        # If the add-on is protected, surface the correct error.
-                        # (Currently /api/info is unprotected, but keep this for future-proofing.)
-                        status = getattr(e, "status", None)
-                        if status == 401:
-                            errors["base"] = "unauthorized"
-                            break
-                        continue
-                    else:
-                        title = user_input.get(CONF_NAME) or f"Sunflow ({info.version})"
-                        await self.async_set_unique_id(f"addon:{addon_slug}")
-                        self._abort_if_unique_id_configured()
-                        return self.async_create_entry(
-                            title=title,
-                            data={
-                                CONF_BASE_URL: base_url,
-                                CONF_ADMIN_TOKEN: admin_token or "",
-                            },
-                        )
-
-                if "base" not in errors:
-                    errors["base"] = "cannot_connect"
+                    return await client.async_validate()
+
+                # Candidates (Docker DNS names, Supervisor IP) are probed concurrently;
+                # the first one answering /api/info wins.
+                try:
+                    base_url, info = await async_discover_addon_base_url(self.hass, addon_slug, _probe)
+                except Exception as e:
+                    # If the add-on is protected, surface the correct error.
+                    # (Currently /api/info is unprotected, but keep this for future-proofing.)
+                    status = getattr(e, "status", None)
+                    errors["base"] = "unauthorized" if status == 401 else "cannot_connect"
+                else:
+                    title = user_input.get(CONF_NAME) or f"Sunflow ({info.version})"
+                    await self.async_set_unique_id(f"addon:{addon_slug}")
+                    self._abort_if_unique_id_configured()
+                    return self.async_create_entry(
+                        title=title,
+                        data={
+                            CONF_BASE_URL: base_url,
+                            CONF_ADMIN_TOKEN: admin_token or "",
+                        },
+                    )
 
         schema = vol.Schema(
             {
@@ -163,6 +148,12 @@ class SunflowConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return self.async_show_form(step_id="local_addon", data_schema=schema, errors=errors)
 
 
+def _choice(options, key: str, default: int, choices: list[int]) -> int:
+    # Fall back to the default if something stored a value that is no longer offered.
+    value = options.get(key, default)
+    return value if value in choices else default
+
+
 class SunflowOptionsFlow(config_entries.OptionsFlow):
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
         self._config_entry = config_entry
@@ -175,12 +166,78 @@ class SunflowOptionsFlow(config_entries.OptionsFlow):
         # Backwards compatibility: if something stored an unexpected value, fall back safely.
         if current not in SCAN_INTERVAL_CHOICES_SECONDS:
             current = DEFAULT_SCAN_INTERVAL_SECONDS
+
+        options = self._config_entry.options
+        current_min = options.get(CONF_MIN_SCAN_INTERVAL_SECONDS, DEFAULT_MIN_SCAN_INTERVAL_SECONDS)
+        if current_min not in SCAN_INTERVAL_CHOICES_SECONDS:
+            current_min = DEFAULT_MIN_SCAN_INTERVAL_SECONDS
+        current_max = options.get(CONF_MAX_SCAN_INTERVAL_SECONDS, DEFAULT_MAX_SCAN_INTERVAL_SECONDS)
+        if current_max not in MAX_SCAN_INTERVAL_CHOICES_SECONDS:
+            current_max = DEFAULT_MAX_SCAN_INTERVAL_SECONDS
+
         schema = vol.Schema(
             {
                 vol.Optional(
                     CONF_SCAN_INTERVAL_SECONDS,
                     default=current,
-                ): vol.In(SCAN_INTERVAL_CHOICES_SECONDS)
+                ): vol.In(SCAN_INTERVAL_CHOICES_SECONDS),
+                vol.Optional(
+                    CONF_ADAPTIVE_POLLING,
+                    default=bool(options.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING)),
+                ): bool,
+                vol.Optional(
+                    CONF_MIN_SCAN_INTERVAL_SECONDS,
+                    default=current_min,
+                ): vol.In(SCAN_INTERVAL_CHOICES_SECONDS),
+                vol.Optional(
+                    CONF_MAX_SCAN_INTERVAL_SECONDS,
+                    default=current_max,
+                ): vol.In(MAX_SCAN_INTERVAL_CHOICES_SECONDS),
+                vol.Optional(
+                    CONF_PUSH_UPDATES,
+                    default=bool(options.get(CONF_PUSH_UPDATES, DEFAULT_PUSH_UPDATES)),
+                ): bool,
+                vol.Optional(
+                    CONF_IMPORT_STATISTICS,
+                    default=bool(options.get(CONF_IMPORT_STATISTICS, DEFAULT_IMPORT_STATISTICS)),
+                ): bool,
+                vol.Optional(
+                    CONF_PUBLISH_DEADBAND_W,
+                    default=_choice(
+                        options, CONF_PUBLISH_DEADBAND_W, DEFAULT_PUBLISH_DEADBAND_W, PUBLISH_DEADBAND_W_CHOICES
+                    ),
+                ): vol.In(PUBLISH_DEADBAND_W_CHOICES),
+                vol.Optional(
+                    CONF_PUBLISH_DEADBAND_PERCENT,
+                    default=_choice(
+                        options,
+                        CONF_PUBLISH_DEADBAND_PERCENT,
+                        DEFAULT_PUBLISH_DEADBAND_PERCENT,
+                        PUBLISH_DEADBAND_PERCENT_CHOICES,
+                    ),
+                ): vol.In(PUBLISH_DEADBAND_PERCENT_CHOICES),
+                vol.Optional(
+                    CONF_PUBLISH_MIN_INTERVAL_SECONDS,
+                    default=_choice(
+                        options,
+                        CONF_PUBLISH_MIN_INTERVAL_SECONDS,
+                        DEFAULT_PUBLISH_MIN_INTERVAL_SECONDS,
+                        PUBLISH_MIN_INTERVAL_CHOICES_SECONDS,
+                    ),
+                ): vol.In(PUBLISH_MIN_INTERVAL_CHOICES_SECONDS),
+                vol.Optional(
+                    CONF_PUBLISH_HEARTBEAT_SECONDS,
+                    default=_choice(
+                        options,
+                        CONF_PUBLISH_HEARTBEAT_SECONDS,
+                        DEFAULT_PUBLISH_HEARTBEAT_SECONDS,
+                        PUBLISH_HEARTBEAT_CHOICES_SECONDS,
+                    ),
+                ): vol.In(PUBLISH_HEARTBEAT_CHOICES_SECONDS),
+                vol.Optional(
+                    CONF_FLIGHT_RECORDER_DUMP,
+                    default=bool(options.get(CONF_FLIGHT_RECORDER_DUMP, DEFAULT_FLIGHT_RECORDER_DUMP)),
+                ): bool,
             }
         )
         return self.async_show_form(step_id="init", data_schema=schema)
@@ -19,3 +19,48 @@ DEFAULT_LOCAL_ADDON_PORT = 3000
 
 # Add-on slug as defined in the add-on's config.yaml
 ADDON_SLUG = "sunflow"
+
+# Adaptive polling: back off while realtime values are steady (e.g. at night) and
+# tighten the interval during fast transients. The configured scan interval stays the baseline.
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+CONF_MIN_SCAN_INTERVAL_SECONDS = "min_scan_interval_seconds"
+CONF_MAX_SCAN_INTERVAL_SECONDS = "max_scan_interval_seconds"
+
+DEFAULT_ADAPTIVE_POLLING = False
+DEFAULT_MIN_SCAN_INTERVAL_SECONDS = 5
+DEFAULT_MAX_SCAN_INTERVAL_SECONDS = 120
+
+MAX_SCAN_INTERVAL_CHOICES_SECONDS = [30, 60, 120, 300, 600]
+
+# Push updates: subscribe to the server's realtime event stream and fall back to polling
+# when the server does not offer it.
+CONF_PUSH_UPDATES = "push_updates"
+DEFAULT_PUSH_UPDATES = True
+
+# Import Sunflow's stored history into Home Assistant long-term statistics (energy dashboard).
+CONF_IMPORT_STATISTICS = "import_statistics"
+DEFAULT_IMPORT_STATISTICS = False
+
+# State publishing policy for the realtime and energy sensors, to keep recorder growth down
+# while polling fast. A new value is written when it leaves the deadband (absolute W for power
+# sensors, or relative to the last written value), but not more often than the minimum
+# interval; the heartbeat writes the current value anyway once it has elapsed. 0 disables each.
+CONF_PUBLISH_DEADBAND_W = "publish_deadband_w"
+CONF_PUBLISH_DEADBAND_PERCENT = "publish_deadband_percent"
+CONF_PUBLISH_MIN_INTERVAL_SECONDS = "publish_min_interval_seconds"
+CONF_PUBLISH_HEARTBEAT_SECONDS = "publish_heartbeat_seconds"
+
+DEFAULT_PUBLISH_DEADBAND_W = 0
+DEFAULT_PUBLISH_DEADBAND_PERCENT = 0
+DEFAULT_PUBLISH_MIN_INTERVAL_SECONDS = 0
+DEFAULT_PUBLISH_HEARTBEAT_SECONDS = 300
+
+PUBLISH_DEADBAND_W_CHOICES = [0, 5, 10, 25, 50, 100]
+PUBLISH_DEADBAND_PERCENT_CHOICES = [0, 1, 2, 5, 10]
+PUBLISH_MIN_INTERVAL_CHOICES_SECONDS = [0, 5, 10, 30, 60]
+PUBLISH_HEARTBEAT_CHOICES_SECONDS = [60, 300, 600, 900]
+
+# Flight recorder (recent refreshes in diagnostics): on anomalies such as the battery SoC
+# dropping to 0, freeze a copy of the recording and log a warning.
+CONF_FLIGHT_RECORDER_DUMP = "flight_recorder_dump"
+DEFAULT_FLIGHT_RECORDER_DUMP = False
@@ -0,0 +1,578 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import logging
+import random
+import time
+from typing import Any
+
+from aiohttp import ClientError
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+
+from .api import (
+    ENDPOINT_BATTERY_HEALTH,
+    ENDPOINT_FORECAST,
+    ENDPOINT_INFO,
+    ENDPOINT_REALTIME,
+    ENDPOINT_ROI,
+    ENDPOINT_TARIFF_COMPARE,
+    SunflowCircuitOpen,
+    SunflowClient,
+    SunflowRealtime,
+    SunflowStreamNotSupported,
+)
+from .const import (
+    CONF_ADAPTIVE_POLLING,
+    CONF_FLIGHT_RECORDER_DUMP,
+    CONF_MAX_SCAN_INTERVAL_SECONDS,
+    CONF_MIN_SCAN_INTERVAL_SECONDS,
+    CONF_PUBLISH_DEADBAND_PERCENT,
+    CONF_PUBLISH_DEADBAND_W,
+    CONF_PUBLISH_HEARTBEAT_SECONDS,
+    CONF_PUBLISH_MIN_INTERVAL_SECONDS,
+    CONF_SCAN_INTERVAL_SECONDS,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_FLIGHT_RECORDER_DUMP,
+    DEFAULT_MAX_SCAN_INTERVAL_SECONDS,
+    DEFAULT_MIN_SCAN_INTERVAL_SECONDS,
+    DEFAULT_OPTIONS_SCAN_INTERVAL_SECONDS,
+    DEFAULT_PUBLISH_DEADBAND_PERCENT,
+    DEFAULT_PUBLISH_DEADBAND_W,
+    DEFAULT_PUBLISH_HEARTBEAT_SECONDS,
+    DEFAULT_PUBLISH_MIN_INTERVAL_SECONDS,
+    DEFAULT_SCAN_INTERVAL_SECONDS,
+)
+from .derived import SunflowDerived
+from .energy import MAX_INTEGRATION_GAP_SECONDS, EnergyIntegrator
+from .flight_recorder import STATUS_ERROR, STATUS_OK, STATUS_PUSH, FlightRecorder
+from .forecast import ForecastSeries
+from .rolling import RollingPowerStats
+
+_LOGGER = logging.getLogger(__name__)
+
+# Coordinator data keys, next to the raw endpoint payloads:
+# - decoded realtime snapshot (SunflowRealtime), built once per payload
+# - derived metrics (SunflowDerived), computed once per payload alongside it
+# Everything in coordinator.data is a function of the payloads, so always_update=False can
+# skip listener updates for an unchanged payload. The integrated energy totals change on
+# every tick and are therefore read from coordinator.energy instead.
+DATA_REALTIME_STATE = "realtime_state"
+DATA_DERIVED = "derived"
+# Forecast coordinator: the indexed forecast (ForecastSeries), built once per payload.
+DATA_FORECAST_SERIES = "forecast_series"
+
+# Info is relatively static, so avoid fetching it on every tick.
+INFO_TTL_SECONDS = 60 * 60
+
+# ROI, battery health and the monthly tariff comparison run full-history queries on the
+# server; they only change meaningfully per day, so they are refreshed on this interval
+# and after midnight.
+ANALYTICS_REFRESH_INTERVAL = timedelta(hours=6)
+ANALYTICS_ENDPOINTS = (ENDPOINT_ROI, ENDPOINT_BATTERY_HEALTH, ENDPOINT_TARIFF_COMPARE)
+
+# The server caches the Solcast forecast for 75 minutes (its daily quota allows ~10 calls),
+# so a new forecast can't show up more often than this.
+FORECAST_REFRESH_INTERVAL = timedelta(minutes=75)
+
+# Entities register what they need while the platform is added; wait this long so one
+# refresh covers all of them.
+WANT_REFRESH_DELAY_SECONDS = 5
+
+# Adaptive polling thresholds (W).
+# Changes below STEADY_DELTA_W are treated as jitter; at night (PV == 0) a wider band applies.
+STEADY_DELTA_W = 25
+NIGHT_DELTA_W = 100
+# Grid import spikes and large swings on any power flow are transients worth following closely.
+GRID_SPIKE_DELTA_W = 500
+TRANSIENT_DELTA_W = 1000
+
+# Failures to expect while Sunflow is down or misbehaving. They are raised as UpdateFailed,
+# so the coordinator logs one line per outage instead of a traceback on every refresh.
+EXPECTED_UPDATE_ERRORS = (ClientError, asyncio.TimeoutError, SunflowCircuitOpen, ValueError)
+
+# Longest outage whose energy is recovered into the integrated totals (one /api/energy window).
+ENERGY_GAP_MAX_WINDOW = timedelta(days=31)
+
+# Reconnect backoff for the push stream.
+PUSH_RECONNECT_MIN_SECONDS = 1
+PUSH_RECONNECT_MAX_SECONDS = 300
+
+_POWER_FIELDS = ("pv", "load", "grid", "battery")
+
+
+def _as_int(value: Any, default: int) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _power_sample(realtime: SunflowRealtime) -> dict[str, float]:
+    return {
+        "pv": float(realtime.pv_power or 0),
+        "load": float(realtime.load_power or 0),
+        "grid": float(realtime.grid_power or 0),
+        "battery": float(realtime.battery_power or 0),
+    }
+
+
+class AdaptivePollingPolicy:
+    """Choose the next polling interval from how much successive realtime payloads change.
+
+    - Battery state flips, grid import spikes and large swings snap to the floor.
+    - Steady values (or a quiet night with PV at 0) double the interval up to the ceiling.
+    - Anything in between drifts back towards the configured baseline.
+    """
+
+    def __init__(self, base_seconds: int, floor_seconds: int, ceiling_seconds: int) -> None:
+        # Keep floor <= base <= ceiling even if options were stored inconsistently.
+        self.base_seconds = base_seconds
+        self.floor_seconds = min(floor_seconds, base_seconds)
+        self.ceiling_seconds = max(ceiling_seconds, base_seconds)
+        self._interval = float(base_seconds)
+        self._last_sample: dict[str, float] | None = None
+        self._last_battery_state: str | None = None
+
+    @property
+    def interval_seconds(self) -> float:
+        return self._interval
+
+    def reset(self) -> None:
+        self._interval = float(self.base_seconds)
+        self._last_sample = None
+        self._last_battery_state = None
+
+    def update(self, realtime: SunflowRealtime) -> float:
+        sample = _power_sample(realtime)
+        battery_state = realtime.battery_state
+
+        prev = self._last_sample
+        prev_battery_state = self._last_battery_state
+        self._last_sample = sample
+        self._last_battery_state = battery_state
+
+        if prev is None:
+            self._interval = float(self.base_seconds)
+            return self._interval
+
+        deltas = {key: abs(sample[key] - prev[key]) for key in _POWER_FIELDS}
+        max_delta = max(deltas.values())
+        grid_import_rise = sample["grid"] - prev["grid"]
+
+        if (
+            (prev_battery_state is not None and battery_state != prev_battery_state)
+            or grid_import_rise >= GRID_SPIKE_DELTA_W
+            or max_delta >= TRANSIENT_DELTA_W
+        ):
+            self._interval = float(self.floor_seconds)
+        elif max_delta <= STEADY_DELTA_W or (sample["pv"] <= 0 and max_delta <= NIGHT_DELTA_W):
+            self._interval = min(self._interval * 2, float(self.ceiling_seconds))
+        elif self._interval > self.base_seconds:
+            self._interval = max(self._interval / 2, float(self.base_seconds))
+        else:
+            self._interval = min(self._interval * 1.5, float(self.base_seconds))
+
+        return self._interval
+
+
+@dataclass(frozen=True, slots=True)
+class PublishPolicy:
+    """Decide whether a sensor writes a new state on this tick (see CONF_PUBLISH_* options)."""
+
+    deadband_w: float = 0
+    deadband_percent: float = 0
+    min_interval_seconds: float = 0
+    heartbeat_seconds: float = 0
+
+    @classmethod
+    def from_options(cls, options: Mapping[str, Any]) -> PublishPolicy:
+        return cls(
+            deadband_w=_as_int(options.get(CONF_PUBLISH_DEADBAND_W), DEFAULT_PUBLISH_DEADBAND_W),
+            deadband_percent=_as_int(options.get(CONF_PUBLISH_DEADBAND_PERCENT), DEFAULT_PUBLISH_DEADBAND_PERCENT),
+            min_interval_seconds=_as_int(
+                options.get(CONF_PUBLISH_MIN_INTERVAL_SECONDS), DEFAULT_PUBLISH_MIN_INTERVAL_SECONDS
+            ),
+            heartbeat_seconds=_as_int(options.get(CONF_PUBLISH_HEARTBEAT_SECONDS), DEFAULT_PUBLISH_HEARTBEAT_SECONDS),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.deadband_w or self.deadband_percent or self.min_interval_seconds)
+
+    def should_publish(
+        self, previous: Any, value: Any, elapsed: float, *, absolute: bool = False, relative: bool = False
+    ) -> bool:
+        """`absolute`/`relative` select which deadbands apply to this sensor."""
+        if not isinstance(previous, (int, float)) or not isinstance(value, (int, float)):
+            # Always publish changes to or from unknown (and non-numeric states).
+            return previous != value
+        if self.heartbeat_seconds and elapsed >= self.heartbeat_seconds:
+            return True
+        if elapsed < self.min_interval_seconds:
+            return False
+        band = max(
+            self.deadband_w if absolute else 0,
+            abs(previous) * self.deadband_percent / 100 if relative else 0,
+        )
+        return abs(value - previous) > band if band else value != previous
+
+
+class SunflowDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, client: SunflowClient, base_url: str) -> None:
+        super().__init__(
+            hass,
+            logger=_LOGGER,
+            config_entry=entry,
+            name=f"Sunflow ({base_url})",
+            # Polling is driven by the domain-wide SunflowHub scheduler (see hub.py),
+            # which reads poll_interval; the coordinator's own timer stays off.
+            update_interval=None,
+            # Skip listener (entity state) updates when a refresh returns identical data.
+            always_update=False,
+        )
+
+        self.client = client
+        # When Sunflow last answered; used to detect recovery after an outage.
+        self.last_success_time: datetime | None = None
+        # True while data comes from the persisted snapshot (store.py), until Sunflow first answers.
+        self.restored = False
+        # (last success, recovery) of the latest outage, until async_fill_energy_gap() takes it.
+        self._energy_gap: tuple[datetime, datetime] | None = None
+        self._recovery_listeners: list[Callable[[], None]] = []
+        self._failure_listeners: list[Callable[[Exception], None]] = []
+        self.energy = EnergyIntegrator()
+        self.rolling = RollingPowerStats()
+        self.recorder = FlightRecorder()
+        self._decoded: tuple[Any, SunflowRealtime, SunflowDerived] | None = None
+        self._push_active = False
+        self.poll_interval = timedelta(seconds=DEFAULT_SCAN_INTERVAL_SECONDS)
+        self.adaptive_policy: AdaptivePollingPolicy | None = None
+        self.publish_policy = PublishPolicy()
+        self.async_apply_options(entry.options)
+
+    @callback
+    def async_apply_options(self, options: Mapping[str, Any]) -> None:
+        """(Re)configure polling, adaptive polling and state publishing from entry options."""
+        scan_interval_seconds = _as_int(
+            options.get(CONF_SCAN_INTERVAL_SECONDS, DEFAULT_OPTIONS_SCAN_INTERVAL_SECONDS),
+            DEFAULT_SCAN_INTERVAL_SECONDS,
+        )
+        self.poll_interval = timedelta(seconds=scan_interval_seconds)
+
+        self.adaptive_policy = None
+        if options.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING):
+            self.adaptive_policy = AdaptivePollingPolicy(
+                base_seconds=scan_interval_seconds,
+                floor_seconds=_as_int(options.get(CONF_MIN_SCAN_INTERVAL_SECONDS), DEFAULT_MIN_SCAN_INTERVAL_SECONDS),
+                ceiling_seconds=_as_int(options.get(CONF_MAX_SCAN_INTERVAL_SECONDS), DEFAULT_MAX_SCAN_INTERVAL_SECONDS),
+            )
+        self.publish_policy = PublishPolicy.from_options(options)
+        self.recorder.dump_on_anomaly = bool(options.get(CONF_FLIGHT_RECORDER_DUMP, DEFAULT_FLIGHT_RECORDER_DUMP))
+
+    @property
+    def push_active(self) -> bool:
+        """True while the push stream is delivering frames (polling is skipped)."""
+        return self._push_active
+
+    @callback
+    def async_add_recovery_listener(self, listener: Callable[[], None]) -> CALLBACK_TYPE:
+        """Call `listener` when a refresh succeeds after one or more failures."""
+        self._recovery_listeners.append(listener)
+
+        @callback
+        def _remove() -> None:
+            self._recovery_listeners.remove(listener)
+
+        return _remove
+
+    @callback
+    def async_add_failure_listener(self, listener: Callable[[Exception], None]) -> CALLBACK_TYPE:
+        """Call `listener` with the error each time a refresh fails."""
+        self._failure_listeners.append(listener)
+
+        @callback
+        def _remove() -> None:
+            self._failure_listeners.remove(listener)
+
+        return _remove
+
+    @callback
+    def async_restore(self, info: Any, realtime: Any) -> bool:
+        """Serve persisted info and realtime payloads until the first live refresh."""
+        if not isinstance(realtime, dict):
+            return False
+        # Energy totals are left out: they come from the energy sensors' own restored state.
+        self.data = {
+            ENDPOINT_INFO: info,
+            ENDPOINT_REALTIME: realtime,
+        }
+        self._decode_realtime(self.data, realtime)
+        self.restored = True
+        return True
+
+    @callback
+    def _async_mark_success(self) -> None:
+        previous = self.last_success_time
+        recovered = previous is not None and not self.last_update_success
+        self.last_success_time = dt_util.utcnow()
+        if recovered:
+            self._energy_gap = (previous, self.last_success_time)
+        if self.restored:
+            self.restored = False
+            # Entities drop their "restored" mark even if the live data equals the snapshot
+            # (always_update=False would skip that update).
+            self.async_update_listeners()
+        if recovered:
+            for listener in list(self._recovery_listeners):
+                listener()
+
+    async def async_fill_energy_gap(self) -> None:
+        """Add the energy Sunflow recorded during the latest outage to the integrated totals.
+
+        The integrator doesn't bridge gaps above MAX_INTEGRATION_GAP_SECONDS, so that window is
+        fetched from /api/energy instead, in one request sized by the outage length.
+        """
+        gap, self._energy_gap = self._energy_gap, None
+        if gap is None or (gap[1] - gap[0]).total_seconds() <= MAX_INTEGRATION_GAP_SECONDS:
+            # Short gaps were integrated across already.
+            return
+        # Server timestamps are naive local time; assume the add-on shares HA's time zone.
+        start, end = (dt_util.as_local(ts).replace(tzinfo=None) for ts in gap)
+        start = max(start, end - ENERGY_GAP_MAX_WINDOW)
+        try:
+            buckets = await self.client.get_energy_range(start, end, end - start)
+        except EXPECTED_UPDATE_ERRORS as err:
+            _LOGGER.debug("Fetching Sunflow energy for the outage window failed: %s", err)
+            return
+        self.energy.add_kwh(buckets.energy_kwh())
+        self.async_update_listeners()
+
+    def _decode_realtime(self, data: dict[str, Any], payload: dict[str, Any]) -> SunflowRealtime:
+        """Add the decoded snapshot and derived metrics for `payload` to `data`."""
+        # A 304 hands back the very same payload object; don't decode it again.
+        if self._decoded is None or self._decoded[0] is not payload:
+            state = SunflowRealtime.from_payload(payload)
+            self._decoded = (payload, state, SunflowDerived.from_realtime(state))
+        _, state, derived = self._decoded
+        data[DATA_REALTIME_STATE] = state
+        data[DATA_DERIVED] = derived
+        return state
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        started = time.monotonic()
+        # Compare against the interval this refresh was scheduled with, before adaptive polling changes it.
+        interval = self.poll_interval.total_seconds()
+        try:
+            data = await self.client.async_get_many(
+                {
+                    ENDPOINT_INFO: INFO_TTL_SECONDS,
+                    ENDPOINT_REALTIME: 0,
+                }
+            )
+            # Inside the try: a malformed payload (ValueError) fails the refresh like a bad response.
+            state = self._decode_realtime(data, data[ENDPOINT_REALTIME])
+        except Exception as err:
+            self.client.metrics.record_refresh(time.monotonic() - started, interval, success=False)
+            self.recorder.record(STATUS_ERROR, time.monotonic() - started, error=err)
+            self.energy.break_continuity()
+            # Don't sit on a long backed-off interval while the server is failing.
+            if self.adaptive_policy is not None:
+                self.adaptive_policy.reset()
+                self.poll_interval = timedelta(seconds=self.adaptive_policy.base_seconds)
+            for listener in list(self._failure_listeners):
+                listener(err)
+            if isinstance(err, EXPECTED_UPDATE_ERRORS):
+                raise UpdateFailed(f"Error communicating with Sunflow: {err}") from err
+            raise
+
+        duration = time.monotonic() - started
+        self.client.metrics.record_refresh(duration, interval, success=True)
+        # last_update_success still reflects the previous refresh at this point.
+        self._async_mark_success()
+        self.recorder.record(STATUS_OK, duration, data[ENDPOINT_REALTIME], state, interval=interval)
+        now = time.monotonic()
+        self.energy.add_sample(now, state)
+        self.rolling.add_sample(now, state)
+
+        if self.adaptive_policy is not None and not self._push_active:
+            # The hub schedules the next refresh after this returns,
+            # so the new interval applies right away.
+            self.poll_interval = timedelta(seconds=self.adaptive_policy.update(state))
+
+        return data
+
+    async def async_run_push(self) -> None:
+        """Feed pushed realtime frames into the coordinator, reconnecting with backoff.
+
+        Polling is suspended while frames arrive and resumes as soon as the stream drops.
+        Returns when the server has no stream endpoint, leaving the regular poll loop in charge.
+        """
+        backoff = PUSH_RECONNECT_MIN_SECONDS
+        while True:
+            try:
+                async for realtime in self.client.async_stream_realtime():
+                    backoff = PUSH_RECONNECT_MIN_SECONDS
+                    self._push_active = True
+
+                    data = {**(self.data or {}), ENDPOINT_REALTIME: realtime}
+                    try:
+                        # Info is cached by TTL, so this only hits the network when it is due.
+                        data.update(await self.client.async_get_many({ENDPOINT_INFO: INFO_TTL_SECONDS}))
+                    except EXPECTED_UPDATE_ERRORS as err:
+                        # Keep the previous info rather than dropping a healthy stream.
+                        _LOGGER.debug("Refreshing Sunflow info failed during push: %s", err)
+                    self._async_mark_success()
+                    state = self._decode_realtime(data, realtime)
+                    self.recorder.record(STATUS_PUSH, payload=realtime, realtime=state)
+                    now = time.monotonic()
+                    self.energy.add_sample(now, state)
+                    self.rolling.add_sample(now, state)
+                    if data != self.data:
+                        self.async_set_updated_data(data)
+            except SunflowStreamNotSupported as err:
+                _LOGGER.debug("Sunflow push stream not available, using polling: %s", err)
+                return
+            except asyncio.CancelledError:
+                # Push turned off or entry unloading; hand scheduling back to polling.
+                self._push_active = False
+                raise
+            except Exception as err:
+                _LOGGER.debug("Sunflow push stream disconnected: %s", err)
+
+            if self._push_active:
+                # The hub resumes polling on its next wakeup; refresh now to close the gap.
+                self._push_active = False
+                await self.async_request_refresh()
+
+            await asyncio.sleep(backoff * random.uniform(0.8, 1.2))
+            backoff = min(backoff * 2, PUSH_RECONNECT_MAX_SECONDS)
+
+
+class SunflowAnalyticsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    """Slow tier for the heavy analytics endpoints, separate from the realtime coordinator.
+
+    Only endpoints that an enabled entity asked for (async_want) are fetched. Each endpoint
+    is fetched on its own; a failing one keeps its previous value and only fails the refresh
+    when nothing could be fetched, so analytics never affect realtime data.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        client: SunflowClient,
+        base_url: str,
+        endpoints: tuple[str, ...] = ANALYTICS_ENDPOINTS,
+        update_interval: timedelta = ANALYTICS_REFRESH_INTERVAL,
+        label: str = "analytics",
+    ) -> None:
+        super().__init__(
+            hass,
+            logger=_LOGGER,
+            config_entry=entry,
+            name=f"Sunflow {label} ({base_url})",
+            update_interval=update_interval,
+            always_update=False,
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=WANT_REFRESH_DELAY_SECONDS, immediate=False
+            ),
+        )
+        self.client = client
+        self._endpoints = endpoints
+        self._wanted: dict[str, int] = {}
+
+    @callback
+    def async_want(self, endpoint: str) -> CALLBACK_TYPE:
+        """Fetch `endpoint` until the returned callback is called (one per enabled entity)."""
+        self._wanted[endpoint] = self._wanted.get(endpoint, 0) + 1
+        if endpoint not in (self.data or {}):
+            self.hass.async_create_task(self.async_request_refresh())
+
+        @callback
+        def _release() -> None:
+            self._wanted[endpoint] -= 1
+            if not self._wanted[endpoint]:
+                del self._wanted[endpoint]
+
+        return _release
+
+    @callback
+    def async_restore(self, data: Any) -> None:
+        """Serve persisted payloads right away; a live refresh follows in the background."""
+        if not isinstance(data, dict):
+            return
+        self.data = {name: data[name] for name in self._endpoints if isinstance(data.get(name), dict)}
+        self.hass.async_create_task(self.async_request_refresh())
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        names = [name for name in self._endpoints if name in self._wanted]
+        data = dict(self.data or {})
+        if not names:
+            return data
+
+        results = await asyncio.gather(
+            *(self.client.async_get_many({name: 0}) for name in names),
+            return_exceptions=True,
+        )
+        errors: list[BaseException] = []
+        for name, result in zip(names, results):
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+            if isinstance(result, BaseException):
+                _LOGGER.debug("Refreshing Sunflow %s failed: %s", name, result)
+                errors.append(result)
+            else:
+                data.update(result)
+
+        if len(errors) == len(names):
+            if isinstance(errors[0], EXPECTED_UPDATE_ERRORS):
+                raise UpdateFailed(f"Error fetching Sunflow {', '.join(names)}: {errors[0]}") from errors[0]
+            raise errors[0]
+        return data
+
+
+class SunflowForecastCoordinator(SunflowAnalyticsCoordinator):
+    """Fetches the PV forecast once per forecast update and indexes it (ForecastSeries).
+
+    Sensors evaluate the index on every realtime tick, so values like "expected PV in the
+    next hour" stay current without any extra requests.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, client: SunflowClient, base_url: str) -> None:
+        super().__init__(
+            hass,
+            entry,
+            client,
+            base_url,
+            endpoints=(ENDPOINT_FORECAST,),
+            update_interval=FORECAST_REFRESH_INTERVAL,
+            label="forecast",
+        )
+        self._indexed: tuple[Any, ForecastSeries] | None = None
+
+    @callback
+    def async_restore(self, data: Any) -> None:
+        super().async_restore(data)
+        if self.data:
+            self.data = self._index(self.data)
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        return self._index(await super()._async_update_data())
+
+    def _index(self, data: dict[str, Any]) -> dict[str, Any]:
+        payload = data.get(ENDPOINT_FORECAST)
+        if payload is None:
+            return data
+        # The server keeps answering with its cached forecast; only re-index a new one.
+        if self._indexed is None or self._indexed[0] != payload:
+            self._indexed = (payload, ForecastSeries.from_payload(payload))
+        data[DATA_FORECAST_SERIES] = self._indexed[1]
+        return data
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from .api import SunflowRealtime
+from .energy import power_flows_w
+
+
+def _ratio_percent(part: float, whole: float) -> float | None:
+    if whole <= 0:
+        return None
+    return round(min(max(part / whole, 0.0), 1.0) * 100, 1)
+
+
+@dataclass(frozen=True, slots=True)
+class SunflowDerived:
+    """Values derived from one realtime snapshot, computed once per payload.
+
+    Replaces the template sensors users would otherwise build on top of the power sensors.
+    """
+
+    grid_import_power: float | None = None
+    grid_export_power: float | None = None
+    # PV power not needed by the house right now (exported or charging the battery).
+    pv_surplus_power: float | None = None
+    # Load power not covered by PV (taken from the battery or the grid).
+    load_deficit_power: float | None = None
+    autonomy: float | None = None
+    self_consumption: float | None = None
+
+    @classmethod
+    def from_realtime(cls, realtime: SunflowRealtime) -> SunflowDerived:
+        if realtime.pv_power is None or realtime.load_power is None or realtime.grid_power is None:
+            return cls()
+        pv, grid_import, grid_export, _, _ = power_flows_w(realtime)
+        load = max(float(realtime.load_power), 0.0)
+
+        # Prefer the inverter's own ratios (/api/data); fall back to the power balance.
+        autonomy = realtime.autonomy
+        if autonomy is None:
+            autonomy = _ratio_percent(load - grid_import, load)
+        self_consumption = realtime.self_consumption
+        if self_consumption is None:
+            self_consumption = _ratio_percent(pv - grid_export, pv)
+
+        return cls(
+            grid_import_power=grid_import,
+            grid_export_power=grid_export,
+            pv_surplus_power=max(pv - load, 0.0),
+            load_deficit_power=max(load - pv, 0.0),
+            autonomy=autonomy,
+            self_consumption=self_consumption,
+        )
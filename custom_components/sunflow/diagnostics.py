@@ -4,7 +4,9 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
+from .api import ENDPOINT_FORECAST
 from .const import DOMAIN
+from .hub import DATA_HUB
 
 
 async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry):
@@ -20,6 +22,37 @@ async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigE
 
     if coordinator is not None:
         diag["last_update_success"] = coordinator.last_update_success
+        diag["restored"] = getattr(coordinator, "restored", False)
         diag["data"] = coordinator.data
+        energy = getattr(coordinator, "energy", None)
+        if energy is not None:
+            diag["energy_totals"] = energy.totals()
+        recorder = getattr(coordinator, "recorder", None)
+        if recorder is not None:
+            diag["flight_recorder"] = {**recorder.as_dict(), "incidents": list(recorder.incidents)}
+
+    analytics = data.get("analytics_coordinator")
+    if analytics is not None:
+        diag["analytics"] = analytics.data
+
+    forecast = data.get("forecast_coordinator")
+    if forecast is not None:
+        # The raw payload; the indexed series is derived from it.
+        diag["forecast"] = (forecast.data or {}).get(ENDPOINT_FORECAST)
+
+    client = data.get("client")
+    if client is not None:
+        diag["metrics"] = client.metrics.as_dict()
+        diag["circuit_breaker"] = client.circuit_breaker.as_dict()
+
+    addon_stats = data.get("addon_stats_coordinator")
+    if addon_stats is not None:
+        # Next to the client metrics, to correlate add-on load with request latency.
+        diag["addon_stats"] = addon_stats.data
+
+    hub = hass.data.get(DOMAIN, {}).get(DATA_HUB)
+    if hub is not None:
+        # Shared across all Sunflow entries.
+        diag["hub"] = hub.metrics.as_dict()
 
     return diag
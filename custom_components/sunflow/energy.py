@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from array import array
+
+from .api import SunflowRealtime
+
+# Energy flows integrated from realtime power, in this order.
+ENERGY_FLOWS = ("pv", "grid_import", "grid_export", "battery_charge", "battery_discharge")
+
+# Don't integrate across gaps longer than this (outages, HA restarts).
+# Must stay above the largest adaptive polling interval.
+MAX_INTEGRATION_GAP_SECONDS = 15 * 60
+
+
+def power_flows_w(realtime: SunflowRealtime) -> tuple[float, ...]:
+    """Split realtime power values into non-negative flows (W), ordered like ENERGY_FLOWS."""
+    pv = float(realtime.pv_power or 0)
+    grid = float(realtime.grid_power or 0)
+    battery = float(realtime.battery_power or 0)
+    # Sunflow convention: grid positive = import, battery positive = discharging.
+    return (
+        max(pv, 0.0),
+        max(grid, 0.0),
+        max(-grid, 0.0),
+        max(-battery, 0.0),
+        max(battery, 0.0),
+    )
+
+
+class EnergyIntegrator:
+    """Trapezoidal power -> energy integration for all flows at once.
+
+    Trapezoidal integration only needs the previous sample, so the state is one
+    timestamp plus fixed-size float arrays; nothing grows with uptime.
+    """
+
+    __slots__ = ("_totals_kwh", "_last_flows", "_last_ts", "_restored")
+
+    def __init__(self) -> None:
+        self._totals_kwh = array("d", [0.0] * len(ENERGY_FLOWS))
+        self._last_flows = array("d", [0.0] * len(ENERGY_FLOWS))
+        self._last_ts: float | None = None
+        self._restored: set[str] = set()
+
+    def add_sample(self, ts: float, realtime: SunflowRealtime) -> None:
+        flows = power_flows_w(realtime)
+        if self._last_ts is not None:
+            dt = ts - self._last_ts
+            if dt <= 0:
+                return
+            if dt <= MAX_INTEGRATION_GAP_SECONDS:
+                hours = dt / 3600
+                for i, w in enumerate(flows):
+                    self._totals_kwh[i] += (self._last_flows[i] + w) / 2 * hours / 1000
+
+        self._last_ts = ts
+        for i, w in enumerate(flows):
+            self._last_flows[i] = w
+
+    def break_continuity(self) -> None:
+        """Start a new segment; the interval up to the next sample is not integrated."""
+        self._last_ts = None
+
+    def restore(self, flow: str, total_kwh: float) -> None:
+        """Add the total persisted before a restart (once per flow)."""
+        if flow in self._restored:
+            return
+        self._restored.add(flow)
+        self._totals_kwh[ENERGY_FLOWS.index(flow)] += total_kwh
+
+    def add_kwh(self, totals: dict[str, float]) -> None:
+        """Add energy measured elsewhere, e.g. Sunflow's record of a window that wasn't integrated."""
+        for i, flow in enumerate(ENERGY_FLOWS):
+            self._totals_kwh[i] += max(totals.get(flow, 0.0), 0.0)
+
+    def total_kwh(self, flow: str) -> float:
+        return self._totals_kwh[ENERGY_FLOWS.index(flow)]
+
+    def totals(self) -> dict[str, float]:
+        # Rounded to Wh so float noise doesn't count as a change.
+        return {flow: round(self._totals_kwh[i], 3) for i, flow in enumerate(ENERGY_FLOWS)}
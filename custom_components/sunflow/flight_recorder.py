@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+import logging
+import time
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .api import SunflowRealtime
+
+_LOGGER = logging.getLogger(__name__)
+
+# Refreshes (and pushed frames) kept; the oldest fall off, so memory stays bounded.
+FLIGHT_RECORDER_SIZE = 64
+# Recordings frozen on anomaly detection (see FlightRecorder.dump_on_anomaly).
+FLIGHT_RECORDER_INCIDENTS = 3
+# At most one dump per cooldown, so a flapping server doesn't flood the log.
+FLIGHT_RECORDER_DUMP_COOLDOWN_SECONDS = 600
+# Error messages are cut to this length.
+MAX_ERROR_LENGTH = 200
+
+# A state of charge at or above this that reads 0 on the next payload is treated as a glitch
+# (/api/data falls back to defaults when the inverter times out).
+SOC_GLITCH_MIN_PERCENT = 10
+
+STATUS_OK = "ok"
+STATUS_PUSH = "push"
+STATUS_ERROR = "error"
+
+
+def _flatten(payload: Any, prefix: str = "", out: dict[str, Any] | None = None) -> dict[str, Any]:
+    """Nested dicts as {"power.pv": ...}; lists and scalars are leaves."""
+    if out is None:
+        out = {}
+    if isinstance(payload, dict):
+        for key, value in payload.items():
+            path = f"{prefix}.{key}" if prefix else str(key)
+            if isinstance(value, dict) and value:
+                _flatten(value, path, out)
+            else:
+                out[path] = value
+    elif payload is not None:
+        out[prefix or "."] = payload
+    return out
+
+
+@dataclass(slots=True)
+class _Frame:
+    time: float
+    status: str
+    latency: float | None
+    error: str | None
+    # Leaves that changed or appeared since the previous frame, and leaves that disappeared.
+    changed: dict[str, Any]
+    removed: tuple[str, ...]
+
+    def as_dict(self) -> dict[str, Any]:
+        result: dict[str, Any] = {
+            "time": dt_util.utc_from_timestamp(self.time).isoformat(),
+            "status": self.status,
+            "latency_ms": round(self.latency * 1000, 1) if self.latency is not None else None,
+        }
+        if self.error is not None:
+            result["error"] = self.error
+        if self.changed:
+            result["changed"] = self.changed
+        if self.removed:
+            result["removed"] = list(self.removed)
+        return result
+
+
+class FlightRecorder:
+    """The last FLIGHT_RECORDER_SIZE realtime refreshes, for diagnostics.
+
+    Each frame keeps its time, latency, status and the realtime payload delta-encoded against
+    the previous frame (only the leaves that changed). The payload as of just before the
+    oldest frame is kept as the base; evicted frames are folded into it. Memory is bounded by
+    the frame count and the payload size, independent of uptime.
+
+    With dump_on_anomaly set, a SoC that drops to 0, a failing refresh after a success, or a
+    refresh slower than its polling interval freezes a copy of the recording into `incidents`
+    (bounded as well) and logs a warning.
+    """
+
+    __slots__ = ("_frames", "_base", "_last", "_last_status", "_last_soc", "_last_dump", "dump_on_anomaly", "incidents")
+
+    def __init__(self) -> None:
+        self._frames: deque[_Frame] = deque()
+        self._base: dict[str, Any] = {}
+        # Flattened payload of the newest frame.
+        self._last: dict[str, Any] = {}
+        self._last_status: str | None = None
+        self._last_soc: float | None = None
+        self._last_dump: float | None = None
+        self.dump_on_anomaly = False
+        self.incidents: deque[dict[str, Any]] = deque(maxlen=FLIGHT_RECORDER_INCIDENTS)
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def record(
+        self,
+        status: str,
+        latency: float | None = None,
+        payload: dict[str, Any] | None = None,
+        realtime: SunflowRealtime | None = None,
+        error: BaseException | None = None,
+        interval: float | None = None,
+    ) -> None:
+        """Append a frame; `payload` is the raw /api/data payload (None on errors)."""
+        changed: dict[str, Any] = {}
+        removed: tuple[str, ...] = ()
+        if payload is not None:
+            current = _flatten(payload)
+            previous = self._last
+            changed = {key: value for key, value in current.items() if key not in previous or previous[key] != value}
+            removed = tuple(key for key in previous if key not in current)
+            self._last = current
+
+        if len(self._frames) == FLIGHT_RECORDER_SIZE:
+            self._fold(self._frames.popleft())
+        self._frames.append(
+            _Frame(
+                time=time.time(),
+                status=status,
+                latency=latency,
+                error=str(error)[:MAX_ERROR_LENGTH] if error is not None else None,
+                changed=changed,
+                removed=removed,
+            )
+        )
+
+        reason = self._anomaly(status, latency, realtime, interval)
+        self._last_status = status
+        if realtime is not None:
+            self._last_soc = realtime.battery_soc
+        if reason is not None and self.dump_on_anomaly:
+            self._dump(reason)
+
+    def _fold(self, frame: _Frame) -> None:
+        for key in frame.removed:
+            self._base.pop(key, None)
+        self._base.update(frame.changed)
+
+    def _anomaly(
+        self,
+        status: str,
+        latency: float | None,
+        realtime: SunflowRealtime | None,
+        interval: float | None,
+    ) -> str | None:
+        if status == STATUS_ERROR:
+            # Only the first failure of a streak.
+            return "refresh failed" if self._last_status not in (None, STATUS_ERROR) else None
+        if (
+            realtime is not None
+            and realtime.battery_soc == 0
+            and self._last_soc is not None
+            and self._last_soc >= SOC_GLITCH_MIN_PERCENT
+        ):
+            return f"battery SoC dropped from {self._last_soc} to 0"
+        if latency is not None and interval and latency > interval:
+            return f"refresh took {latency:.1f} s (interval {interval:.0f} s)"
+        return None
+
+    def _dump(self, reason: str) -> None:
+        now = time.monotonic()
+        if self._last_dump is not None and now - self._last_dump < FLIGHT_RECORDER_DUMP_COOLDOWN_SECONDS:
+            return
+        self._last_dump = now
+        self.incidents.append({"reason": reason, "time": dt_util.utcnow().isoformat(), **self.as_dict()})
+        _LOGGER.warning(
+            "Sunflow anomaly (%s); the last %s refreshes are in the diagnostics download", reason, len(self._frames)
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """The base payload (flattened) and the frames, oldest first."""
+        return {
+            "base": dict(self._base),
+            "frames": [frame.as_dict() for frame in self._frames],
+        }
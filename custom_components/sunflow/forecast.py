@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta, timezone
+import re
+from typing import Any
+
+# Solcast reports one average power value (kW) per period, identified by its end.
+DEFAULT_PERIOD = timedelta(minutes=30)
+_PERIOD_RE = re.compile(r"^PT(?:(\d+)H)?(?:(\d+)M)?$")
+
+
+def _parse_period(value: Any) -> timedelta:
+    match = _PERIOD_RE.match(value) if isinstance(value, str) else None
+    if match is None or not any(match.groups()):
+        return DEFAULT_PERIOD
+    hours, minutes = (int(group or 0) for group in match.groups())
+    return timedelta(hours=hours, minutes=minutes)
+
+
+def _parse_end(value: Any) -> datetime | None:
+    if not isinstance(value, str):
+        return None
+    try:
+        # Solcast uses 7 fractional digits, which fromisoformat refuses; they're always zero.
+        parsed = datetime.fromisoformat(re.sub(r"\.\d+", "", value))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+class ForecastSeries:
+    """PV forecast (/api/forecast) indexed for cheap lookups on every tick.
+
+    Built once per fetched payload. Periods are kept sorted by start as epoch seconds,
+    with a running energy total, so point and range queries are a bisect plus a subtraction
+    instead of a scan over the whole horizon.
+    """
+
+    __slots__ = ("_starts", "_ends", "_kw", "_cumulative_kwh")
+
+    def __init__(self, periods: list[tuple[float, float, float]]) -> None:
+        periods.sort()
+        self._starts = array("d", (start for start, _, _ in periods))
+        self._ends = array("d", (end for _, end, _ in periods))
+        self._kw = array("d", (kw for _, _, kw in periods))
+        # Energy of all periods before index i.
+        self._cumulative_kwh = array("d", [0.0])
+        for start, end, kw in periods:
+            self._cumulative_kwh.append(self._cumulative_kwh[-1] + kw * (end - start) / 3600)
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any] | None) -> ForecastSeries:
+        periods: list[tuple[float, float, float]] = []
+        for item in (payload or {}).get("forecasts") or ():
+            if not isinstance(item, dict):
+                continue
+            end = _parse_end(item.get("period_end"))
+            try:
+                kw = max(float(item.get("pv_estimate")), 0.0)
+            except (TypeError, ValueError):
+                continue
+            if end is None:
+                continue
+            start = end - _parse_period(item.get("period"))
+            periods.append((start.timestamp(), end.timestamp(), kw))
+        return cls(periods)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    @property
+    def horizon_end(self) -> float | None:
+        return self._ends[-1] if self._ends else None
+
+    def _energy_until(self, ts: float) -> float:
+        i = bisect_right(self._starts, ts) - 1
+        if i < 0:
+            return 0.0
+        covered = min(ts, self._ends[i]) - self._starts[i]
+        return self._cumulative_kwh[i] + self._kw[i] * covered / 3600
+
+    def power_kw(self, ts: float) -> float | None:
+        """Forecast power at `ts`; None outside the forecast horizon."""
+        i = bisect_right(self._starts, ts) - 1
+        if i < 0 or ts >= self._ends[i]:
+            return None
+        return self._kw[i]
+
+    def energy_kwh(self, start: float, end: float) -> float | None:
+        """Forecast energy between two timestamps; None when the range lies past the horizon."""
+        if not self._starts or start >= self._ends[-1] or end <= start:
+            return None
+        return self._energy_until(end) - self._energy_until(start)
+
+    def best_window(self, start: float, end: float, length: float) -> tuple[float, float] | None:
+        """The `length`-second window within [start, end] with the most forecast energy.
+
+        Returns (window start, kWh); the earliest one on ties. The window energy is piecewise
+        linear in its start, with breaks where either window edge crosses a period boundary,
+        so the optimum is at `start`, the latest possible start, a boundary, or a boundary
+        minus `length`.
+        """
+        latest = min(end, self.horizon_end or start) - length
+        if latest < start:
+            return None
+        candidates = {start, latest}
+        for boundaries in (self._starts, self._ends):
+            # Window start on a boundary ...
+            candidates.update(boundaries[bisect_left(boundaries, start) : bisect_right(boundaries, latest)])
+            # ... or window end on a boundary.
+            candidates.update(
+                boundary - length
+                for boundary in boundaries[
+                    bisect_left(boundaries, start + length) : bisect_right(boundaries, latest + length)
+                ]
+            )
+        best_start, best_kwh = start, -1.0
+        for candidate in sorted(candidates):
+            kwh = self._energy_until(candidate + length) - self._energy_until(candidate)
+            if kwh > best_kwh:
+                best_start, best_kwh = candidate, kwh
+        return best_start, best_kwh
+
+    def hourly(self, start: datetime, hours: int) -> list[dict[str, Any]]:
+        """Forecast energy per hour from `start`, for automations and charts."""
+        result: list[dict[str, Any]] = []
+        for hour in range(hours):
+            bucket_start = start + timedelta(hours=hour)
+            kwh = self.energy_kwh(bucket_start.timestamp(), (bucket_start + timedelta(hours=1)).timestamp())
+            if kwh is None:
+                break
+            result.append({"start": bucket_start.isoformat(), "energy": round(kwh, 3)})
+        return result
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from array import array
+from datetime import datetime, timedelta
+import math
+from typing import Any
+
+# /api/energy rows carry naive local timestamps in this format.
+SERVER_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# A row's power is assumed to hold until the next row, but not across gaps longer than this.
+# Archived energy_data rows are hourly (Wh per hour == average W), live energy_log rows are ~1/min.
+MAX_SAMPLE_GAP_SECONDS = 3600
+
+# Order of the values returned by row_flows_w().
+ENERGY_FLOWS = ("pv", "load", "grid_import", "grid_export", "battery_charge", "battery_discharge")
+
+
+def parse_server_timestamp(value: Any) -> datetime | None:
+    try:
+        return datetime.strptime(str(value)[:19].replace("T", " "), SERVER_TIMESTAMP_FORMAT)
+    except ValueError:
+        return None
+
+
+def row_flows_w(row: dict[str, Any]) -> tuple[float, ...] | None:
+    """Split an /api/energy row into non-negative power per flow (W), in ENERGY_FLOWS order."""
+    # Sunflow convention: grid positive = import, battery positive = discharging.
+    try:
+        pv = float(row.get("production") or 0)
+        load = float(row.get("consumption") or 0)
+        grid = float(row.get("grid") or 0)
+        battery = float(row.get("battery") or 0)
+    except (TypeError, ValueError):
+        return None
+    return (
+        max(pv, 0.0),
+        max(load, 0.0),
+        max(grid, 0.0),
+        max(-grid, 0.0),
+        max(-battery, 0.0),
+        max(battery, 0.0),
+    )
+
+
+class EnergyBuckets:
+    """Downsample a stream of power rows into fixed-width time buckets.
+
+    Each row's power holds until the next row (up to MAX_SAMPLE_GAP_SECONDS) and is split
+    across the buckets that interval overlaps. Energy and covered seconds live in flat
+    float arrays sized by the bucket count, so memory does not grow with the number of rows.
+    """
+
+    __slots__ = ("_start", "_step", "_count", "_wh", "_seconds", "_last_ts", "_last_flows")
+
+    def __init__(self, start: datetime, end: datetime, resolution: timedelta) -> None:
+        self._start = start
+        self._step = resolution.total_seconds()
+        self._count = max(math.ceil((end - start).total_seconds() / self._step), 0)
+        self._wh = array("d", bytes(8 * self._count * len(ENERGY_FLOWS)))
+        self._seconds = array("d", bytes(8 * self._count))
+        self._last_ts: datetime | None = None
+        self._last_flows: tuple[float, ...] | None = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, ts: datetime, flows: tuple[float, ...]) -> None:
+        if self._last_ts is not None and self._last_flows is not None:
+            dt = (ts - self._last_ts).total_seconds()
+            if dt <= 0:
+                # Duplicate (window boundaries overlap) or out of order.
+                return
+            if dt <= MAX_SAMPLE_GAP_SECONDS:
+                self._spread(self._last_ts, ts, self._last_flows)
+
+        self._last_ts = ts
+        self._last_flows = flows
+
+    def _spread(self, begin: datetime, end: datetime, flows: tuple[float, ...]) -> None:
+        # Offsets in seconds from the first bucket, clipped to the covered range.
+        pos = max((begin - self._start).total_seconds(), 0.0)
+        stop = min((end - self._start).total_seconds(), self._count * self._step)
+        width = len(flows)
+        while pos < stop:
+            i = int(pos // self._step)
+            seg_end = min(stop, (i + 1) * self._step)
+            seconds = seg_end - pos
+            self._seconds[i] += seconds
+            base = i * width
+            for k, w in enumerate(flows):
+                self._wh[base + k] += w * seconds / 3600
+            pos = seg_end
+
+    def as_rows(self) -> list[dict[str, Any]]:
+        """One row per bucket: its start and the average power (W) per flow.
+
+        Buckets without any covered time have None values, so the series stays evenly spaced.
+        """
+        width = len(ENERGY_FLOWS)
+        rows: list[dict[str, Any]] = []
+        for i in range(self._count):
+            row: dict[str, Any] = {"start": self._start + timedelta(seconds=i * self._step)}
+            seconds = self._seconds[i]
+            for k, flow in enumerate(ENERGY_FLOWS):
+                row[flow] = round(self._wh[i * width + k] * 3600 / seconds, 1) if seconds else None
+            rows.append(row)
+        return rows
+
+    def energy_kwh(self) -> dict[str, float]:
+        """Total energy per flow over all buckets."""
+        width = len(ENERGY_FLOWS)
+        return {flow: round(sum(self._wh[k::width]) / 1000, 3) for k, flow in enumerate(ENERGY_FLOWS)}
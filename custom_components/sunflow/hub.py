@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from datetime import datetime
+import random
+import time
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import ClientSession, TCPConnector
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util.ssl import get_default_context
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .coordinator import SunflowDataUpdateCoordinator
+
+DATA_HUB = "hub"
+
+# Connection pool shared by all Sunflow entries.
+HUB_CONNECTION_LIMIT = 100
+HUB_CONNECTION_LIMIT_PER_HOST = 4
+HUB_DNS_CACHE_TTL_SECONDS = 300
+HUB_KEEPALIVE_TIMEOUT_SECONDS = 60
+
+# Refreshes due within this window (capped to a fraction of the entry's interval) are pulled
+# forward into the current wakeup, so entries converge onto shared wakeups.
+COALESCE_WINDOW_SECONDS = 1.0
+COALESCE_MAX_INTERVAL_FRACTION = 0.2
+
+
+@dataclass
+class HubMetrics:
+    entries: int = 0
+    wakeups: int = 0
+    refreshes: int = 0
+    coalesced_refreshes: int = 0
+    skipped_push_active: int = 0
+    failed_refreshes: int = 0
+    last_wakeup_lag_seconds: float = 0.0
+    max_wakeup_lag_seconds: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+class SunflowHub:
+    """Domain-wide connection pool and polling scheduler for all Sunflow entries.
+
+    One timer serves every entry: it wakes at the earliest due refresh and runs all
+    refreshes due at (or shortly after) that moment together, so N entries don't mean
+    N independent timers.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._session: ClientSession | None = None
+        self._coordinators: dict[str, SunflowDataUpdateCoordinator] = {}
+        self._next_due: dict[str, float] = {}
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        self._scheduled_at: float | None = None
+        self.metrics = HubMetrics()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, self._async_on_close)
+
+    @property
+    def session(self) -> ClientSession:
+        # Kept for the lifetime of HA (closed on shutdown); idle keep-alive
+        # connections are dropped by the connector after the keep-alive timeout.
+        if self._session is None or self._session.closed:
+            connector = TCPConnector(
+                limit=HUB_CONNECTION_LIMIT,
+                limit_per_host=HUB_CONNECTION_LIMIT_PER_HOST,
+                ttl_dns_cache=HUB_DNS_CACHE_TTL_SECONDS,
+                keepalive_timeout=HUB_KEEPALIVE_TIMEOUT_SECONDS,
+                enable_cleanup_closed=True,
+                # HA's SSL context, so CA bundle and TLS settings match its own sessions.
+                ssl=get_default_context(),
+            )
+            self._session = ClientSession(connector=connector, headers={"User-Agent": SERVER_SOFTWARE})
+        return self._session
+
+    @callback
+    def async_register(self, entry_id: str, coordinator: SunflowDataUpdateCoordinator) -> CALLBACK_TYPE:
+        """Schedule `coordinator` on the shared timer; returns the unregister callback."""
+        self._coordinators[entry_id] = coordinator
+        # Random initial phase so entries set up together don't all fire at once.
+        interval = coordinator.poll_interval.total_seconds()
+        self._next_due[entry_id] = time.monotonic() + interval * random.uniform(0.5, 1.0)
+        self.metrics.entries = len(self._coordinators)
+        self._async_reschedule()
+
+        @callback
+        def _unregister() -> None:
+            self._coordinators.pop(entry_id, None)
+            self._next_due.pop(entry_id, None)
+            self.metrics.entries = len(self._coordinators)
+            self._async_reschedule()
+
+        return _unregister
+
+    @callback
+    def async_reschedule_entry(self, entry_id: str) -> None:
+        """Apply a changed poll_interval now instead of after the pending wakeup."""
+        coordinator = self._coordinators.get(entry_id)
+        if coordinator is None or self._next_due.get(entry_id) == float("inf"):
+            # Not registered, or a refresh is in flight and reschedules itself when done.
+            return
+        self._next_due[entry_id] = time.monotonic() + coordinator.poll_interval.total_seconds()
+        self._async_reschedule()
+
+    @callback
+    def _async_reschedule(self) -> None:
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        if not self._next_due:
+            return
+
+        earliest = min(self._next_due.values())
+        if earliest == float("inf"):
+            return
+        delay = max(0.0, earliest - time.monotonic())
+        self._scheduled_at = earliest
+        self._unsub_timer = async_call_later(self._hass, delay, self._async_on_timer)
+
+    @callback
+    def _async_on_timer(self, _now: datetime) -> None:
+        self._unsub_timer = None
+        now = time.monotonic()
+        self.metrics.wakeups += 1
+        if self._scheduled_at is not None:
+            lag = max(0.0, now - self._scheduled_at)
+            self.metrics.last_wakeup_lag_seconds = round(lag, 4)
+            self.metrics.max_wakeup_lag_seconds = max(self.metrics.max_wakeup_lag_seconds, round(lag, 4))
+
+        due: list[str] = []
+        for entry_id, next_due in self._next_due.items():
+            interval = self._coordinators[entry_id].poll_interval.total_seconds()
+            window = min(COALESCE_WINDOW_SECONDS, interval * COALESCE_MAX_INTERVAL_FRACTION)
+            if next_due <= now + window:
+                due.append(entry_id)
+
+        for entry_id in due:
+            # In flight; rescheduled when the refresh finishes.
+            self._next_due[entry_id] = float("inf")
+        if len(due) > 1:
+            self.metrics.coalesced_refreshes += len(due) - 1
+
+        self._async_reschedule()
+        for entry_id in due:
+            self._hass.async_create_background_task(self._async_refresh(entry_id), f"sunflow_hub_refresh_{entry_id}")
+
+    async def _async_refresh(self, entry_id: str) -> None:
+        coordinator = self._coordinators.get(entry_id)
+        if coordinator is None:
+            return
+
+        config_entry = coordinator.config_entry
+        try:
+            if coordinator.push_active:
+                # Pushed frames keep the data fresh; polling resumes when the stream drops.
+                self.metrics.skipped_push_active += 1
+            elif config_entry is None or not config_entry.pref_disable_polling:
+                self.metrics.refreshes += 1
+                await coordinator.async_refresh()
+                if not coordinator.last_update_success:
+                    self.metrics.failed_refreshes += 1
+        finally:
+            # Always, even if the refresh raised or was cancelled; otherwise the entry
+            # would stay marked in flight and never poll again.
+            if self._coordinators.get(entry_id) is coordinator:
+                self._next_due[entry_id] = time.monotonic() + coordinator.poll_interval.total_seconds()
+                self._async_reschedule()
+
+    async def _async_on_close(self, _event: Event) -> None:
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        if self._session is not None:
+            session, self._session = self._session, None
+            await session.close()
+
+
+@callback
+def async_get_hub(hass: HomeAssistant) -> SunflowHub:
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    hub = domain_data.get(DATA_HUB)
+    if hub is None:
+        hub = domain_data[DATA_HUB] = SunflowHub(hass)
+    return hub
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+import math
+from typing import Any
+
+# Samples kept per rolling window; old samples fall off, so memory stays constant.
+METRICS_WINDOW_SIZE = 256
+PERCENTILES = (50, 95, 99)
+
+
+def _nearest_rank(ordered: list[float], pct: float) -> float:
+    return ordered[max(math.ceil(pct / 100 * len(ordered)), 1) - 1]
+
+
+class RollingWindow:
+    """Fixed-size window of recent samples with nearest-rank percentiles."""
+
+    __slots__ = ("_samples",)
+
+    def __init__(self, size: int = METRICS_WINDOW_SIZE) -> None:
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self._samples)
+
+    def add(self, value: float) -> None:
+        self._samples.append(value)
+
+    def percentile(self, pct: float) -> float | None:
+        if not self._samples:
+            return None
+        return _nearest_rank(sorted(self._samples), pct)
+
+    def summary(self, scale: float = 1.0, digits: int = 1) -> dict[str, Any]:
+        """Count, mean and PERCENTILES of the window, multiplied by `scale`."""
+        if not self._samples:
+            return {"count": 0}
+        ordered = sorted(self._samples)
+        result: dict[str, Any] = {
+            "count": len(ordered),
+            "mean": round(sum(ordered) / len(ordered) * scale, digits),
+            "max": round(ordered[-1] * scale, digits),
+        }
+        for pct in PERCENTILES:
+            result[f"p{pct}"] = round(_nearest_rank(ordered, pct) * scale, digits)
+        return result
+
+
+@dataclass
+class EndpointMetrics:
+    latency: RollingWindow = field(default_factory=RollingWindow)
+    payload_bytes: RollingWindow = field(default_factory=RollingWindow)
+    decode: RollingWindow = field(default_factory=RollingWindow)
+    requests: int = 0
+    not_modified: int = 0
+    errors: int = 0
+    cache_hits: int = 0
+    cache_stale_hits: int = 0
+    cache_misses: int = 0
+    retries: int = 0
+    coalesced: int = 0
+    circuit_rejections: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "not_modified": self.not_modified,
+            "errors": self.errors,
+            "retries": self.retries,
+            "coalesced": self.coalesced,
+            "circuit_rejections": self.circuit_rejections,
+            "cache": {"hits": self.cache_hits, "stale_hits": self.cache_stale_hits, "misses": self.cache_misses},
+            "latency_ms": self.latency.summary(scale=1000),
+            "payload_bytes": self.payload_bytes.summary(digits=0),
+            "decode_ms": self.decode.summary(scale=1000, digits=3),
+        }
+
+
+class SunflowMetrics:
+    """Hot-path instrumentation for one Sunflow entry.
+
+    The client records per-request latency, payload size, JSON decode time and cache
+    hits/misses; the coordinator records refresh durations, overruns (a refresh that
+    took longer than the polling interval) and consecutive-failure streaks. All timing
+    data lives in bounded rolling windows.
+    """
+
+    def __init__(self) -> None:
+        self.endpoints: dict[str, EndpointMetrics] = {}
+        self.refresh_duration = RollingWindow()
+        self.refreshes = 0
+        self.refresh_overruns = 0
+        self.failure_streak = 0
+        self.max_failure_streak = 0
+
+    def endpoint(self, name: str) -> EndpointMetrics:
+        metrics = self.endpoints.get(name)
+        if metrics is None:
+            metrics = self.endpoints[name] = EndpointMetrics()
+        return metrics
+
+    def record_request(self, name: str, latency: float, payload_bytes: int | None, decode: float | None) -> None:
+        """Record a completed request; payload and decode are None for 304 Not Modified."""
+        metrics = self.endpoint(name)
+        metrics.requests += 1
+        metrics.latency.add(latency)
+        if payload_bytes is None:
+            metrics.not_modified += 1
+            return
+        metrics.payload_bytes.add(payload_bytes)
+        if decode is not None:
+            metrics.decode.add(decode)
+
+    def record_request_error(self, name: str) -> None:
+        metrics = self.endpoint(name)
+        metrics.requests += 1
+        metrics.errors += 1
+
+    def record_refresh(self, duration: float, interval: float | None, success: bool) -> None:
+        self.refreshes += 1
+        self.refresh_duration.add(duration)
+        if interval is not None and duration > interval:
+            self.refresh_overruns += 1
+        if success:
+            self.failure_streak = 0
+        else:
+            self.failure_streak += 1
+            self.max_failure_streak = max(self.max_failure_streak, self.failure_streak)
+
+    def cache_hit_ratio(self) -> float | None:
+        hits = sum(m.cache_hits + m.cache_stale_hits for m in self.endpoints.values())
+        total = hits + sum(m.cache_misses for m in self.endpoints.values())
+        if not total:
+            return None
+        return round(hits / total * 100, 1)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "refreshes": self.refreshes,
+            "refresh_overruns": self.refresh_overruns,
+            "failure_streak": self.failure_streak,
+            "max_failure_streak": self.max_failure_streak,
+            "refresh_duration_ms": self.refresh_duration.summary(scale=1000),
+            "cache_hit_ratio_pct": self.cache_hit_ratio(),
+            "endpoints": {name: metrics.as_dict() for name, metrics in sorted(self.endpoints.items())},
+        }
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from array import array
+
+from .api import SunflowRealtime
+
+# Realtime power fields tracked, in this order.
+ROLLING_FIELDS = ("pv", "load", "grid", "battery")
+# Window lengths (seconds).
+ROLLING_WINDOWS = (60, 300, 900)
+
+# Samples kept. Covers 15 minutes down to ~1 s between samples (push); with more frequent
+# samples the oldest fall off first and the longest window gets shorter.
+ROLLING_CAPACITY = 1024
+
+
+def _power_values(realtime: SunflowRealtime) -> tuple[float, ...]:
+    return (
+        float(realtime.pv_power or 0),
+        float(realtime.load_power or 0),
+        float(realtime.grid_power or 0),
+        float(realtime.battery_power or 0),
+    )
+
+
+class _MonotonicQueue:
+    """Sample sequence numbers whose values are strictly increasing (min) or decreasing (max).
+
+    The front is the window's extreme. Each sample is pushed and popped at most once, so
+    updates are amortized O(1). Backed by a preallocated ring of sequence numbers.
+    """
+
+    __slots__ = ("_seq", "_head", "_tail", "_keep_if")
+
+    def __init__(self, is_min: bool) -> None:
+        self._seq = array("q", bytes(8 * ROLLING_CAPACITY))
+        self._head = 0
+        self._tail = 0
+        # Keep the back element while it compares like this against the new value.
+        self._keep_if = float.__lt__ if is_min else float.__gt__
+
+    def push(self, seq: int, value: float, values: array, offset: int, width: int) -> None:
+        while self._tail > self._head:
+            back = self._seq[(self._tail - 1) % ROLLING_CAPACITY]
+            if self._keep_if(values[(back % ROLLING_CAPACITY) * width + offset], value):
+                break
+            self._tail -= 1
+        self._seq[self._tail % ROLLING_CAPACITY] = seq
+        self._tail += 1
+
+    def evict(self, seq: int) -> None:
+        if self._tail > self._head and self._seq[self._head % ROLLING_CAPACITY] == seq:
+            self._head += 1
+
+    def front(self) -> int | None:
+        return self._seq[self._head % ROLLING_CAPACITY] if self._tail > self._head else None
+
+
+class _Window:
+    __slots__ = ("seconds", "start", "sums", "mins", "maxs")
+
+    def __init__(self, seconds: int, width: int) -> None:
+        self.seconds = seconds
+        # Sequence number of the oldest sample in the window.
+        self.start = 0
+        self.sums = array("d", bytes(8 * width))
+        self.mins = [_MonotonicQueue(is_min=True) for _ in range(width)]
+        self.maxs = [_MonotonicQueue(is_min=False) for _ in range(width)]
+
+
+class RollingPowerStats:
+    """Mean, min and max of each realtime power field over 1/5/15-minute windows.
+
+    Samples live in fixed-size float arrays used as a ring buffer. Each window keeps a
+    running sum and monotonic queues for min/max, so adding a sample is amortized O(1)
+    and nothing is allocated per sample. The mean is over samples, not time-weighted.
+    """
+
+    __slots__ = ("_ts", "_values", "_next", "_windows")
+
+    def __init__(self) -> None:
+        width = len(ROLLING_FIELDS)
+        self._ts = array("d", bytes(8 * ROLLING_CAPACITY))
+        self._values = array("d", bytes(8 * ROLLING_CAPACITY * width))
+        # Sequence number of the next sample.
+        self._next = 0
+        self._windows = {seconds: _Window(seconds, width) for seconds in ROLLING_WINDOWS}
+
+    def _evict(self, window: _Window) -> None:
+        seq = window.start
+        base = (seq % ROLLING_CAPACITY) * len(ROLLING_FIELDS)
+        for i in range(len(ROLLING_FIELDS)):
+            window.sums[i] -= self._values[base + i]
+            window.mins[i].evict(seq)
+            window.maxs[i].evict(seq)
+        window.start += 1
+
+    def add_sample(self, ts: float, realtime: SunflowRealtime) -> None:
+        seq = self._next
+        if seq and ts <= self._ts[(seq - 1) % ROLLING_CAPACITY]:
+            # Duplicate or out of order.
+            return
+        width = len(ROLLING_FIELDS)
+        # The slot about to be reused must leave every window first.
+        for window in self._windows.values():
+            while window.start <= seq - ROLLING_CAPACITY:
+                self._evict(window)
+
+        slot = seq % ROLLING_CAPACITY
+        self._ts[slot] = ts
+        values = _power_values(realtime)
+        for i, value in enumerate(values):
+            self._values[slot * width + i] = value
+        self._next = seq + 1
+
+        for window in self._windows.values():
+            for i, value in enumerate(values):
+                window.sums[i] += value
+                window.mins[i].push(seq, value, self._values, i, width)
+                window.maxs[i].push(seq, value, self._values, i, width)
+            while ts - self._ts[window.start % ROLLING_CAPACITY] >= window.seconds:
+                self._evict(window)
+
+    def stats(self, field: str, seconds: int) -> dict[str, float] | None:
+        """{"mean", "min", "max", "samples"} for `field` over the last `seconds`; None if empty."""
+        window = self._windows[seconds]
+        count = self._next - window.start
+        if count <= 0:
+            return None
+        i = ROLLING_FIELDS.index(field)
+        width = len(ROLLING_FIELDS)
+        low = window.mins[i].front()
+        high = window.maxs[i].front()
+        return {
+            "mean": round(window.sums[i] / count, 1),
+            "min": self._values[(low % ROLLING_CAPACITY) * width + i],
+            "max": self._values[(high % ROLLING_CAPACITY) * width + i],
+            "samples": count,
+        }
@@ -1,29 +1,65 @@
 from __future__ import annotations
 
-from datetime import timedelta
-import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import partial
 import time
+from typing import Any
 
-from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
+from homeassistant.components.sensor import (
+    RestoreSensor,
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfInformation, UnitOfTime
 from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_change, async_track_time_interval
+from homeassistant.helpers.typing import StateType
+from homeassistant.util import dt as dt_util
 from homeassistant.helpers.update_coordinator import CoordinatorEntity, DataUpdateCoordinator
 
-from .api import SunflowClient
+from .api import (
+    ENDPOINT_BATTERY_HEALTH,
+    ENDPOINT_FORECAST,
+    ENDPOINT_PATHS,
+    ENDPOINT_REALTIME,
+    ENDPOINT_ROI,
+    ENDPOINT_TARIFF_COMPARE,
+    SunflowClient,
+    SunflowRealtime,
+)
+from .backfill import BACKFILL_INTERVAL, SunflowHistoryBackfill
 from .const import (
     CONF_ADMIN_TOKEN,
     CONF_BASE_URL,
-    CONF_SCAN_INTERVAL_SECONDS,
-    DEFAULT_OPTIONS_SCAN_INTERVAL_SECONDS,
-    DEFAULT_SCAN_INTERVAL_SECONDS,
+    CONF_IMPORT_STATISTICS,
+    CONF_PUSH_UPDATES,
+    DEFAULT_IMPORT_STATISTICS,
+    DEFAULT_PUSH_UPDATES,
     DOMAIN,
 )
-
-
-_LOGGER = logging.getLogger(__name__)
+from .coordinator import (
+    DATA_DERIVED,
+    DATA_FORECAST_SERIES,
+    DATA_REALTIME_STATE,
+    PublishPolicy,
+    SunflowAnalyticsCoordinator,
+    SunflowDataUpdateCoordinator,
+    SunflowForecastCoordinator,
+)
+from .derived import SunflowDerived
+from .forecast import ForecastSeries
+from .hub import async_get_hub
+from .metrics import RollingWindow, SunflowMetrics
+from .rolling import ROLLING_WINDOWS
+from .store import SunflowSnapshotStore
+from .supervisor import AddonEndpointResolver, AddonStatsCoordinator
 
 
 async def async_setup_entry(
@@ -34,70 +70,212 @@ async def async_setup_entry(
     base_url = entry.data[CONF_BASE_URL]
     admin_token = entry.data.get(CONF_ADMIN_TOKEN) or None
 
-    session = async_get_clientsession(hass)
-    client = SunflowClient(session=session, base_url=base_url, admin_token=admin_token)
+    # All entries share the hub's connection pool and polling timer.
+    hub = async_get_hub(hass)
+    client = SunflowClient(session=hub.session, base_url=base_url, admin_token=admin_token)
 
-    # Realtime should be fast for automations/notifications.
-    # Info is relatively static, so avoid fetching it on every tick.
-    info_ttl_seconds = 60 * 60
-    last_info_fetch_monotonic = 0.0
-    cached_info = None
+    coordinator = SunflowDataUpdateCoordinator(hass, entry, client, base_url)
+    # Heavy analytics and the forecast on their own slow schedules. Each is fetched once an
+    # enabled entity asks for it (in the background, so setup doesn't wait).
+    analytics = SunflowAnalyticsCoordinator(hass, entry, client, base_url)
+    forecast = SunflowForecastCoordinator(hass, entry, client, base_url)
 
-    async def _async_update_data():
-        nonlocal last_info_fetch_monotonic, cached_info
-        now = time.monotonic()
+    resolver: AddonEndpointResolver | None = None
+    if AddonEndpointResolver.applies_to(entry):
+        resolver = AddonEndpointResolver(hass, entry, coordinator)
 
-        if cached_info is None or (now - last_info_fetch_monotonic) >= info_ttl_seconds:
-            cached_info = await client.get_info()
-            last_info_fetch_monotonic = now
+    # With a snapshot from the last run, entities start from it and the first live refresh
+    # runs in the background; only a first-ever setup has to wait for Sunflow.
+    snapshot_store = SunflowSnapshotStore(hass, entry, coordinator, analytics, forecast)
+    restored = await snapshot_store.async_restore()
+    if not restored:
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except Exception as err:
+            # The add-on may have a new address since the last start; look for it before giving up.
+            if resolver is None or not await resolver.async_resolve():
+                # Without this, setup can fail silently for users, and no entities appear.
+                raise ConfigEntryNotReady from err
+            try:
+                await coordinator.async_config_entry_first_refresh()
+            except Exception as retry_err:
+                raise ConfigEntryNotReady from retry_err
 
-        realtime = await client.get_realtime()
-        return {"info": cached_info, "realtime": realtime}
+    entry.async_on_unload(hub.async_register(entry.entry_id, coordinator))
+    entry.async_on_unload(snapshot_store.async_start())
 
-    scan_interval_seconds = entry.options.get(CONF_SCAN_INTERVAL_SECONDS, DEFAULT_OPTIONS_SCAN_INTERVAL_SECONDS)
-    try:
-        scan_interval_seconds = int(scan_interval_seconds)
-    except (TypeError, ValueError):
-        scan_interval_seconds = DEFAULT_SCAN_INTERVAL_SECONDS
-
-    coordinator = DataUpdateCoordinator(
-        hass,
-        logger=_LOGGER,
-        name=f"Sunflow ({base_url})",
-        update_method=_async_update_data,
-        update_interval=timedelta(seconds=scan_interval_seconds),
-    )
+    @callback
+    def _async_day_rollover(_now) -> None:
+        hass.async_create_task(analytics.async_request_refresh())
 
-    try:
-        await coordinator.async_config_entry_first_refresh()
-    except Exception as err:
-        # Without this, setup can fail silently for users, and no entities appear.
-        raise ConfigEntryNotReady from err
+    entry.async_on_unload(async_track_time_change(hass, _async_day_rollover, hour=0, minute=5, second=0))
+
+    entry_data = {
+        "client": client,
+        "coordinator": coordinator,
+        "analytics_coordinator": analytics,
+        "forecast_coordinator": forecast,
+    }
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = entry_data
 
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {"client": client, "coordinator": coordinator}
+    if resolver is not None:
+        entry.async_on_unload(coordinator.async_add_failure_listener(resolver.async_on_failure))
+    if restored:
+        # Failures go through the resolver (listener above) and the regular hub polling.
+        entry.async_create_background_task(hass, coordinator.async_refresh(), f"sunflow_refresh_{entry.entry_id}")
+
+    @callback
+    def _async_fill_energy_gap() -> None:
+        # Runs in the background so the realtime coordinator is never blocked.
+        entry.async_create_background_task(
+            hass, coordinator.async_fill_energy_gap(), f"sunflow_energy_gap_{entry.entry_id}"
+        )
+
+    # Always on: the energy sensors need it whether or not statistics are imported.
+    entry.async_on_unload(coordinator.async_add_recovery_listener(_async_fill_energy_gap))
+
+    addon_entities: list[SensorEntity] = []
+    if resolver is not None:
+        # Add-on resource usage from the Supervisor, to correlate with request latency.
+        addon_stats = AddonStatsCoordinator(hass, entry)
+        entry_data["addon_stats_coordinator"] = addon_stats
+        addon_entities = [SunflowAddonStatsSensor(addon_stats, entry, description) for description in ADDON_STATS_SENSORS]
+
+    entry.async_on_unload(partial(_async_stop_backfill, entry_data))
+    _async_apply_features(hass, entry, entry_data)
 
     async_add_entities(
         [
             SunflowVersionSensor(coordinator, entry),
-            SunflowPVPowerSensor(coordinator, entry),
-            SunflowLoadPowerSensor(coordinator, entry),
-            SunflowGridPowerSensor(coordinator, entry),
-            SunflowBatteryPowerSensor(coordinator, entry),
-            SunflowBatteryChargePowerSensor(coordinator, entry),
-            SunflowBatteryDischargePowerSensor(coordinator, entry),
-            SunflowBatterySocSensor(coordinator, entry),
+            *(SunflowRealtimeSensor(coordinator, entry, description) for description in REALTIME_SENSORS),
+            *(SunflowDerivedSensor(coordinator, entry, description) for description in DERIVED_SENSORS),
+            *(SunflowEnergySensor(coordinator, entry, description) for description in ENERGY_SENSORS),
+            *(SunflowRollingSensor(coordinator, entry, description) for description in ROLLING_SENSORS),
+            *(SunflowMetricSensor(coordinator, entry, description) for description in METRIC_SENSORS),
+            *(
+                SunflowAnalyticsSensor(analytics, entry, description, hass.config.currency)
+                for description in ANALYTICS_SENSORS
+            ),
+            *(SunflowForecastSensor(forecast, coordinator, entry, description) for description in FORECAST_SENSORS),
+            *addon_entities,
         ],
         update_before_add=False,
     )
 
 
+@callback
+def async_apply_options(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Apply changed options to a loaded entry in place (no entity teardown, no new client).
+
+    Returns False when the entry has to be reloaded instead (the base URL or token no longer
+    match the running client).
+    """
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if entry_data is None:
+        # Still setting up (e.g. the add-on resolver just stored a new URL) or not set up at
+        # all: setup reads the current data and options itself, so there is nothing to apply.
+        return True
+    client: SunflowClient = entry_data["client"]
+    if (
+        client.base_url != entry.data[CONF_BASE_URL].rstrip("/")
+        or client.admin_token != (entry.data.get(CONF_ADMIN_TOKEN) or None)
+    ):
+        return False
+
+    coordinator: SunflowDataUpdateCoordinator = entry_data["coordinator"]
+    coordinator.async_apply_options(entry.options)
+    async_get_hub(hass).async_reschedule_entry(entry.entry_id)
+    _async_apply_features(hass, entry, entry_data)
+    return True
+
+
+@callback
+def _async_apply_features(hass: HomeAssistant, entry: ConfigEntry, entry_data: dict) -> None:
+    """Start or stop push updates and the statistics backfill to match the entry options."""
+    coordinator: SunflowDataUpdateCoordinator = entry_data["coordinator"]
+
+    push_task = entry_data.get("push_task")
+    if entry.options.get(CONF_PUSH_UPDATES, DEFAULT_PUSH_UPDATES):
+        if push_task is None or push_task.done():
+            # Cancelled automatically when the entry unloads.
+            entry_data["push_task"] = entry.async_create_background_task(
+                hass, coordinator.async_run_push(), f"sunflow_push_{entry.entry_id}"
+            )
+    elif push_task is not None:
+        push_task.cancel()
+        entry_data["push_task"] = None
+
+    if entry.options.get(CONF_IMPORT_STATISTICS, DEFAULT_IMPORT_STATISTICS):
+        if entry_data.get("backfill") is None:
+            _async_start_backfill(hass, entry, entry_data)
+    else:
+        _async_stop_backfill(entry_data)
+
+
+@callback
+def _async_start_backfill(hass: HomeAssistant, entry: ConfigEntry, entry_data: dict) -> None:
+    coordinator: SunflowDataUpdateCoordinator = entry_data["coordinator"]
+    backfill = SunflowHistoryBackfill(hass, entry, entry_data["client"])
+    entry_data["backfill"] = backfill
+    entry.async_create_background_task(hass, backfill.async_run(), f"sunflow_backfill_{entry.entry_id}")
+
+    @callback
+    def _async_catch_up() -> None:
+        # Runs in the background so the realtime coordinator is never blocked.
+        entry.async_create_background_task(hass, backfill.async_catch_up(), f"sunflow_catch_up_{entry.entry_id}")
+
+    entry_data["backfill_unsubs"] = [
+        async_track_time_interval(hass, backfill.async_run, BACKFILL_INTERVAL),
+        coordinator.async_add_recovery_listener(_async_catch_up),
+    ]
+
+
+@callback
+def _async_stop_backfill(entry_data: dict) -> None:
+    # A pass already running finishes on its own (or is cancelled on unload).
+    for unsub in entry_data.pop("backfill_unsubs", ()):
+        unsub()
+    entry_data["backfill"] = None
+
+
 class _SunflowBaseSensor(CoordinatorEntity, SensorEntity):
     _attr_has_entity_name = True
     _attr_should_poll = False
+    # Which publish deadbands apply (see PublishPolicy); subclasses opt in.
+    _publish_absolute_deadband = False
+    _publish_relative_deadband = False
 
     def __init__(self, coordinator: DataUpdateCoordinator, entry: ConfigEntry) -> None:
         super().__init__(coordinator)
         self._entry = entry
+        # Last written (value, (available, restored), time).
+        self._published: tuple[Any, tuple[bool, bool], float] | None = None
+
+    def _publish_policy(self) -> PublishPolicy | None:
+        # Sensors updated on every realtime tick return the entry's policy.
+        return None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        policy = self._publish_policy()
+        if policy is not None and policy.enabled:
+            # Leaving the restored snapshot is always written, like availability changes.
+            status = (self.available, getattr(self.coordinator, "restored", False))
+            value, now = self.native_value, time.monotonic()
+            if (
+                self._published is not None
+                and status == self._published[1]
+                and not policy.should_publish(
+                    self._published[0],
+                    value,
+                    now - self._published[2],
+                    absolute=self._publish_absolute_deadband,
+                    relative=self._publish_relative_deadband,
+                )
+            ):
+                return
+            self._published = (value, status, now)
+        super()._handle_coordinator_update()
 
     @property
     def device_info(self):
@@ -113,6 +291,11 @@ class _SunflowBaseSensor(CoordinatorEntity, SensorEntity):
         return self.coordinator.last_update_success
 
 
+def _live_attributes(coordinator: SunflowDataUpdateCoordinator) -> dict[str, Any]:
+    # "restored": still showing the persisted snapshot (store.py), until Sunflow first answers.
+    return {"restored": coordinator.restored, "last_live_update": coordinator.last_success_time}
+
+
 class SunflowVersionSensor(_SunflowBaseSensor):
     _attr_name = "Version"
 
@@ -126,128 +309,830 @@ class SunflowVersionSensor(_SunflowBaseSensor):
         return getattr(info, "version", None)
 
 
-class SunflowPVPowerSensor(_SunflowBaseSensor):
-    _attr_name = "PV Power"
-    _attr_native_unit_of_measurement = "W"
-    _attr_device_class = SensorDeviceClass.POWER
-    _attr_state_class = SensorStateClass.MEASUREMENT
+@dataclass(frozen=True, kw_only=True)
+class SunflowRealtimeSensorEntityDescription(SensorEntityDescription):
+    value_fn: Callable[[SunflowRealtime], StateType]
+    # Daily counter: a 0 after a nonzero value on the same local day is reported as unknown.
+    # /api/data falls back to all zeros when the inverter read times out, and statistics
+    # would take the drop for a meter reset and count the day's yield twice.
+    day_counter: bool = False
 
-    def __init__(self, coordinator: DataUpdateCoordinator, entry: ConfigEntry) -> None:
+
+@dataclass(frozen=True, kw_only=True)
+class SunflowDerivedSensorEntityDescription(SensorEntityDescription):
+    value_fn: Callable[[SunflowDerived], StateType]
+
+
+@dataclass(frozen=True, kw_only=True)
+class SunflowEnergySensorEntityDescription(SensorEntityDescription):
+    flow: str
+
+
+@dataclass(frozen=True, kw_only=True)
+class SunflowRollingSensorEntityDescription(SensorEntityDescription):
+    field: str
+    window_seconds: int
+
+
+@dataclass(frozen=True, kw_only=True)
+class SunflowMetricSensorEntityDescription(SensorEntityDescription):
+    value_fn: Callable[[SunflowMetrics], StateType]
+
+
+@dataclass(frozen=True, kw_only=True)
+class SunflowAddonStatsSensorEntityDescription(SensorEntityDescription):
+    value_fn: Callable[[dict], StateType]
+
+
+@dataclass(frozen=True, kw_only=True)
+class SunflowAnalyticsSensorEntityDescription(SensorEntityDescription):
+    endpoint: str
+    value_fn: Callable[[dict], StateType | datetime]
+    attributes_fn: Callable[[dict], dict[str, Any]] | None = None
+    # For TOTAL sensors that restart periodically (monthly figures).
+    last_reset_fn: Callable[[], datetime] | None = None
+
+
+@dataclass(frozen=True, kw_only=True)
+class SunflowForecastSensorEntityDescription(SensorEntityDescription):
+    # Evaluated against the indexed forecast on every realtime tick.
+    value_fn: Callable[[ForecastSeries, datetime], StateType | datetime]
+    attributes_fn: Callable[[ForecastSeries, datetime], dict[str, Any]] | None = None
+
+
+_POWER_SENSOR_DEFAULTS = {
+    "native_unit_of_measurement": "W",
+    "device_class": SensorDeviceClass.POWER,
+    "state_class": SensorStateClass.MEASUREMENT,
+}
+
+# unique_id suffix is "sunflow_<key>", matching the entities created before this table existed.
+REALTIME_SENSORS: tuple[SunflowRealtimeSensorEntityDescription, ...] = (
+    SunflowRealtimeSensorEntityDescription(
+        key="pv_power", name="PV Power", value_fn=lambda r: r.pv_power, **_POWER_SENSOR_DEFAULTS
+    ),
+    SunflowRealtimeSensorEntityDescription(
+        key="load_power", name="Load Power", value_fn=lambda r: r.load_power, **_POWER_SENSOR_DEFAULTS
+    ),
+    SunflowRealtimeSensorEntityDescription(
+        key="grid_power", name="Grid Power", value_fn=lambda r: r.grid_power, **_POWER_SENSOR_DEFAULTS
+    ),
+    # Convention (Sunflow UI):
+    #  - positive = discharging (battery -> load/grid)
+    #  - negative = charging (pv/grid -> battery)
+    SunflowRealtimeSensorEntityDescription(
+        key="battery_power", name="Battery Power", value_fn=lambda r: r.battery_power, **_POWER_SENSOR_DEFAULTS
+    ),
+    SunflowRealtimeSensorEntityDescription(
+        key="battery_charge_power",
+        name="Battery Charge Power",
+        value_fn=lambda r: r.battery_charge_power,
+        **_POWER_SENSOR_DEFAULTS,
+    ),
+    SunflowRealtimeSensorEntityDescription(
+        key="battery_discharge_power",
+        name="Battery Discharge Power",
+        value_fn=lambda r: r.battery_discharge_power,
+        **_POWER_SENSOR_DEFAULTS,
+    ),
+    SunflowRealtimeSensorEntityDescription(
+        key="battery_soc",
+        name="Battery SoC",
+        native_unit_of_measurement="%",
+        value_fn=lambda r: r.battery_soc,
+    ),
+    # Inverter day counter; resets at midnight.
+    SunflowRealtimeSensorEntityDescription(
+        key="pv_energy_today",
+        name="PV Energy Today",
+        native_unit_of_measurement="kWh",
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        suggested_display_precision=2,
+        value_fn=lambda r: r.energy_today_production,
+        day_counter=True,
+    ),
+)
+
+_PERCENT_SENSOR_DEFAULTS = {
+    "native_unit_of_measurement": "%",
+    "state_class": SensorStateClass.MEASUREMENT,
+    "suggested_display_precision": 0,
+}
+
+# Computed once per payload (derived.SunflowDerived) instead of per template sensor.
+DERIVED_SENSORS: tuple[SunflowDerivedSensorEntityDescription, ...] = (
+    SunflowDerivedSensorEntityDescription(
+        key="grid_import_power",
+        name="Grid Import Power",
+        value_fn=lambda d: d.grid_import_power,
+        **_POWER_SENSOR_DEFAULTS,
+    ),
+    SunflowDerivedSensorEntityDescription(
+        key="grid_export_power",
+        name="Grid Export Power",
+        value_fn=lambda d: d.grid_export_power,
+        **_POWER_SENSOR_DEFAULTS,
+    ),
+    SunflowDerivedSensorEntityDescription(
+        key="pv_surplus_power",
+        name="PV Surplus Available",
+        value_fn=lambda d: d.pv_surplus_power,
+        **_POWER_SENSOR_DEFAULTS,
+    ),
+    SunflowDerivedSensorEntityDescription(
+        key="load_deficit_power",
+        name="Load Not Covered by PV",
+        value_fn=lambda d: d.load_deficit_power,
+        **_POWER_SENSOR_DEFAULTS,
+    ),
+    SunflowDerivedSensorEntityDescription(
+        key="autonomy", name="Autonomy", value_fn=lambda d: d.autonomy, **_PERCENT_SENSOR_DEFAULTS
+    ),
+    SunflowDerivedSensorEntityDescription(
+        key="self_consumption",
+        name="Self-Consumption",
+        value_fn=lambda d: d.self_consumption,
+        **_PERCENT_SENSOR_DEFAULTS,
+    ),
+)
+
+_ENERGY_SENSOR_DEFAULTS = {
+    "native_unit_of_measurement": "kWh",
+    "device_class": SensorDeviceClass.ENERGY,
+    "state_class": SensorStateClass.TOTAL_INCREASING,
+    "suggested_display_precision": 2,
+}
+
+ENERGY_SENSORS: tuple[SunflowEnergySensorEntityDescription, ...] = (
+    SunflowEnergySensorEntityDescription(key="pv_energy", name="PV Energy", flow="pv", **_ENERGY_SENSOR_DEFAULTS),
+    SunflowEnergySensorEntityDescription(
+        key="grid_import_energy", name="Grid Import Energy", flow="grid_import", **_ENERGY_SENSOR_DEFAULTS
+    ),
+    SunflowEnergySensorEntityDescription(
+        key="grid_export_energy", name="Grid Export Energy", flow="grid_export", **_ENERGY_SENSOR_DEFAULTS
+    ),
+    SunflowEnergySensorEntityDescription(
+        key="battery_charge_energy", name="Battery Charge Energy", flow="battery_charge", **_ENERGY_SENSOR_DEFAULTS
+    ),
+    SunflowEnergySensorEntityDescription(
+        key="battery_discharge_energy",
+        name="Battery Discharge Energy",
+        flow="battery_discharge",
+        **_ENERGY_SENSOR_DEFAULTS,
+    ),
+)
+
+
+_ROLLING_FIELD_NAMES = {"pv": "PV", "load": "Load", "grid": "Grid", "battery": "Battery"}
+
+# Smoothed power from the coordinator's ring buffers (rolling.RollingPowerStats); the state is
+# the window mean, min/max are attributes. Opt-in, to replace HA `statistics` helpers.
+ROLLING_SENSORS: tuple[SunflowRollingSensorEntityDescription, ...] = tuple(
+    SunflowRollingSensorEntityDescription(
+        key=f"{field}_power_mean_{seconds // 60}m",
+        name=f"{label} Power {seconds // 60} min Average",
+        field=field,
+        window_seconds=seconds,
+        entity_registry_enabled_default=False,
+        **_POWER_SENSOR_DEFAULTS,
+    )
+    for field, label in _ROLLING_FIELD_NAMES.items()
+    for seconds in ROLLING_WINDOWS
+)
+
+
+def _positive(value) -> float | None:
+    # The server reports 0 when it has no estimate yet.
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if number > 0 else None
+
+
+def _number(value) -> float | None:
+    try:
+        return round(float(value), 2)
+    except (TypeError, ValueError):
+        return None
+
+
+def _break_even(roi: dict) -> datetime | None:
+    value = roi.get("breakEvenDate")
+    return dt_util.parse_datetime(value) if isinstance(value, str) else None
+
+
+def _tariff_net(compare: dict, tariff: str) -> float | None:
+    totals = compare.get("totals")
+    values = totals.get(tariff) if isinstance(totals, dict) else None
+    return _number(values.get("net")) if isinstance(values, dict) else None
+
+
+def _tariff_savings(compare: dict) -> float | None:
+    # delta is dynamic minus fixed; a saving is a negative delta.
+    delta = _tariff_net(compare, "delta")
+    return -delta if delta is not None else None
+
+
+def _start_of_month() -> datetime:
+    return dt_util.start_of_local_day(dt_util.now().replace(day=1))
+
+
+def _tariff_attributes(compare: dict) -> dict[str, Any]:
+    coverage = compare.get("coverage") if isinstance(compare.get("coverage"), dict) else {}
+    period = compare.get("range") if isinstance(compare.get("range"), dict) else {}
+    return {
+        "period_start": period.get("from"),
+        "hours_used": coverage.get("hoursUsed"),
+        "daily": compare.get("seriesDaily") or [],
+    }
+
+
+_MONETARY_SENSOR_DEFAULTS = {
+    "device_class": SensorDeviceClass.MONETARY,
+    "state_class": SensorStateClass.TOTAL,
+    "suggested_display_precision": 2,
+}
+
+# Refreshed by SunflowAnalyticsCoordinator (every few hours and after midnight), never per tick.
+ANALYTICS_SENSORS: tuple[SunflowAnalyticsSensorEntityDescription, ...] = (
+    SunflowAnalyticsSensorEntityDescription(
+        key="amortization",
+        name="Amortization",
+        endpoint=ENDPOINT_ROI,
+        native_unit_of_measurement="%",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        value_fn=lambda roi: _number(roi.get("roiPercent")),
+    ),
+    SunflowAnalyticsSensorEntityDescription(
+        key="total_savings",
+        name="Total Savings",
+        endpoint=ENDPOINT_ROI,
+        value_fn=lambda roi: _number(roi.get("totalReturned")),
+        **_MONETARY_SENSOR_DEFAULTS,
+    ),
+    SunflowAnalyticsSensorEntityDescription(
+        key="total_invested",
+        name="Total Invested",
+        endpoint=ENDPOINT_ROI,
+        value_fn=lambda roi: _number(roi.get("totalInvested")),
+        **_MONETARY_SENSOR_DEFAULTS,
+    ),
+    SunflowAnalyticsSensorEntityDescription(
+        key="net_value",
+        name="Net Value",
+        endpoint=ENDPOINT_ROI,
+        value_fn=lambda roi: _number(roi.get("netValue")),
+        **_MONETARY_SENSOR_DEFAULTS,
+    ),
+    SunflowAnalyticsSensorEntityDescription(
+        key="break_even_date",
+        name="Break-even Date",
+        endpoint=ENDPOINT_ROI,
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=_break_even,
+    ),
+    SunflowAnalyticsSensorEntityDescription(
+        key="battery_cycles",
+        name="Battery Cycles",
+        endpoint=ENDPOINT_BATTERY_HEALTH,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda health: _number(health.get("totalCycles")),
+    ),
+    SunflowAnalyticsSensorEntityDescription(
+        key="battery_estimated_capacity",
+        name="Battery Estimated Capacity",
+        endpoint=ENDPOINT_BATTERY_HEALTH,
+        native_unit_of_measurement="kWh",
+        device_class=SensorDeviceClass.ENERGY_STORAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda health: _positive(health.get("latestCapacityEst")),
+    ),
+    SunflowAnalyticsSensorEntityDescription(
+        key="battery_efficiency",
+        name="Battery Efficiency",
+        endpoint=ENDPOINT_BATTERY_HEALTH,
+        native_unit_of_measurement="%",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda health: _positive(health.get("averageEfficiency")),
+    ),
+    # Fixed tariff vs. aWATTar for the current month. Opt-in: each refresh makes the server
+    # query aWATTar, and the comparison only applies to DE/AT.
+    SunflowAnalyticsSensorEntityDescription(
+        key="fixed_tariff_cost_month",
+        name="Fixed Tariff Net Cost This Month",
+        endpoint=ENDPOINT_TARIFF_COMPARE,
+        value_fn=lambda compare: _tariff_net(compare, "fixed"),
+        last_reset_fn=_start_of_month,
+        entity_registry_enabled_default=False,
+        **_MONETARY_SENSOR_DEFAULTS,
+    ),
+    SunflowAnalyticsSensorEntityDescription(
+        key="dynamic_tariff_cost_month",
+        name="Dynamic Tariff Net Cost This Month",
+        endpoint=ENDPOINT_TARIFF_COMPARE,
+        value_fn=lambda compare: _tariff_net(compare, "dynamic"),
+        last_reset_fn=_start_of_month,
+        entity_registry_enabled_default=False,
+        **_MONETARY_SENSOR_DEFAULTS,
+    ),
+    SunflowAnalyticsSensorEntityDescription(
+        key="dynamic_tariff_savings_month",
+        name="Dynamic Tariff Savings This Month",
+        endpoint=ENDPOINT_TARIFF_COMPARE,
+        value_fn=_tariff_savings,
+        attributes_fn=_tariff_attributes,
+        last_reset_fn=_start_of_month,
+        entity_registry_enabled_default=False,
+        **_MONETARY_SENSOR_DEFAULTS,
+    ),
+)
+
+
+# Hours covered by the hourly forecast attribute.
+FORECAST_ATTRIBUTE_HOURS = 24
+# "Best PV window": the sunniest BEST_PV_WINDOW-long slot within the next BEST_PV_WINDOW_HORIZON.
+BEST_PV_WINDOW = timedelta(hours=2)
+BEST_PV_WINDOW_HORIZON = timedelta(hours=12)
+
+
+def _ts(now: datetime) -> float:
+    return now.timestamp()
+
+
+def _local_day(now: datetime, offset_days: int) -> tuple[float, float]:
+    start = dt_util.start_of_local_day(dt_util.as_local(now)) + timedelta(days=offset_days)
+    return start.timestamp(), (start + timedelta(days=1)).timestamp()
+
+
+def _kwh(value: float | None) -> float | None:
+    return round(value, 3) if value is not None else None
+
+
+def _forecast_power(series: ForecastSeries, now: datetime) -> float | None:
+    kw = series.power_kw(_ts(now))
+    return round(kw * 1000) if kw is not None else None
+
+
+def _forecast_hourly(series: ForecastSeries, now: datetime) -> dict[str, Any]:
+    # Buckets start on the hour, so the attribute only changes when the hour (or forecast) does.
+    hour = dt_util.as_local(now).replace(minute=0, second=0, microsecond=0)
+    return {"forecast": series.hourly(hour, FORECAST_ATTRIBUTE_HOURS)}
+
+
+def _best_window(series: ForecastSeries, now: datetime) -> tuple[float, float] | None:
+    length = BEST_PV_WINDOW.total_seconds()
+    return series.best_window(_ts(now), _ts(now + BEST_PV_WINDOW_HORIZON), length)
+
+
+def _best_window_start(series: ForecastSeries, now: datetime) -> datetime | None:
+    best = _best_window(series, now)
+    return dt_util.utc_from_timestamp(best[0]) if best is not None else None
+
+
+def _best_window_attributes(series: ForecastSeries, now: datetime) -> dict[str, Any]:
+    best = _best_window(series, now)
+    if best is None:
+        return {}
+    end = dt_util.utc_from_timestamp(best[0] + BEST_PV_WINDOW.total_seconds())
+    return {"end": end.isoformat(), "energy": round(best[1], 3)}
+
+
+_FORECAST_ENERGY_DEFAULTS = {
+    "native_unit_of_measurement": "kWh",
+    "device_class": SensorDeviceClass.ENERGY,
+    "suggested_display_precision": 2,
+}
+
+# Computed from the cached forecast (SunflowForecastCoordinator) on every realtime tick.
+# No state_class: a forecast must not end up in long-term statistics next to measured energy.
+FORECAST_SENSORS: tuple[SunflowForecastSensorEntityDescription, ...] = (
+    SunflowForecastSensorEntityDescription(
+        key="pv_forecast_power",
+        name="PV Forecast Power",
+        native_unit_of_measurement="W",
+        device_class=SensorDeviceClass.POWER,
+        value_fn=_forecast_power,
+    ),
+    SunflowForecastSensorEntityDescription(
+        key="pv_forecast_next_hour",
+        name="PV Forecast Next Hour",
+        value_fn=lambda series, now: _kwh(series.energy_kwh(_ts(now), _ts(now + timedelta(hours=1)))),
+        attributes_fn=_forecast_hourly,
+        **_FORECAST_ENERGY_DEFAULTS,
+    ),
+    SunflowForecastSensorEntityDescription(
+        key="pv_forecast_remaining_today",
+        name="PV Forecast Remaining Today",
+        value_fn=lambda series, now: _kwh(series.energy_kwh(_ts(now), _local_day(now, 0)[1])),
+        **_FORECAST_ENERGY_DEFAULTS,
+    ),
+    SunflowForecastSensorEntityDescription(
+        key="pv_forecast_tomorrow",
+        name="PV Forecast Tomorrow",
+        value_fn=lambda series, now: _kwh(series.energy_kwh(*_local_day(now, 1))),
+        **_FORECAST_ENERGY_DEFAULTS,
+    ),
+    SunflowForecastSensorEntityDescription(
+        key="pv_best_window_start",
+        name="Best PV Window Start",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=_best_window_start,
+        attributes_fn=_best_window_attributes,
+    ),
+)
+
+
+def _realtime_window(metrics: SunflowMetrics, window: str) -> RollingWindow | None:
+    endpoint = metrics.endpoints.get(ENDPOINT_PATHS[ENDPOINT_REALTIME])
+    return getattr(endpoint, window) if endpoint is not None else None
+
+
+def _percentile(window: RollingWindow | None, pct: float, scale: float = 1.0) -> float | None:
+    value = window.percentile(pct) if window is not None else None
+    return round(value * scale, 1) if value is not None else None
+
+
+_METRIC_SENSOR_DEFAULTS = {
+    "entity_category": EntityCategory.DIAGNOSTIC,
+    "entity_registry_enabled_default": False,
+}
+
+# Polling instrumentation (see metrics.SunflowMetrics); the full breakdown is in diagnostics.
+METRIC_SENSORS: tuple[SunflowMetricSensorEntityDescription, ...] = (
+    SunflowMetricSensorEntityDescription(
+        key="realtime_latency_p95",
+        name="Realtime Latency p95",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda m: _percentile(_realtime_window(m, "latency"), 95, scale=1000),
+        **_METRIC_SENSOR_DEFAULTS,
+    ),
+    SunflowMetricSensorEntityDescription(
+        key="realtime_payload_size",
+        name="Realtime Payload Size",
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda m: _percentile(_realtime_window(m, "payload_bytes"), 50),
+        **_METRIC_SENSOR_DEFAULTS,
+    ),
+    SunflowMetricSensorEntityDescription(
+        key="refresh_duration_p95",
+        name="Refresh Duration p95",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda m: _percentile(m.refresh_duration, 95, scale=1000),
+        **_METRIC_SENSOR_DEFAULTS,
+    ),
+    SunflowMetricSensorEntityDescription(
+        key="refresh_overruns",
+        name="Refresh Overruns",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda m: m.refresh_overruns,
+        **_METRIC_SENSOR_DEFAULTS,
+    ),
+    SunflowMetricSensorEntityDescription(
+        key="failure_streak",
+        name="Consecutive Failures",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda m: m.failure_streak,
+        **_METRIC_SENSOR_DEFAULTS,
+    ),
+    SunflowMetricSensorEntityDescription(
+        key="cache_hit_ratio",
+        name="Cache Hit Ratio",
+        native_unit_of_measurement="%",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda m: m.cache_hit_ratio(),
+        **_METRIC_SENSOR_DEFAULTS,
+    ),
+)
+
+
+# Supervisor /addons/<slug>/stats (AddonStatsCoordinator); only created for add-on entries.
+ADDON_STATS_SENSORS: tuple[SunflowAddonStatsSensorEntityDescription, ...] = (
+    SunflowAddonStatsSensorEntityDescription(
+        key="addon_cpu_percent",
+        name="Add-on CPU",
+        native_unit_of_measurement="%",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        value_fn=lambda stats: _number(stats.get("cpu_percent")),
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    SunflowAddonStatsSensorEntityDescription(
+        key="addon_memory_percent",
+        name="Add-on Memory",
+        native_unit_of_measurement="%",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        value_fn=lambda stats: _number(stats.get("memory_percent")),
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    SunflowAddonStatsSensorEntityDescription(
+        key="addon_memory_usage",
+        name="Add-on Memory Used",
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        suggested_unit_of_measurement=UnitOfInformation.MEBIBYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda stats: _number(stats.get("memory_usage")),
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    SunflowAddonStatsSensorEntityDescription(
+        key="addon_network_rx",
+        name="Add-on Network Received",
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        suggested_unit_of_measurement=UnitOfInformation.MEBIBYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda stats: _number(stats.get("network_rx")),
+        **_METRIC_SENSOR_DEFAULTS,
+    ),
+    SunflowAddonStatsSensorEntityDescription(
+        key="addon_network_tx",
+        name="Add-on Network Sent",
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        suggested_unit_of_measurement=UnitOfInformation.MEBIBYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda stats: _number(stats.get("network_tx")),
+        **_METRIC_SENSOR_DEFAULTS,
+    ),
+)
+
+
+class SunflowRealtimeSensor(_SunflowBaseSensor):
+    entity_description: SunflowRealtimeSensorEntityDescription
+    _unrecorded_attributes = frozenset({"last_live_update"})
+    _publish_relative_deadband = True
+
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator,
+        entry: ConfigEntry,
+        description: SunflowRealtimeSensorEntityDescription,
+    ) -> None:
         super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_sunflow_pv_power"
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_sunflow_{description.key}"
+        # The W deadband only makes sense for power; SoC changes are published as they come.
+        self._publish_absolute_deadband = description.device_class == SensorDeviceClass.POWER
+        # Local day of the last nonzero value, for day counters.
+        self._nonzero_day = None
+
+    def _publish_policy(self) -> PublishPolicy | None:
+        return self.coordinator.publish_policy
 
     @property
     def native_value(self):
-        p = (self.coordinator.data.get("realtime") or {}).get("power") or {}
-        return p.get("pv")
+        state = self.coordinator.data.get(DATA_REALTIME_STATE)
+        if state is None:
+            return None
+        value = self.entity_description.value_fn(state)
+        if self.entity_description.day_counter and value is not None:
+            today = dt_util.now().date()
+            if value:
+                self._nonzero_day = today
+            elif self._nonzero_day == today:
+                return None
+        return value
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        return _live_attributes(self.coordinator)
 
-class SunflowLoadPowerSensor(_SunflowBaseSensor):
-    _attr_name = "Load Power"
-    _attr_native_unit_of_measurement = "W"
-    _attr_device_class = SensorDeviceClass.POWER
-    _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def __init__(self, coordinator: DataUpdateCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_sunflow_load_power"
+class SunflowDerivedSensor(SunflowRealtimeSensor):
+    entity_description: SunflowDerivedSensorEntityDescription
 
     @property
     def native_value(self):
-        p = (self.coordinator.data.get("realtime") or {}).get("power") or {}
-        return p.get("load")
+        derived = self.coordinator.data.get(DATA_DERIVED)
+        if derived is None:
+            return None
+        return self.entity_description.value_fn(derived)
 
 
-class SunflowGridPowerSensor(_SunflowBaseSensor):
-    _attr_name = "Grid Power"
-    _attr_native_unit_of_measurement = "W"
-    _attr_device_class = SensorDeviceClass.POWER
-    _attr_state_class = SensorStateClass.MEASUREMENT
+class SunflowEnergySensor(_SunflowBaseSensor, RestoreSensor):
+    # Integrated in-process from realtime power (see energy.EnergyIntegrator),
+    # so no Riemann-sum helper entities are needed.
+    entity_description: SunflowEnergySensorEntityDescription
+    _unrecorded_attributes = frozenset({"last_live_update"})
 
-    def __init__(self, coordinator: DataUpdateCoordinator, entry: ConfigEntry) -> None:
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator,
+        entry: ConfigEntry,
+        description: SunflowEnergySensorEntityDescription,
+    ) -> None:
         super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_sunflow_grid_power"
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_sunflow_{description.key}"
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        last = await self.async_get_last_sensor_data()
+        if last is None or last.native_value is None:
+            return
+        try:
+            self.coordinator.energy.restore(self.entity_description.flow, float(last.native_value))
+        except (TypeError, ValueError):
+            return
+
+    def _publish_policy(self) -> PublishPolicy | None:
+        # Totals only rise, so deadbands don't apply; the minimum interval and heartbeat do.
+        return self.coordinator.publish_policy
 
     @property
     def native_value(self):
-        p = (self.coordinator.data.get("realtime") or {}).get("power") or {}
-        return p.get("grid")
+        # Published with the realtime updates; an unchanged payload (no listener update)
+        # is still integrated and shows up with the next change.
+        if self.coordinator.data.get(DATA_REALTIME_STATE) is None:
+            return None
+        return round(self.coordinator.energy.total_kwh(self.entity_description.flow), 3)
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        return _live_attributes(self.coordinator)
 
-class _SunflowBatteryPowerBase(_SunflowBaseSensor):
-    _attr_native_unit_of_measurement = "W"
-    _attr_device_class = SensorDeviceClass.POWER
-    _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def _get_battery_power_w(self) -> float | None:
-        p = (self.coordinator.data.get("realtime") or {}).get("power") or {}
-        val = p.get("battery")
-        if val is None:
-            return None
-        try:
-            return float(val)
-        except (TypeError, ValueError):
+class SunflowRollingSensor(_SunflowBaseSensor):
+    entity_description: SunflowRollingSensorEntityDescription
+    _unrecorded_attributes = frozenset({"samples"})
+    _publish_absolute_deadband = True
+    _publish_relative_deadband = True
+
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator,
+        entry: ConfigEntry,
+        description: SunflowRollingSensorEntityDescription,
+    ) -> None:
+        super().__init__(coordinator, entry)
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_sunflow_{description.key}"
+
+    def _publish_policy(self) -> PublishPolicy | None:
+        return self.coordinator.publish_policy
+
+    def _stats(self) -> dict[str, float] | None:
+        return self.coordinator.rolling.stats(self.entity_description.field, self.entity_description.window_seconds)
+
+    @property
+    def native_value(self):
+        stats = self._stats()
+        return stats["mean"] if stats is not None else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        stats = self._stats()
+        if stats is None:
             return None
+        return {"min": stats["min"], "max": stats["max"], "samples": stats["samples"]}
 
 
-class SunflowBatteryPowerSensor(_SunflowBatteryPowerBase):
-    _attr_name = "Battery Power"
+class SunflowMetricSensor(_SunflowBaseSensor):
+    entity_description: SunflowMetricSensorEntityDescription
 
-    def __init__(self, coordinator: DataUpdateCoordinator, entry: ConfigEntry) -> None:
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator,
+        entry: ConfigEntry,
+        description: SunflowMetricSensorEntityDescription,
+    ) -> None:
         super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_sunflow_battery_power"
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_sunflow_{description.key}"
+
+    @property
+    def available(self) -> bool:
+        # Stays available during outages; the failure streak is most useful then.
+        return True
 
     @property
     def native_value(self):
-        # Convention (Sunflow UI):
-        #  - positive = discharging (battery -> load/grid)
-        #  - negative = charging (pv/grid -> battery)
-        return self._get_battery_power_w()
+        return self.entity_description.value_fn(self.coordinator.client.metrics)
 
 
-class SunflowBatteryChargePowerSensor(_SunflowBatteryPowerBase):
-    _attr_name = "Battery Charge Power"
+class SunflowAnalyticsSensor(_SunflowBaseSensor):
+    entity_description: SunflowAnalyticsSensorEntityDescription
+    _unrecorded_attributes = frozenset({"daily"})
 
-    def __init__(self, coordinator: DataUpdateCoordinator, entry: ConfigEntry) -> None:
+    def __init__(
+        self,
+        coordinator: SunflowAnalyticsCoordinator,
+        entry: ConfigEntry,
+        description: SunflowAnalyticsSensorEntityDescription,
+        currency: str,
+    ) -> None:
         super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_sunflow_battery_charge_power"
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_sunflow_{description.key}"
+        if description.device_class == SensorDeviceClass.MONETARY:
+            # Use HA's currency rather than pulling Sunflow's full /api/config (which may hold secrets).
+            self._attr_native_unit_of_measurement = currency
 
     @property
     def native_value(self):
-        p = self._get_battery_power_w()
-        if p is None:
+        payload = (self.coordinator.data or {}).get(self.entity_description.endpoint)
+        if not isinstance(payload, dict):
             return None
-        if p < 0:
-            return abs(p)
-        return 0
+        return self.entity_description.value_fn(payload)
 
+    @property
+    def last_reset(self) -> datetime | None:
+        if self.entity_description.last_reset_fn is None:
+            return None
+        return self.entity_description.last_reset_fn()
 
-class SunflowBatteryDischargePowerSensor(_SunflowBatteryPowerBase):
-    _attr_name = "Battery Discharge Power"
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        # Disabled sensors never get here, so their endpoint isn't fetched.
+        self.async_on_remove(self.coordinator.async_want(self.entity_description.endpoint))
 
-    def __init__(self, coordinator: DataUpdateCoordinator, entry: ConfigEntry) -> None:
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        payload = (self.coordinator.data or {}).get(self.entity_description.endpoint)
+        if self.entity_description.attributes_fn is None or not isinstance(payload, dict):
+            return None
+        return self.entity_description.attributes_fn(payload)
+
+
+class SunflowForecastSensor(_SunflowBaseSensor):
+    entity_description: SunflowForecastSensorEntityDescription
+    _unrecorded_attributes = frozenset({"forecast"})
+
+    def __init__(
+        self,
+        coordinator: SunflowForecastCoordinator,
+        realtime: DataUpdateCoordinator,
+        entry: ConfigEntry,
+        description: SunflowForecastSensorEntityDescription,
+    ) -> None:
         super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_sunflow_battery_discharge_power"
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_sunflow_{description.key}"
+        self._realtime = realtime
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.async_want(ENDPOINT_FORECAST))
+        # Re-evaluated on every realtime tick; the forecast itself is only fetched per update.
+        self.async_on_remove(self._realtime.async_add_listener(self._handle_coordinator_update))
+
+    @property
+    def _series(self) -> ForecastSeries | None:
+        return (self.coordinator.data or {}).get(DATA_FORECAST_SERIES)
+
+    @property
+    def available(self) -> bool:
+        return super().available and self._series is not None
 
     @property
     def native_value(self):
-        p = self._get_battery_power_w()
-        if p is None:
+        series = self._series
+        if series is None:
+            return None
+        return self.entity_description.value_fn(series, dt_util.utcnow())
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        series = self._series
+        if self.entity_description.attributes_fn is None or series is None:
             return None
-        if p > 0:
-            return p
-        return 0
+        return self.entity_description.attributes_fn(series, dt_util.utcnow())
 
 
-class SunflowBatterySocSensor(_SunflowBaseSensor):
-    _attr_name = "Battery SoC"
-    _attr_native_unit_of_measurement = "%"
+class SunflowAddonStatsSensor(_SunflowBaseSensor):
+    entity_description: SunflowAddonStatsSensorEntityDescription
 
-    def __init__(self, coordinator: DataUpdateCoordinator, entry: ConfigEntry) -> None:
+    def __init__(
+        self,
+        coordinator: AddonStatsCoordinator,
+        entry: ConfigEntry,
+        description: SunflowAddonStatsSensorEntityDescription,
+    ) -> None:
         super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_sunflow_battery_soc"
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_sunflow_{description.key}"
 
     @property
     def native_value(self):
-        b = (self.coordinator.data.get("realtime") or {}).get("battery") or {}
-        return b.get("soc")
+        stats = self.coordinator.data
+        if not isinstance(stats, dict):
+            return None
+        return self.entity_description.value_fn(stats)
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        # Disabled sensors never get here, so without an enabled one nothing is fetched.
+        # The first one fetches right away instead of after a full interval; the debouncer
+        # folds the other stats sensors' requests into that refresh.
+        if self.coordinator.data is None:
+            await self.coordinator.async_request_refresh()
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+
+from aiohttp import ClientError
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .api import SunflowCircuitOpen, SunflowClient
+from .const import DOMAIN
+
+SERVICE_GET_ENERGY_HISTORY = "get_energy_history"
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_START = "start"
+ATTR_END = "end"
+ATTR_RESOLUTION = "resolution"
+
+DEFAULT_HISTORY_RESOLUTION = timedelta(minutes=15)
+# Sunflow logs about one row per minute; finer buckets would mostly be empty.
+MIN_HISTORY_RESOLUTION = timedelta(minutes=1)
+# Bounds the response size (and the bucket arrays); e.g. one year at hourly resolution.
+MAX_HISTORY_BUCKETS = 10_000
+
+GET_ENERGY_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_START): cv.datetime,
+        vol.Required(ATTR_END): cv.datetime,
+        vol.Optional(ATTR_RESOLUTION, default=DEFAULT_HISTORY_RESOLUTION): cv.time_period,
+    }
+)
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_ENERGY_HISTORY,
+        _async_get_energy_history,
+        schema=GET_ENERGY_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+def _to_server_time(value: datetime) -> datetime:
+    # Server timestamps are naive local time; assume the add-on shares HA's time zone.
+    if value.tzinfo is None:
+        return value
+    return dt_util.as_local(value).replace(tzinfo=None)
+
+
+async def _async_get_energy_history(call: ServiceCall) -> ServiceResponse:
+    """Average power per flow in fixed buckets, downsampled while the rows stream in."""
+    entry_data = call.hass.data.get(DOMAIN, {}).get(call.data[ATTR_CONFIG_ENTRY_ID])
+    client: SunflowClient | None = entry_data.get("client") if isinstance(entry_data, dict) else None
+    if client is None:
+        raise ServiceValidationError("Sunflow entry not found or not loaded")
+
+    start = _to_server_time(call.data[ATTR_START])
+    end = _to_server_time(call.data[ATTR_END])
+    resolution: timedelta = call.data[ATTR_RESOLUTION]
+    if end <= start:
+        raise ServiceValidationError("end must be after start")
+    if resolution < MIN_HISTORY_RESOLUTION:
+        raise ServiceValidationError(f"resolution must be at least {MIN_HISTORY_RESOLUTION}")
+    if (end - start) / resolution > MAX_HISTORY_BUCKETS:
+        raise ServiceValidationError(f"At most {MAX_HISTORY_BUCKETS} buckets; use a coarser resolution")
+
+    try:
+        buckets = await client.get_energy_range(start, end, resolution)
+    except (ClientError, asyncio.TimeoutError, SunflowCircuitOpen, ValueError) as err:
+        raise HomeAssistantError(f"Fetching Sunflow history failed: {err}") from err
+
+    return {
+        "resolution": resolution.total_seconds(),
+        "energy": buckets.energy_kwh(),
+        "buckets": [
+            {**row, "start": row["start"].replace(tzinfo=dt_util.DEFAULT_TIME_ZONE).isoformat()}
+            for row in buckets.as_rows()
+        ],
+    }
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from dataclasses import asdict
+from datetime import timedelta
+import logging
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .api import ENDPOINT_FORECAST, ENDPOINT_INFO, ENDPOINT_REALTIME, SunflowSystemInfo
+from .const import DOMAIN
+from .coordinator import SunflowAnalyticsCoordinator, SunflowDataUpdateCoordinator, SunflowForecastCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+# Same cadence as HA's own restore-state dump; the snapshot is also written on shutdown.
+SNAPSHOT_SAVE_INTERVAL = timedelta(minutes=15)
+
+
+def _info_from_dict(value: Any) -> SunflowSystemInfo | None:
+    if not isinstance(value, dict):
+        return None
+    try:
+        return SunflowSystemInfo(**{**value, "capabilities": tuple(value.get("capabilities") or ())})
+    except TypeError:
+        return None
+
+
+class SunflowSnapshotStore:
+    """Persist the last live data so entities can be created from it on the next start.
+
+    Holds the info and realtime payloads plus the analytics and forecast payloads. Restoring
+    it lets setup skip the blocking first refresh, so a Sunflow add-on that starts after HA
+    Core doesn't fail the entry with ConfigEntryNotReady retries.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        coordinator: SunflowDataUpdateCoordinator,
+        analytics: SunflowAnalyticsCoordinator,
+        forecast: SunflowForecastCoordinator,
+    ) -> None:
+        self._hass = hass
+        self._coordinator = coordinator
+        self._analytics = analytics
+        self._forecast = forecast
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, f"{DOMAIN}.snapshot.{entry.entry_id}")
+        self._saved: dict[str, Any] | None = None
+
+    async def async_restore(self) -> bool:
+        """Load the snapshot into the coordinators; False when there is no usable snapshot."""
+        try:
+            snapshot = await self._store.async_load()
+        except Exception as err:
+            _LOGGER.debug("Ignoring unreadable Sunflow snapshot: %s", err)
+            return False
+        if not isinstance(snapshot, dict):
+            return False
+        if not self._coordinator.async_restore(
+            _info_from_dict(snapshot.get(ENDPOINT_INFO)), snapshot.get(ENDPOINT_REALTIME)
+        ):
+            return False
+        self._analytics.async_restore(snapshot.get("analytics"))
+        self._forecast.async_restore({ENDPOINT_FORECAST: snapshot.get(ENDPOINT_FORECAST)})
+        self._saved = {key: value for key, value in snapshot.items() if key != "saved_at"}
+        _LOGGER.debug("Restored Sunflow snapshot from %s", snapshot.get("saved_at"))
+        return True
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Save periodically and on shutdown; returns the callback that stops it."""
+        unsubs = [
+            async_track_time_interval(self._hass, self.async_save, SNAPSHOT_SAVE_INTERVAL),
+            self._hass.bus.async_listen(EVENT_HOMEASSISTANT_STOP, self.async_save),
+        ]
+
+        @callback
+        def _stop() -> None:
+            for unsub in unsubs:
+                unsub()
+
+        return _stop
+
+    def _snapshot(self) -> dict[str, Any] | None:
+        coordinator = self._coordinator
+        if coordinator.restored or not coordinator.data:
+            # Nothing new since the last start.
+            return None
+        info = coordinator.data.get(ENDPOINT_INFO)
+        return {
+            ENDPOINT_INFO: asdict(info) if isinstance(info, SunflowSystemInfo) else None,
+            ENDPOINT_REALTIME: coordinator.data.get(ENDPOINT_REALTIME),
+            "analytics": dict(self._analytics.data or {}),
+            ENDPOINT_FORECAST: (self._forecast.data or {}).get(ENDPOINT_FORECAST),
+        }
+
+    async def async_save(self, *_: Event | Any) -> None:
+        snapshot = self._snapshot()
+        if snapshot is None or snapshot == self._saved:
+            return
+        await self._store.async_save({**snapshot, "saved_at": dt_util.utcnow().isoformat()})
+        self._saved = snapshot
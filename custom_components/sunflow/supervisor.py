@@ -1,14 +1,54 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+import logging
 import os
-from typing import Any
+import time
+from typing import TYPE_CHECKING, Any, TypeVar
 
+from aiohttp import ClientConnectionError, ClientTimeout
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .api import SunflowCircuitOpen, SunflowClient
+from .const import ADDON_SLUG, CONF_BASE_URL, DEFAULT_LOCAL_ADDON_PORT, DOMAIN
+
+if TYPE_CHECKING:
+    from .coordinator import SunflowDataUpdateCoordinator
 
-from .const import ADDON_SLUG
+_LOGGER = logging.getLogger(__name__)
 
 SUPERVISOR_BASE_URL = "http://supervisor"
 
+# Short-lived caches (hass.data[DOMAIN][DATA_SUPERVISOR_CACHE]) so repeated config flows
+# and re-setups don't re-query the Supervisor or re-probe every hostname.
+DATA_SUPERVISOR_CACHE = "supervisor_cache"
+ADDONS_CACHE_TTL_SECONDS = 60
+ENDPOINT_CACHE_TTL_SECONDS = 10 * 60
+
+# Per-candidate timeout when probing add-on base URLs; unresolvable hostnames
+# should not hold up discovery.
+DISCOVERY_PROBE_TIMEOUT_SECONDS = 3
+
+# Add-on entries re-run discovery after this many consecutive connection failures,
+# at most once per REDISCOVER_MIN_INTERVAL_SECONDS.
+ADDON_UNIQUE_ID_PREFIX = "addon:"
+REDISCOVER_AFTER_FAILURES = 3
+REDISCOVER_MIN_INTERVAL_SECONDS = 60
+
+# Add-on resource stats (CPU, memory, network) are polled on this slow cadence; while the
+# Supervisor is unavailable the interval doubles per failure up to the maximum.
+ADDON_STATS_INTERVAL = timedelta(minutes=1)
+ADDON_STATS_MAX_INTERVAL = timedelta(minutes=15)
+SUPERVISOR_REQUEST_TIMEOUT_SECONDS = 10
+
+_T = TypeVar("_T")
+
 
 def _supervisor_token() -> str | None:
     return os.environ.get("SUPERVISOR_TOKEN")
@@ -36,8 +76,27 @@ async def async_is_supervised(hass) -> bool:
         return False
 
 
+def _cache(hass) -> dict[str, Any]:
+    return hass.data.setdefault(DOMAIN, {}).setdefault(DATA_SUPERVISOR_CACHE, {})
+
+
+def _cache_get(hass, key: str, ttl: float) -> Any:
+    cached = _cache(hass).get(key)
+    if cached is None or time.monotonic() - cached[0] > ttl:
+        return None
+    return cached[1]
+
+
+def _cache_set(hass, key: str, value: Any) -> None:
+    _cache(hass)[key] = (time.monotonic(), value)
+
+
 async def async_get_addons(hass) -> list[dict[str, Any]]:
-    """Return the Supervisor add-ons list."""
+    """Return the Supervisor add-ons list (cached for ADDONS_CACHE_TTL_SECONDS)."""
+    cached = _cache_get(hass, "addons", ADDONS_CACHE_TTL_SECONDS)
+    if cached is not None:
+        return cached
+
     session = async_get_clientsession(hass)
     async with session.get(f"{SUPERVISOR_BASE_URL}/addons", headers=_auth_headers()) as resp:
         resp.raise_for_status()
@@ -46,8 +105,10 @@ async def async_get_addons(hass) -> list[dict[str, Any]]:
     data = payload.get("data") or {}
     addons = data.get("addons") or []
     if not isinstance(addons, list):
-        return []
-    return [a for a in addons if isinstance(a, dict)]
+        addons = []
+    addons = [a for a in addons if isinstance(a, dict)]
+    _cache_set(hass, "addons", addons)
+    return addons
 
 
 def _is_sunflow_addon(addon: dict[str, Any], slug_hint: str = ADDON_SLUG) -> bool:
@@ -92,3 +153,252 @@ async def async_get_addon_info(hass, addon_slug: str) -> dict[str, Any]:
     if not isinstance(data, dict):
         return {}
     return data
+
+
+async def async_get_addon_stats(hass, addon_slug: str) -> dict[str, Any]:
+    """Return Supervisor /addons/<addon>/stats payload data (CPU, memory, network, block I/O)."""
+    session = async_get_clientsession(hass)
+    async with session.get(
+        f"{SUPERVISOR_BASE_URL}/addons/{addon_slug}/stats",
+        headers=_auth_headers(),
+        timeout=ClientTimeout(total=SUPERVISOR_REQUEST_TIMEOUT_SECONDS),
+    ) as resp:
+        resp.raise_for_status()
+        payload = await resp.json()
+
+    data = payload.get("data") or {}
+    if not isinstance(data, dict):
+        return {}
+    return data
+
+
+def addon_candidate_urls(addon_slug: str) -> list[str]:
+    """Base URLs the add-on may be reachable at from HA Core, most likely first."""
+    # On HA OS / Supervised, add-ons are reachable from HA Core via Docker DNS.
+    # Unfortunately the exact hostname can vary between installations.
+    # Try a small set of known-good patterns.
+    slug_tail = addon_slug.split("_")[-1] if addon_slug else ""
+    candidates: list[str] = []
+
+    def _add_candidate(host: str) -> None:
+        h = (host or "").strip()
+        if not h:
+            return
+        url = f"http://{h}:{DEFAULT_LOCAL_ADDON_PORT}"
+        if url not in candidates:
+            candidates.append(url)
+
+    # Common patterns:
+    # - <full_slug>:3000 (e.g. a0d7b954_sunflow)
+    # - addon_<full_slug>:3000
+    # - <slug_tail>:3000 (e.g. sunflow)
+    # - addon_<slug_tail>:3000
+    _add_candidate(addon_slug)
+    _add_candidate(f"addon_{addon_slug}")
+    if slug_tail and slug_tail != addon_slug:
+        _add_candidate(slug_tail)
+        _add_candidate(f"addon_{slug_tail}")
+    return candidates
+
+
+async def async_probe_first(
+    candidates: list[str] | asyncio.Queue[str | None],
+    probe: Callable[[str], Awaitable[_T]],
+    timeout: float = DISCOVERY_PROBE_TIMEOUT_SECONDS,
+) -> tuple[str, _T]:
+    """Probe all candidate base URLs concurrently and return the first healthy (url, result).
+
+    The remaining probes are cancelled as soon as one succeeds. `candidates` may also be a
+    queue, for candidates that only become known while probing (None ends the queue).
+    If every probe fails, the most relevant error is raised (an HTTP error over a network one).
+    """
+    pending: dict[asyncio.Task, str] = {}
+    queue_task: asyncio.Task | None = None
+    queue = candidates if isinstance(candidates, asyncio.Queue) else None
+    seen: set[str] = set()
+    errors: list[Exception] = []
+
+    def _start(url: str) -> None:
+        if url in seen:
+            return
+        seen.add(url)
+        pending[asyncio.create_task(asyncio.wait_for(probe(url), timeout))] = url
+
+    if queue is None:
+        for url in candidates:
+            _start(url)
+    else:
+        queue_task = asyncio.create_task(queue.get())
+
+    try:
+        while pending or queue_task is not None:
+            waiting: set[asyncio.Task] = set(pending)
+            if queue_task is not None:
+                waiting.add(queue_task)
+            done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+
+            if queue_task in done:
+                url = queue_task.result()
+                if url is None:
+                    queue_task = None
+                else:
+                    _start(url)
+                    queue_task = asyncio.create_task(queue.get())
+
+            for task in done:
+                if task is queue_task or task not in pending:
+                    continue
+                url = pending.pop(task)
+                if task.exception() is None:
+                    return url, task.result()
+                errors.append(task.exception())
+    finally:
+        for task in pending:
+            task.cancel()
+        if queue_task is not None:
+            queue_task.cancel()
+
+    # Prefer errors where the server answered (e.g. 401) over unreachable hosts.
+    for err in errors:
+        if getattr(err, "status", None) is not None:
+            raise err
+    if errors:
+        raise errors[-1]
+    raise RuntimeError("No add-on endpoint candidates")
+
+
+async def async_discover_addon_base_url(
+    hass, addon_slug: str, probe: Callable[[str], Awaitable[_T]]
+) -> tuple[str, _T]:
+    """Find the add-on base URL that answers `probe`.
+
+    Tries the recently discovered URL first; otherwise probes the Docker DNS candidates and
+    the Supervisor-reported IP address concurrently (the IP is added once the add-on info
+    arrives) and caches the winner for ENDPOINT_CACHE_TTL_SECONDS.
+    """
+    cache_key = f"endpoint:{addon_slug}"
+    cached_url = _cache_get(hass, cache_key, ENDPOINT_CACHE_TTL_SECONDS)
+    if cached_url is not None:
+        try:
+            return cached_url, await asyncio.wait_for(probe(cached_url), DISCOVERY_PROBE_TIMEOUT_SECONDS)
+        except Exception:
+            _cache(hass).pop(cache_key, None)
+
+    queue: asyncio.Queue[str | None] = asyncio.Queue()
+    for url in addon_candidate_urls(addon_slug):
+        queue.put_nowait(url)
+
+    async def _add_supervisor_ip() -> None:
+        # Fallback: use Supervisor info (IP address) when available.
+        try:
+            addon_info = await async_get_addon_info(hass, addon_slug)
+            ip_address = addon_info.get("ip_address")
+            if isinstance(ip_address, str) and ip_address.strip():
+                queue.put_nowait(f"http://{ip_address.strip()}:{DEFAULT_LOCAL_ADDON_PORT}")
+        except Exception:
+            pass
+        finally:
+            queue.put_nowait(None)
+
+    info_task = asyncio.create_task(_add_supervisor_ip())
+    try:
+        url, result = await async_probe_first(queue, probe)
+    finally:
+        info_task.cancel()
+
+    _cache_set(hass, cache_key, url)
+    return url, result
+
+
+def _is_connection_failure(err: BaseException) -> bool:
+    return isinstance(err, (ClientConnectionError, asyncio.TimeoutError, SunflowCircuitOpen))
+
+
+class AddonEndpointResolver:
+    """Re-discover the add-on base URL when it stops answering (e.g. new Docker IP after a rebuild).
+
+    On success the client is repointed in place and the new URL is persisted in the entry data,
+    so entities stay up and the next start uses the new URL directly.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, coordinator: SunflowDataUpdateCoordinator) -> None:
+        self._hass = hass
+        self._entry = entry
+        self._coordinator = coordinator
+        self._client: SunflowClient = coordinator.client
+        self._addon_slug = (entry.unique_id or "").removeprefix(ADDON_UNIQUE_ID_PREFIX)
+        self._last_attempt: float | None = None
+        self._task: asyncio.Task | None = None
+
+    @staticmethod
+    def applies_to(entry: ConfigEntry) -> bool:
+        return (entry.unique_id or "").startswith(ADDON_UNIQUE_ID_PREFIX)
+
+    @callback
+    def async_on_failure(self, err: Exception) -> None:
+        """Coordinator failure listener; starts re-discovery in the background when due."""
+        if not _is_connection_failure(err) or self._client.metrics.failure_streak < REDISCOVER_AFTER_FAILURES:
+            return
+        if self._task is not None and not self._task.done():
+            return
+        if self._last_attempt is not None and time.monotonic() - self._last_attempt < REDISCOVER_MIN_INTERVAL_SECONDS:
+            return
+        self._task = self._entry.async_create_background_task(
+            self._hass, self.async_resolve(), f"sunflow_rediscover_{self._entry.entry_id}"
+        )
+
+    async def async_resolve(self) -> bool:
+        """Run discovery now; returns True when the client was moved to a new base URL."""
+        self._last_attempt = time.monotonic()
+        # The cached endpoint is the one that stopped answering.
+        _cache(self._hass).pop(f"endpoint:{self._addon_slug}", None)
+
+        async def _probe(base_url: str):
+            return await self._client.with_base_url(base_url).async_validate()
+
+        try:
+            base_url, _ = await async_discover_addon_base_url(self._hass, self._addon_slug, _probe)
+        except Exception as err:
+            _LOGGER.debug("Sunflow add-on re-discovery found no endpoint: %s", err)
+            return False
+
+        if base_url == self._client.base_url:
+            return False
+
+        _LOGGER.info("Sunflow add-on moved from %s to %s", self._client.base_url, base_url)
+        self._client.set_base_url(base_url)
+        self._hass.config_entries.async_update_entry(self._entry, data={**self._entry.data, CONF_BASE_URL: base_url})
+        if self._coordinator.data is not None:
+            # Recover now instead of on the next scheduled poll.
+            await self._coordinator.async_request_refresh()
+        return True
+
+
+class AddonStatsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    """Resource usage of the Sunflow add-on from the Supervisor, for add-on entries.
+
+    Only polls while a stats entity is enabled (the coordinator schedules refreshes only while
+    it has listeners, and the first enabled entity requests the initial one), every
+    ADDON_STATS_INTERVAL; failures back the interval off exponentially so an unavailable
+    Supervisor isn't hammered.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        self._addon_slug = (entry.unique_id or "").removeprefix(ADDON_UNIQUE_ID_PREFIX)
+        super().__init__(
+            hass,
+            logger=_LOGGER,
+            config_entry=entry,
+            name=f"Sunflow add-on stats ({self._addon_slug})",
+            update_interval=ADDON_STATS_INTERVAL,
+            always_update=False,
+        )
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        try:
+            stats = await async_get_addon_stats(self.hass, self._addon_slug)
+        except Exception as err:
+            self.update_interval = min(self.update_interval * 2, ADDON_STATS_MAX_INTERVAL)
+            raise UpdateFailed(f"Supervisor add-on stats unavailable: {err}") from err
+        self.update_interval = ADDON_STATS_INTERVAL
+        return stats
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: per-tick cost of reading realtime values in the integration's sensors.
+
+Compares the old approach (every sensor walks the raw /api/data dict and parses its
+own value) with decoding the payload once into SunflowRealtime and having sensors do
+attribute lookups. Decoding and reading are timed separately: a tick of the decoded
+path costs one decode plus N attribute reads, a tick of the legacy path N dict walks.
+Timings are the minimum over --repeat runs of timeit; allocations are the tracemalloc
+peak of one tick.
+
+Usage:
+  python scripts/bench_realtime_decode.py [--number 20000] [--repeat 7] [--json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+from pathlib import Path
+import sys
+import timeit
+import tracemalloc
+import types
+
+PACKAGE_DIR = Path(__file__).resolve().parents[1] / "custom_components" / "sunflow"
+
+PAYLOAD = {
+    "power": {"pv": 4210, "load": 830, "grid": -2950, "battery": -430},
+    "battery": {"soc": 57, "state": "charging"},
+    "energy": {"today": {"production": 18.4, "consumption": 0}},
+    "autonomy": 100,
+    "selfConsumption": 30,
+}
+
+
+def _load_api():
+    # Load api.py (and its relative imports) without running the package __init__,
+    # so the benchmark does not need Home Assistant installed.
+    package = types.ModuleType("sunflow_bench")
+    package.__path__ = [str(PACKAGE_DIR)]
+    sys.modules[package.__name__] = package
+    for name in ("metrics", "api"):
+        spec = importlib.util.spec_from_file_location(f"sunflow_bench.{name}", PACKAGE_DIR / f"{name}.py")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module
+        spec.loader.exec_module(module)
+    return module
+
+
+def _legacy_readers(n: int):
+    def pv(data):
+        p = (data.get("realtime") or {}).get("power") or {}
+        return p.get("pv")
+
+    def battery(data):
+        p = (data.get("realtime") or {}).get("power") or {}
+        val = p.get("battery")
+        if val is None:
+            return None
+        try:
+            return float(val)
+        except (TypeError, ValueError):
+            return None
+
+    def soc(data):
+        b = (data.get("realtime") or {}).get("battery") or {}
+        return b.get("soc")
+
+    readers = (pv, battery, soc)
+    return [readers[i % len(readers)] for i in range(n)]
+
+
+def _decoded_readers(n: int):
+    readers = (lambda r: r.pv_power, lambda r: r.battery_power, lambda r: r.battery_soc)
+    return [readers[i % len(readers)] for i in range(n)]
+
+
+def _min_us(func, number: int, repeat: int) -> float:
+    """Best-of-`repeat` time per call in microseconds (the minimum is the least noisy estimate)."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e6
+
+
+def _peak_bytes(func) -> int:
+    func()  # warm up caches and interned objects
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=20000, help="calls per timing run")
+    parser.add_argument("--repeat", type=int, default=7, help="timing runs; the minimum is reported")
+    parser.add_argument("--json", action="store_true", help="print one JSON object per line")
+    args = parser.parse_args()
+
+    api = _load_api()
+    # As held by the coordinator: the raw payload under its endpoint key, decoded once.
+    data = {"realtime": PAYLOAD}
+    state = api.SunflowRealtime.from_payload(PAYLOAD)
+
+    def decode():
+        api.SunflowRealtime.from_payload(PAYLOAD)
+
+    decode_us = _min_us(decode, args.number, args.repeat)
+    decode_peak = _peak_bytes(decode)
+    results = []
+
+    for n in (1, 2, 4, 8, 16, 32, 64, 128):
+        legacy = _legacy_readers(n)
+        decoded = _decoded_readers(n)
+
+        def legacy_read():
+            for read in legacy:
+                read(data)
+
+        def decoded_read():
+            for read in decoded:
+                read(state)
+
+        legacy_us = _min_us(legacy_read, args.number, args.repeat)
+        read_us = _min_us(decoded_read, args.number, args.repeat)
+        results.append(
+            {
+                "sensors": n,
+                "legacy_us_per_tick": round(legacy_us, 2),
+                "decode_us": round(decode_us, 2),
+                "decoded_read_us": round(read_us, 2),
+                "decoded_us_per_tick": round(decode_us + read_us, 2),
+                "legacy_peak_bytes": _peak_bytes(legacy_read),
+                "decoded_peak_bytes": max(decode_peak, _peak_bytes(decoded_read)),
+            }
+        )
+
+    if args.json:
+        for row in results:
+            print(json.dumps(row))
+        return
+
+    print(
+        f"{'sensors':>8} {'legacy us/tick':>15} {'decode us':>10} {'read us':>8} {'decoded us/tick':>16}"
+        f" {'legacy peak B':>14} {'decoded peak B':>15}"
+    )
+    for row in results:
+        print(
+            f"{row['sensors']:>8} {row['legacy_us_per_tick']:>15} {row['decode_us']:>10} {row['decoded_read_us']:>8}"
+            f" {row['decoded_us_per_tick']:>16} {row['legacy_peak_bytes']:>14} {row['decoded_peak_bytes']:>15}"
+        )
+
+
+if __name__ == "__main__":
+    main()
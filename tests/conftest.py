@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+import json
+from pathlib import Path
+import sys
+import types
+from typing import Any
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Import the integration as custom_components.sunflow. The packages are registered without
+# running custom_components/sunflow/__init__.py (HA entry setup), so modules that don't import
+# Home Assistant (api, energy, history, rolling, metrics, forecast) are testable without it.
+# Tests of HA-bound modules importorskip("homeassistant"); CI installs it (requirements_test.txt).
+sys.path.insert(0, str(ROOT))
+for _name, _path in (
+    ("custom_components", ROOT / "custom_components"),
+    ("custom_components.sunflow", ROOT / "custom_components" / "sunflow"),
+):
+    if _name not in sys.modules:
+        _package = types.ModuleType(_name)
+        _package.__path__ = [str(_path)]
+        sys.modules[_name] = _package
+
+
+# Benchmarks (test_benchmark.py) are opt-in: they run for a while and need a quiet machine.
+_BENCHMARK_RESULTS = pytest.StashKey[list]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("sunflow benchmarks")
+    group.addoption("--benchmark", action="store_true", help="run the load/soak benchmarks")
+    group.addoption(
+        "--benchmark-duration",
+        type=float,
+        default=10.0,
+        help="measured seconds per benchmark scenario (e.g. 3600 for a soak run)",
+    )
+    group.addoption("--benchmark-report", default=None, help="write benchmark results to this file as JSON lines")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line("markers", "benchmark: load/soak benchmark, runs with --benchmark")
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    if config.getoption("--benchmark"):
+        return
+    skip = pytest.mark.skip(reason="benchmark; run with --benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def benchmark_report(pytestconfig: pytest.Config) -> Iterator[list[dict[str, Any]]]:
+    """Collects one result row per benchmark; written as JSON lines to --benchmark-report."""
+    rows: list[dict[str, Any]] = []
+    pytestconfig.stash[_BENCHMARK_RESULTS] = rows
+    yield rows
+    path = pytestconfig.getoption("--benchmark-report")
+    if path:
+        Path(path).write_text("".join(json.dumps(row) + "\n" for row in rows))
+
+
+def pytest_terminal_summary(terminalreporter, config: pytest.Config) -> None:
+    rows = config.stash.get(_BENCHMARK_RESULTS, None)
+    if not rows:
+        return
+    terminalreporter.section("sunflow benchmarks")
+    for row in rows:
+        terminalreporter.write_line(json.dumps(row))
@@ -0,0 +1,150 @@
+"""Local stand-in for the Sunflow add-on API, used by the benchmark suite (test_benchmark.py).
+
+Serves /api/info, /api/data (with ETag/304), /api/roi, /api/battery-health and the
+/api/stream push endpoint, with configurable latency, payload size and error rate.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import hashlib
+import json
+import random
+import time
+from typing import Any
+
+from aiohttp import web
+
+
+@dataclass
+class FakeServerConfig:
+    latency_ms: float = 20.0
+    jitter_ms: float = 10.0
+    payload_bytes: int = 1024
+    # Fraction of requests answered with 500.
+    error_rate: float = 0.0
+    # Realtime data changes every N seconds (0 = on every request); unchanged data answers 304.
+    change_every: float = 0.0
+    etag: bool = True
+    # Seconds between pushed /api/stream frames.
+    push_every: float = 1.0
+
+
+class FakeSunflowServer:
+    def __init__(self, config: FakeServerConfig) -> None:
+        self.config = config
+        self.url = ""
+        # One per listening port; see start().
+        self.urls: list[str] = []
+        self.requests = 0
+        self.not_modified = 0
+        self.errors = 0
+        self.frames_sent = 0
+        self._runner: web.AppRunner | None = None
+        self._closing = asyncio.Event()
+        self._generation = 0
+        self._body_cache: dict[int, tuple[bytes, str]] = {}
+
+    async def start(self, ports: int = 1) -> None:
+        """Listen on `ports` local ports: one per simulated add-on, since connection limits are per host."""
+        app = web.Application()
+        app.router.add_get("/api/info", self._info)
+        app.router.add_get("/api/data", self._data)
+        app.router.add_get("/api/stream", self._stream)
+        app.router.add_get("/api/roi", self._static({"roiPercent": 12.5}))
+        app.router.add_get("/api/battery-health", self._static({"soh": 97}))
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        for _ in range(ports):
+            site = web.TCPSite(self._runner, "127.0.0.1", 0)
+            await site.start()
+            port = site._server.sockets[0].getsockname()[1]
+            self.urls.append(f"http://127.0.0.1:{port}")
+        self.url = self.urls[0]
+
+    async def stop(self) -> None:
+        # Ends open streams so the runner doesn't wait on them.
+        self._closing.set()
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    async def _delay(self) -> bool:
+        self.requests += 1
+        latency = max(self.config.latency_ms + random.uniform(-1, 1) * self.config.jitter_ms, 0)
+        await asyncio.sleep(latency / 1000)
+        if random.random() < self.config.error_rate:
+            self.errors += 1
+            return False
+        return True
+
+    def _static(self, payload: dict[str, Any]):
+        async def handler(_request: web.Request) -> web.Response:
+            if not await self._delay():
+                raise web.HTTPInternalServerError
+            return web.json_response(payload)
+
+        return handler
+
+    async def _info(self, _request: web.Request) -> web.Response:
+        if not await self._delay():
+            raise web.HTTPInternalServerError
+        return web.json_response({"version": "0.0.0-loadtest", "updateAvailable": False, "latestVersion": ""})
+
+    def _payload(self, generation: int) -> dict[str, Any]:
+        pv = 3000 + generation % 500
+        return {
+            "power": {"pv": pv, "load": 800, "grid": 800 - pv, "battery": 0},
+            "battery": {"soc": 55, "state": "idle"},
+            "energy": {"today": {"production": 12.3, "consumption": 7.1}},
+            "autonomy": 100,
+            "selfConsumption": 27,
+        }
+
+    def _realtime_body(self) -> tuple[bytes, str]:
+        if self.config.change_every > 0:
+            generation = int(time.monotonic() / self.config.change_every)
+        else:
+            self._generation += 1
+            generation = self._generation
+        cached = self._body_cache.get(generation)
+        if cached is not None:
+            return cached
+
+        payload = self._payload(generation)
+        base = len(json.dumps(payload))
+        # Pad up to the configured payload size, like a server sending extra device details.
+        payload["padding"] = "x" * max(self.config.payload_bytes - base - 14, 0)
+        body = json.dumps(payload).encode()
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        self._body_cache = {generation: (body, etag)}
+        return body, etag
+
+    async def _data(self, request: web.Request) -> web.Response:
+        if not await self._delay():
+            raise web.HTTPInternalServerError
+        body, etag = self._realtime_body()
+        if self.config.etag and request.headers.get("If-None-Match") == etag:
+            self.not_modified += 1
+            return web.Response(status=304, headers={"ETag": etag})
+        headers = {"ETag": etag} if self.config.etag else {}
+        return web.Response(body=body, content_type="application/json", headers=headers)
+
+    async def _stream(self, request: web.Request) -> web.StreamResponse:
+        if not await self._delay():
+            raise web.HTTPInternalServerError
+        resp = web.StreamResponse(headers={"Content-Type": "text/event-stream", "Cache-Control": "no-cache"})
+        await resp.prepare(request)
+        generation = 0
+        while not self._closing.is_set():
+            generation += 1
+            try:
+                await resp.write(f"event: realtime\ndata: {json.dumps(self._payload(generation))}\n\n".encode())
+            except ConnectionError:
+                break
+            self.frames_sent += 1
+            try:
+                await asyncio.wait_for(self._closing.wait(), self.config.push_every)
+            except asyncio.TimeoutError:
+                pass
+        return resp
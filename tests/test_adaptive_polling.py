@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.sunflow.api import SunflowRealtime  # noqa: E402
+from custom_components.sunflow.coordinator import AdaptivePollingPolicy  # noqa: E402
+
+
+def _realtime(pv: float = 2000, load: float = 500, grid: float = -1500, battery: float = 0, state: str = "idle"):
+    return SunflowRealtime(pv_power=pv, load_power=load, grid_power=grid, battery_power=battery, battery_state=state)
+
+
+def _policy() -> AdaptivePollingPolicy:
+    return AdaptivePollingPolicy(base_seconds=10, floor_seconds=5, ceiling_seconds=120)
+
+
+def test_first_sample_uses_base_interval() -> None:
+    assert _policy().update(_realtime()) == 10
+
+
+def test_steady_values_back_off_to_ceiling() -> None:
+    policy = _policy()
+    policy.update(_realtime())
+    intervals = [policy.update(_realtime(pv=2000 + i)) for i in range(6)]
+
+    assert intervals == [20, 40, 80, 120, 120, 120]
+
+
+def test_quiet_night_uses_wider_band() -> None:
+    policy = _policy()
+    policy.update(_realtime(pv=0, load=300, grid=300))
+
+    # 80 W change is above the steady band but within the night band.
+    assert policy.update(_realtime(pv=0, load=380, grid=380)) == 20
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        {"state": "charging"},  # battery state flip
+        {"grid": -1500 + 600},  # grid import spike
+        {"pv": 2000 + 1200},  # large swing
+    ],
+)
+def test_transients_snap_to_floor(change: dict) -> None:
+    policy = _policy()
+    policy.update(_realtime())
+    policy.update(_realtime(pv=2001))
+
+    assert policy.update(_realtime(**change)) == 5
+
+
+def test_moderate_change_drifts_back_to_base() -> None:
+    policy = _policy()
+    policy.update(_realtime())
+    policy.update(_realtime(pv=2001))
+    policy.update(_realtime(pv=2002))  # backed off to 40 s
+
+    assert policy.update(_realtime(pv=2300)) == 20
+    assert policy.update(_realtime(pv=2600)) == 10
+    assert policy.update(_realtime(pv=2900)) == 10
+
+
+def test_floor_and_ceiling_are_clamped_to_base() -> None:
+    policy = AdaptivePollingPolicy(base_seconds=30, floor_seconds=60, ceiling_seconds=10)
+
+    assert (policy.floor_seconds, policy.ceiling_seconds) == (30, 30)
+
+
+def test_reset_forgets_history() -> None:
+    policy = _policy()
+    policy.update(_realtime())
+    policy.update(_realtime(pv=2001))
+    policy.reset()
+
+    assert policy.interval_seconds == 10
+    # No previous sample: a big jump is not treated as a transient.
+    assert policy.update(_realtime(pv=9000)) == 10
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.sunflow import supervisor  # noqa: E402
+from custom_components.sunflow.sensor import ADDON_STATS_SENSORS, SunflowAddonStatsSensor  # noqa: E402
+from custom_components.sunflow.supervisor import AddonStatsCoordinator  # noqa: E402
+
+
+def test_stats_are_fetched_only_once_an_entity_is_added(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = []
+
+    async def _stats(hass, slug):
+        calls.append(slug)
+        return {"cpu_percent": 1.5, "memory_percent": 10.0}
+
+    monkeypatch.setattr(supervisor, "async_get_addon_stats", _stats)
+    entry = SimpleNamespace(
+        entry_id="test",
+        title="Sunflow",
+        unique_id="addon:local_sunflow",
+        pref_disable_polling=False,
+        async_on_unload=lambda _func: None,
+    )
+
+    async def _run() -> None:
+        hass = HomeAssistant(str(tmp_path))
+        coordinator = AddonStatsCoordinator(hass, entry)
+        sensors = [SunflowAddonStatsSensor(coordinator, entry, description) for description in ADDON_STATS_SENSORS]
+        await asyncio.sleep(0)
+        # Set up but no entity enabled: nothing polls.
+        assert calls == []
+
+        for sensor in sensors[:2]:
+            sensor.hass = hass
+            sensor.entity_id = f"sensor.sunflow_{sensor.entity_description.key}"
+            await sensor.async_added_to_hass()
+        # The first entity fetched right away; the second was folded into it.
+        assert calls == ["local_sunflow"]
+        assert coordinator.data == {"cpu_percent": 1.5, "memory_percent": 10.0}
+
+        for sensor in sensors[:2]:
+            await sensor.async_will_remove_from_hass()
+        await coordinator.async_shutdown()
+
+    asyncio.run(_run())
@@ -0,0 +1,248 @@
+"""Load/soak benchmarks of the integration's hot path against a local fake Sunflow server.
+
+Covers SunflowClient, the coordinator update and push paths and the shared hub scheduler,
+plus config-flow style discovery. No add-on or inverter is needed. Opt-in:
+
+  python -m pytest tests/test_benchmark.py --benchmark [--benchmark-duration 10]
+      [--benchmark-report benchmark.jsonl]
+
+Soak run (watch heap_growth_bytes / heap_samples):
+  python -m pytest tests/test_benchmark.py --benchmark -k "entries and 10" --benchmark-duration 3600
+
+Each scenario reports event-loop lag percentiles, CPU time per tick (refresh or pushed
+frame), Python heap growth, request throughput and refresh/cache counters. The fake server
+shares the event loop (and process), so loop lag and CPU include its (small) share of the work.
+The assertions are sanity bounds only; compare the reported numbers between runs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import asdict
+import math
+from pathlib import Path
+import time
+import tracemalloc
+from types import SimpleNamespace
+from typing import Any
+
+from aiohttp import ClientSession
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from fake_sunflow import FakeServerConfig, FakeSunflowServer  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.sunflow.api import SunflowClient  # noqa: E402
+from custom_components.sunflow.const import CONF_PUSH_UPDATES, CONF_SCAN_INTERVAL_SECONDS  # noqa: E402
+from custom_components.sunflow.coordinator import SunflowDataUpdateCoordinator  # noqa: E402
+from custom_components.sunflow.hub import async_get_hub  # noqa: E402
+from custom_components.sunflow.supervisor import async_probe_first  # noqa: E402
+
+pytestmark = pytest.mark.benchmark
+
+INTERVAL_SECONDS = 5
+LOOP_LAG_PROBE_SECONDS = 0.1
+# Loop lag this high means something blocks the event loop, not measurement noise.
+MAX_LOOP_LAG_P95_MS = 100
+
+
+def _percentiles(samples: list[float], scale: float = 1.0) -> dict[str, float | None]:
+    if not samples:
+        return {"p50": None, "p95": None, "p99": None, "max": None}
+    ordered = sorted(samples)
+
+    def rank(pct: float) -> float:
+        return round(ordered[max(math.ceil(pct / 100 * len(ordered)), 1) - 1] * scale, 2)
+
+    return {"p50": rank(50), "p95": rank(95), "p99": rank(99), "max": round(ordered[-1] * scale, 2)}
+
+
+async def _probe_loop_lag(samples: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(LOOP_LAG_PROBE_SECONDS)
+        samples.append(max(time.perf_counter() - started - LOOP_LAG_PROBE_SECONDS, 0.0))
+
+
+async def _sample_heap(samples: list[int], stop: asyncio.Event, every: float) -> None:
+    while not stop.is_set():
+        try:
+            await asyncio.wait_for(stop.wait(), every)
+        except asyncio.TimeoutError:
+            samples.append(tracemalloc.get_traced_memory()[0])
+
+
+async def _run_entries(
+    tmp_path: Path, entries: int, duration: float, server_config: FakeServerConfig, push: bool = False
+) -> dict[str, Any]:
+    server = FakeSunflowServer(server_config)
+    await server.start(ports=entries)
+    hass = HomeAssistant(str(tmp_path))
+    hub = async_get_hub(hass)
+    coordinators: list[SunflowDataUpdateCoordinator] = []
+    unregister = []
+    push_tasks: list[asyncio.Task] = []
+    frames = 0
+
+    def _on_update() -> None:
+        nonlocal frames
+        frames += 1
+
+    try:
+        for i in range(entries):
+            entry = SimpleNamespace(
+                entry_id=f"loadtest_{i}",
+                title=f"Sunflow {i}",
+                options={CONF_SCAN_INTERVAL_SECONDS: INTERVAL_SECONDS, CONF_PUSH_UPDATES: push},
+                pref_disable_polling=False,
+                async_on_unload=lambda _func: None,
+            )
+            client = SunflowClient(session=hub.session, base_url=server.urls[i])
+            coordinator = SunflowDataUpdateCoordinator(hass, entry, client, server.urls[i])
+            await coordinator.async_refresh()
+            coordinators.append(coordinator)
+
+        # Warm-up done; measure steady state only.
+        tracemalloc.start()
+        heap_start = tracemalloc.get_traced_memory()[0]
+        requests_start = server.requests
+        not_modified_start = server.not_modified
+        refreshes_start = sum(c.client.metrics.refreshes for c in coordinators)
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+
+        for i, coordinator in enumerate(coordinators):
+            unregister.append(hub.async_register(f"loadtest_{i}", coordinator))
+            if push:
+                unregister.append(coordinator.async_add_listener(_on_update))
+                push_tasks.append(asyncio.create_task(coordinator.async_run_push()))
+
+        stop = asyncio.Event()
+        lag: list[float] = []
+        heap: list[int] = []
+        probes = [
+            asyncio.create_task(_probe_loop_lag(lag, stop)),
+            asyncio.create_task(_sample_heap(heap, stop, max(duration / 10, 1.0))),
+        ]
+        await asyncio.sleep(duration)
+        stop.set()
+        await asyncio.gather(*probes)
+
+        wall = time.perf_counter() - wall_start
+        cpu = time.process_time() - cpu_start
+        heap_end = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+    finally:
+        for task in push_tasks:
+            task.cancel()
+        await asyncio.gather(*push_tasks, return_exceptions=True)
+        for callback in unregister:
+            callback()
+        await hub._async_on_close(None)
+        await server.stop()
+
+    refreshes = sum(c.client.metrics.refreshes for c in coordinators) - refreshes_start
+    requests = server.requests - requests_start
+    ticks = refreshes + frames
+    return {
+        "entries": entries,
+        "interval_s": INTERVAL_SECONDS,
+        "push": push,
+        "server": asdict(server_config),
+        "duration_s": round(wall, 1),
+        "refreshes": refreshes,
+        "pushed_frames": frames,
+        "failed_refreshes": hub.metrics.failed_refreshes,
+        "skipped_push_active": hub.metrics.skipped_push_active,
+        "refresh_overruns": sum(c.client.metrics.refresh_overruns for c in coordinators),
+        "requests": requests,
+        "requests_per_s": round(requests / wall, 2),
+        "ticks_per_s": round(ticks / wall, 2),
+        "not_modified": server.not_modified - not_modified_start,
+        "server_errors": server.errors,
+        "circuit_opens": sum(c.client.circuit_breaker.opens for c in coordinators),
+        "cpu_ms_per_tick": round(cpu / ticks * 1000, 3) if ticks else None,
+        "cpu_pct": round(cpu / wall * 100, 2),
+        "loop_lag_ms": _percentiles(lag, scale=1000),
+        "refresh_ms": _percentiles([s for c in coordinators for s in c.client.metrics.refresh_duration], scale=1000),
+        "hub_wakeups": hub.metrics.wakeups,
+        "hub_coalesced_refreshes": hub.metrics.coalesced_refreshes,
+        "heap_growth_bytes": heap_end - heap_start,
+        "heap_samples": heap,
+    }
+
+
+@pytest.fixture
+def duration(pytestconfig: pytest.Config) -> float:
+    return pytestconfig.getoption("--benchmark-duration")
+
+
+@pytest.mark.parametrize("entries", [1, 10, 50])
+def test_entries_polling(tmp_path: Path, benchmark_report: list, duration: float, entries: int) -> None:
+    result = asyncio.run(_run_entries(tmp_path, entries, duration, FakeServerConfig()))
+    benchmark_report.append({"scenario": "entries", **result})
+
+    assert result["failed_refreshes"] == 0
+    # Every entry polls about once per interval (random initial phase: at least half of that).
+    assert result["refreshes"] >= entries * (duration // INTERVAL_SECONDS) // 2
+    assert result["loop_lag_ms"]["p95"] < MAX_LOOP_LAG_P95_MS
+
+
+def test_slow_and_failing_server(tmp_path: Path, benchmark_report: list, duration: float) -> None:
+    config = FakeServerConfig(latency_ms=400, jitter_ms=200, error_rate=0.2)
+    result = asyncio.run(_run_entries(tmp_path, 10, duration, config))
+    benchmark_report.append({"scenario": "slow_and_failing", **result})
+
+    # Retries absorb most errors; the loop stays responsive while requests wait.
+    assert result["refreshes"] > 0
+    assert result["failed_refreshes"] < result["refreshes"]
+    assert result["loop_lag_ms"]["p95"] < MAX_LOOP_LAG_P95_MS
+
+
+def test_unchanged_data_answers_304(tmp_path: Path, benchmark_report: list, duration: float) -> None:
+    config = FakeServerConfig(change_every=duration * 10)
+    result = asyncio.run(_run_entries(tmp_path, 10, duration, config))
+    benchmark_report.append({"scenario": "not_modified", **result})
+
+    assert result["refreshes"] > 0
+    assert result["not_modified"] >= result["refreshes"] // 2
+
+
+def test_push_stream(tmp_path: Path, benchmark_report: list, duration: float) -> None:
+    result = asyncio.run(_run_entries(tmp_path, 10, duration, FakeServerConfig(push_every=1.0), push=True))
+    benchmark_report.append({"scenario": "push", **result})
+
+    # Frames arrive about once a second per entry, and polling stands down meanwhile.
+    assert result["pushed_frames"] >= 10 * (duration - 2) // 2
+    assert result["refreshes"] == 0
+    assert result["loop_lag_ms"]["p95"] < MAX_LOOP_LAG_P95_MS
+
+
+def test_discovery(benchmark_report: list) -> None:
+    """Probe add-on candidates the way the config flow does: concurrently, first answering /api/info wins."""
+
+    async def _run() -> dict[str, Any]:
+        good = FakeSunflowServer(FakeServerConfig())
+        slow = FakeSunflowServer(FakeServerConfig(latency_ms=200, jitter_ms=0))
+        await good.start()
+        await slow.start()
+        # Closed ports on localhost refuse immediately, like a hostname that resolves but has nothing listening.
+        candidates = ["http://127.0.0.1:9", "http://127.0.0.1:1", slow.url, good.url]
+        try:
+            async with ClientSession() as session:
+                started = time.perf_counter()
+                found, _ = await async_probe_first(
+                    candidates, lambda base_url: SunflowClient(session=session, base_url=base_url).async_validate()
+                )
+                elapsed = time.perf_counter() - started
+        finally:
+            await good.stop()
+            await slow.stop()
+        return {"candidates": len(candidates), "found": found == good.url, "discovery_ms": round(elapsed * 1000, 1)}
+
+    result = asyncio.run(_run())
+    benchmark_report.append({"scenario": "discovery", **result})
+
+    assert result["found"]
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.sunflow import api
+from custom_components.sunflow.api import ENDPOINT_INFO, ENDPOINT_REALTIME, RETRY_AFTER_FAILURE_SECONDS, SunflowClient
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    # Only the client's view of time; the event loop keeps the real clock.
+    clock = _Clock()
+    monkeypatch.setattr(api, "time", SimpleNamespace(monotonic=clock.monotonic, perf_counter=time.perf_counter))
+    return clock
+
+
+class _Fetcher:
+    """Stands in for one endpoint fetcher; returns 1, 2, 3, ... or raises when told to."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.fail = False
+        self.gate: asyncio.Event | None = None
+
+    async def __call__(self) -> int:
+        self.calls += 1
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.fail:
+            raise ConnectionError("down")
+        return self.calls
+
+
+def _client(fetcher: _Fetcher, name: str = ENDPOINT_INFO) -> SunflowClient:
+    client = SunflowClient(session=None, base_url="http://sunflow")
+    client._fetchers[name] = fetcher
+    return client
+
+
+def test_value_is_cached_for_its_ttl(clock: _Clock) -> None:
+    fetcher = _Fetcher()
+    client = _client(fetcher)
+
+    async def _run() -> None:
+        assert await client.async_get_many({ENDPOINT_INFO: 60}) == {ENDPOINT_INFO: 1}
+        clock.now += 59
+        assert await client.async_get_many({ENDPOINT_INFO: 60}) == {ENDPOINT_INFO: 1}
+
+    asyncio.run(_run())
+    assert fetcher.calls == 1
+    metrics = client.metrics.endpoint("/api/info")
+    assert (metrics.cache_misses, metrics.cache_hits) == (1, 1)
+
+
+def test_stale_value_is_served_while_refreshing(clock: _Clock) -> None:
+    fetcher = _Fetcher()
+    client = _client(fetcher)
+
+    async def _run() -> None:
+        await client.async_get_many({ENDPOINT_INFO: 60})
+        clock.now += 61
+        fetcher.gate = asyncio.Event()
+        # Due: the stale value comes back right away, the refresh runs in the background.
+        assert await client.async_get_many({ENDPOINT_INFO: 60}) == {ENDPOINT_INFO: 1}
+        # A second caller doesn't start another refresh.
+        assert await client.async_get_many({ENDPOINT_INFO: 60}) == {ENDPOINT_INFO: 1}
+        fetcher.gate.set()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert await client.async_get_many({ENDPOINT_INFO: 60}) == {ENDPOINT_INFO: 2}
+
+    asyncio.run(_run())
+    assert fetcher.calls == 2
+    assert client.metrics.endpoint("/api/info").cache_stale_hits == 2
+
+
+def test_ttl_zero_always_fetches(clock: _Clock) -> None:
+    fetcher = _Fetcher()
+    client = _client(fetcher, ENDPOINT_REALTIME)
+
+    async def _run() -> None:
+        assert await client.async_get_many({ENDPOINT_REALTIME: 0}) == {ENDPOINT_REALTIME: 1}
+        assert await client.async_get_many({ENDPOINT_REALTIME: 0}) == {ENDPOINT_REALTIME: 2}
+
+    asyncio.run(_run())
+    # TTL 0 is not a cache lookup.
+    metrics = client.metrics.endpoint("/api/data")
+    assert (metrics.cache_hits, metrics.cache_misses, metrics.cache_stale_hits) == (0, 0, 0)
+
+
+def test_failed_refresh_keeps_stale_value_and_backs_off(clock: _Clock) -> None:
+    fetcher = _Fetcher()
+    client = _client(fetcher)
+    ttl = 3600
+
+    async def _run() -> None:
+        await client.async_get_many({ENDPOINT_INFO: ttl})
+        clock.now += ttl
+        fetcher.fail = True
+        assert await client.async_get_many({ENDPOINT_INFO: ttl}) == {ENDPOINT_INFO: 1}
+        await asyncio.sleep(0)
+        assert fetcher.calls == 2
+
+        # Not retried on every call, but after RETRY_AFTER_FAILURE_SECONDS (< TTL).
+        clock.now += RETRY_AFTER_FAILURE_SECONDS - 1
+        assert await client.async_get_many({ENDPOINT_INFO: ttl}) == {ENDPOINT_INFO: 1}
+        assert fetcher.calls == 2
+        clock.now += 1
+        fetcher.fail = False
+        await client.async_get_many({ENDPOINT_INFO: ttl})
+        await asyncio.sleep(0)
+        assert fetcher.calls == 3
+        assert await client.async_get_many({ENDPOINT_INFO: ttl}) == {ENDPOINT_INFO: 3}
+
+    asyncio.run(_run())
+
+
+def test_first_fetch_failure_is_raised(clock: _Clock) -> None:
+    fetcher = _Fetcher()
+    fetcher.fail = True
+    client = _client(fetcher)
+
+    async def _run() -> None:
+        with pytest.raises(ConnectionError):
+            await client.async_get_many({ENDPOINT_INFO: 60})
+
+    asyncio.run(_run())
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import asyncio
+
+from aiohttp import ClientSession, web
+from aiohttp.test_utils import TestServer
+
+from custom_components.sunflow.api import SunflowClient
+
+PAYLOAD = {"power": {"pv": 1200, "load": 400}}
+
+
+class _Server:
+    """Serves /api/data with the given validator headers and honours conditional requests."""
+
+    def __init__(self, headers: dict[str, str]) -> None:
+        self.headers = headers
+        self.requests: list[dict[str, str]] = []
+
+    async def handler(self, request: web.Request) -> web.Response:
+        conditional = {
+            name: request.headers[name] for name in ("If-None-Match", "If-Modified-Since") if name in request.headers
+        }
+        self.requests.append(conditional)
+        etag = self.headers.get("ETag")
+        last_modified = self.headers.get("Last-Modified")
+        if (etag and conditional.get("If-None-Match") == etag) or (
+            last_modified and conditional.get("If-Modified-Since") == last_modified
+        ):
+            return web.Response(status=304, headers=self.headers)
+        return web.json_response(PAYLOAD, headers=self.headers)
+
+
+def _fetch(server: _Server, count: int, between=None) -> tuple[list, SunflowClient]:
+    async def _run() -> tuple[list, SunflowClient]:
+        app = web.Application()
+        app.router.add_get("/api/data", server.handler)
+        test_server = TestServer(app)
+        await test_server.start_server()
+        try:
+            async with ClientSession() as session:
+                client = SunflowClient(session=session, base_url=str(test_server.make_url("")))
+                values = []
+                for _ in range(count):
+                    values.append(await client.get_realtime())
+                    if between is not None:
+                        between(client)
+                return values, client
+        finally:
+            await test_server.close()
+
+    return asyncio.run(_run())
+
+
+def test_etag_is_sent_back_and_304_reuses_previous_value() -> None:
+    server = _Server({"ETag": '"v1"'})
+
+    (first, second, third), client = _fetch(server, 3)
+
+    assert server.requests == [{}, {"If-None-Match": '"v1"'}, {"If-None-Match": '"v1"'}]
+    assert first == PAYLOAD
+    # The same parsed object, so "nothing changed" is an identity check downstream.
+    assert second is first and third is first
+    metrics = client.metrics.endpoint("/api/data")
+    assert (metrics.requests, metrics.not_modified) == (3, 2)
+
+
+def test_last_modified_is_sent_back() -> None:
+    server = _Server({"Last-Modified": "Wed, 14 Oct 2026 10:00:00 GMT"})
+
+    (first, second), _client = _fetch(server, 2)
+
+    assert server.requests[1] == {"If-Modified-Since": "Wed, 14 Oct 2026 10:00:00 GMT"}
+    assert second is first
+
+
+def test_response_without_validators_is_fetched_in_full() -> None:
+    server = _Server({})
+
+    (first, second), client = _fetch(server, 2)
+
+    assert server.requests == [{}, {}]
+    assert second == first and second is not first
+    assert client.metrics.endpoint("/api/data").not_modified == 0
+
+
+def test_changing_base_url_drops_validators() -> None:
+    server = _Server({"ETag": '"v1"'})
+
+    _values, _client = _fetch(server, 2, between=lambda client: client.set_base_url(client.base_url))
+
+    # Validators belong to the old server; the next request is unconditional.
+    assert server.requests == [{}, {}]
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import pytest
+
+from custom_components.sunflow.api import SunflowRealtime
+from custom_components.sunflow.energy import MAX_INTEGRATION_GAP_SECONDS, EnergyIntegrator, power_flows_w
+
+
+def _realtime(pv: float = 0, grid: float = 0, battery: float = 0) -> SunflowRealtime:
+    return SunflowRealtime(pv_power=pv, load_power=0, grid_power=grid, battery_power=battery, battery_state="idle")
+
+
+def test_power_is_split_into_non_negative_flows() -> None:
+    # Grid positive = import, battery positive = discharging.
+    assert power_flows_w(_realtime(pv=1000, grid=-300, battery=200)) == (1000, 0, 300, 0, 200)
+    assert power_flows_w(_realtime(pv=-5, grid=400, battery=-700)) == (0, 400, 0, 700, 0)
+    assert power_flows_w(SunflowRealtime()) == (0, 0, 0, 0, 0)
+
+
+def test_trapezoidal_integration() -> None:
+    integrator = EnergyIntegrator()
+    integrator.add_sample(0, _realtime(pv=1000))
+    integrator.add_sample(600, _realtime(pv=3000))
+    integrator.add_sample(1200, _realtime(pv=3000))
+
+    # (1000 + 3000) / 2 W for 10 minutes, then 3000 W for 10 minutes.
+    assert integrator.total_kwh("pv") == pytest.approx(2000 / 6000 + 3000 / 6000)
+    assert integrator.totals() == {
+        "pv": 0.833,
+        "grid_import": 0.0,
+        "grid_export": 0.0,
+        "battery_charge": 0.0,
+        "battery_discharge": 0.0,
+    }
+
+
+def test_first_sample_and_out_of_order_samples_add_nothing() -> None:
+    integrator = EnergyIntegrator()
+    integrator.add_sample(100, _realtime(grid=2000))
+    integrator.add_sample(100, _realtime(grid=2000))
+    integrator.add_sample(50, _realtime(grid=2000))
+
+    assert integrator.total_kwh("grid_import") == 0
+
+
+def test_gaps_longer_than_15_minutes_are_not_bridged() -> None:
+    assert MAX_INTEGRATION_GAP_SECONDS == 15 * 60
+    integrator = EnergyIntegrator()
+    integrator.add_sample(0, _realtime(pv=3600))
+    integrator.add_sample(MAX_INTEGRATION_GAP_SECONDS + 1, _realtime(pv=3600))
+    assert integrator.total_kwh("pv") == 0
+
+    # Integration resumes from the sample after the gap; exactly 15 minutes is still bridged.
+    integrator.add_sample(2 * MAX_INTEGRATION_GAP_SECONDS + 1, _realtime(pv=3600))
+    assert integrator.total_kwh("pv") == pytest.approx(0.9)
+
+
+def test_break_continuity_skips_one_interval() -> None:
+    integrator = EnergyIntegrator()
+    integrator.add_sample(0, _realtime(battery=-1800))
+    integrator.break_continuity()
+    integrator.add_sample(60, _realtime(battery=-1800))
+    integrator.add_sample(120, _realtime(battery=-1800))
+
+    assert integrator.total_kwh("battery_charge") == pytest.approx(0.03)
+
+
+def test_restore_is_applied_once_per_flow() -> None:
+    integrator = EnergyIntegrator()
+    integrator.restore("pv", 12.5)
+    integrator.restore("pv", 12.5)
+    integrator.restore("grid_export", 3.0)
+
+    assert integrator.total_kwh("pv") == 12.5
+    assert integrator.total_kwh("grid_export") == 3.0
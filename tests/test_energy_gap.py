@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+from aiohttp import ClientError
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.util import dt as dt_util  # noqa: E402
+
+from custom_components.sunflow.coordinator import SunflowDataUpdateCoordinator  # noqa: E402
+from custom_components.sunflow.metrics import SunflowMetrics  # noqa: E402
+
+ENTRY = SimpleNamespace(
+    entry_id="test",
+    title="Sunflow",
+    options={},
+    pref_disable_polling=False,
+    async_on_unload=lambda _func: None,
+)
+
+
+class _EnergyClient:
+    def __init__(self, error: Exception | None = None) -> None:
+        self.metrics = SunflowMetrics()
+        self.ranges: list[tuple] = []
+        self.error = error
+
+    async def get_energy_range(self, start, end, resolution):
+        self.ranges.append((start, end, resolution))
+        if self.error is not None:
+            raise self.error
+        return SimpleNamespace(energy_kwh=lambda: {"pv": 1.5, "load": 2.0, "grid_import": 0.5, "grid_export": 0.0})
+
+
+def _recover_after(tmp_path: Path, client: _EnergyClient, outage: timedelta) -> SunflowDataUpdateCoordinator:
+    async def _run() -> SunflowDataUpdateCoordinator:
+        hass = HomeAssistant(str(tmp_path))
+        coordinator = SunflowDataUpdateCoordinator(hass, ENTRY, client, "http://sunflow")
+        recovered = []
+        coordinator.async_add_recovery_listener(lambda: recovered.append(True))
+        coordinator.last_success_time = dt_util.utcnow() - outage
+        coordinator.last_update_success = False
+
+        coordinator._async_mark_success()
+        assert recovered == [True]
+        await coordinator.async_fill_energy_gap()
+        # Taken once; a second call doesn't fetch again.
+        await coordinator.async_fill_energy_gap()
+        return coordinator
+
+    return asyncio.run(_run())
+
+
+def test_outage_energy_is_added_to_totals(tmp_path: Path) -> None:
+    client = _EnergyClient()
+
+    coordinator = _recover_after(tmp_path, client, timedelta(hours=2))
+
+    # One request for the whole outage, in the server's naive local time.
+    [(start, end, resolution)] = client.ranges
+    assert start.tzinfo is None and end.tzinfo is None
+    assert resolution == end - start
+    assert abs(resolution - timedelta(hours=2)) < timedelta(seconds=5)
+    assert coordinator.energy.total_kwh("pv") == 1.5
+    assert coordinator.energy.total_kwh("grid_import") == 0.5
+    assert coordinator.energy.total_kwh("battery_charge") == 0
+
+
+def test_short_outage_is_left_to_the_integrator(tmp_path: Path) -> None:
+    client = _EnergyClient()
+
+    coordinator = _recover_after(tmp_path, client, timedelta(minutes=5))
+
+    assert client.ranges == []
+    assert coordinator.energy.total_kwh("pv") == 0
+
+
+def test_fetch_failure_leaves_totals_alone(tmp_path: Path) -> None:
+    client = _EnergyClient(error=ClientError("down again"))
+
+    coordinator = _recover_after(tmp_path, client, timedelta(hours=2))
+
+    assert len(client.ranges) == 1
+    assert coordinator.energy.total_kwh("pv") == 0
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from custom_components.sunflow.forecast import ForecastSeries
+
+HOUR = 3600.0
+
+
+def test_best_window_ends_on_period_boundary() -> None:
+    # 2 kW, 3 kW, 1 kW hours; a 90-minute window is best from 0:30 to 2:00, which starts
+    # mid-period (the peak period's end minus the window length).
+    series = ForecastSeries([(0.0, HOUR, 2.0), (HOUR, 2 * HOUR, 3.0), (2 * HOUR, 3 * HOUR, 1.0)])
+
+    assert series.best_window(0.0, 3 * HOUR, 1.5 * HOUR) == pytest.approx((0.5 * HOUR, 4.0))
+
+
+def test_best_window_clipped_at_horizon_end() -> None:
+    # The peak is in the last hour; the window has to end at the horizon.
+    series = ForecastSeries([(0.0, HOUR, 1.0), (HOUR, 2 * HOUR, 5.0)])
+
+    assert series.best_window(0.0, 1.5 * HOUR, HOUR) == pytest.approx((0.5 * HOUR, 3.0))
+
+
+def test_best_window_beyond_horizon() -> None:
+    series = ForecastSeries([(0.0, HOUR, 1.0)])
+
+    assert series.best_window(0.5 * HOUR, 2 * HOUR, HOUR) is None
+
+
+def test_from_payload_parses_solcast_periods() -> None:
+    series = ForecastSeries.from_payload(
+        {
+            "forecasts": [
+                {"period_end": "2026-10-14T11:00:00.0000000Z", "period": "PT30M", "pv_estimate": 2.0},
+                {"period_end": "2026-10-14T12:00:00+00:00", "period": "PT1H", "pv_estimate": "1.5"},
+                {"period_end": "2026-10-14T12:30:00", "pv_estimate": -0.1},
+                {"period_end": "not a date", "pv_estimate": 1.0},
+                {"period_end": "2026-10-14T13:00:00Z", "pv_estimate": None},
+                "junk",
+            ]
+        }
+    )
+    ts = datetime(2026, 10, 14, 10, 45, tzinfo=timezone.utc).timestamp()
+
+    assert len(series) == 3
+    assert series.power_kw(ts) == 2.0
+    # Naive timestamps are UTC; negative estimates are clamped.
+    assert series.power_kw(ts + HOUR + 30 * 60) == 0.0
+    assert series.horizon_end == datetime(2026, 10, 14, 12, 30, tzinfo=timezone.utc).timestamp()
+    assert len(ForecastSeries.from_payload(None)) == 0
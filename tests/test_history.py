@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.sunflow import api
+from custom_components.sunflow.api import _iter_json_array
+from custom_components.sunflow.history import ENERGY_FLOWS, MAX_SAMPLE_GAP_SECONDS, EnergyBuckets
+
+T0 = datetime(2026, 10, 14, 10, 0)
+FLOWS = len(ENERGY_FLOWS)
+
+
+def _flows(pv: float) -> tuple[float, ...]:
+    return (pv,) + (0.0,) * (FLOWS - 1)
+
+
+def _at(minutes: float) -> datetime:
+    return T0 + timedelta(minutes=minutes)
+
+
+def test_buckets_split_intervals_at_bucket_boundaries() -> None:
+    buckets = EnergyBuckets(T0, _at(60), timedelta(minutes=15))
+    buckets.add(_at(0), _flows(1000))
+    # 10:00-10:20 at 1000 W spans the first and second bucket.
+    buckets.add(_at(20), _flows(2000))
+    buckets.add(_at(30), _flows(0))
+
+    rows = buckets.as_rows()
+    assert len(buckets) == len(rows) == 4
+    assert [row["start"] for row in rows] == [_at(0), _at(15), _at(30), _at(45)]
+    assert rows[0]["pv"] == 1000
+    # 5 min at 1000 W and 10 min at 2000 W.
+    assert rows[1]["pv"] == pytest.approx((5 * 1000 + 10 * 2000) / 15, abs=0.1)
+    # Nothing covered: None rather than 0, so gaps stay visible.
+    assert rows[2]["pv"] is None and rows[3]["load"] is None
+    assert buckets.energy_kwh()["pv"] == pytest.approx((20 * 1000 + 10 * 2000) / 60 / 1000, abs=0.001)
+
+
+def test_buckets_clip_to_range_and_skip_duplicates_and_gaps() -> None:
+    buckets = EnergyBuckets(T0, _at(30), timedelta(minutes=15))
+    buckets.add(_at(-15), _flows(4000))  # the interval up to 10:00 is before the range
+    buckets.add(_at(0), _flows(9999))
+    buckets.add(_at(0), _flows(1))  # duplicate row at a window boundary
+    buckets.add(_at(-5), _flows(1))  # out of order
+    buckets.add(_at(0) + timedelta(seconds=MAX_SAMPLE_GAP_SECONDS + 1), _flows(0))
+
+    assert buckets.energy_kwh()["pv"] == 0
+    assert [row["pv"] for row in buckets.as_rows()] == [None, None]
+
+
+def test_empty_range_has_no_buckets() -> None:
+    buckets = EnergyBuckets(T0, T0 - timedelta(hours=1), timedelta(minutes=15))
+    buckets.add(_at(0), _flows(1000))
+    buckets.add(_at(10), _flows(1000))
+
+    assert len(buckets) == 0
+    assert buckets.as_rows() == []
+    assert buckets.energy_kwh() == dict.fromkeys(ENERGY_FLOWS, 0.0)
+
+
+def _response(body: bytes, chunk_size: int) -> SimpleNamespace:
+    async def _iter_chunked(_n: int):
+        for i in range(0, len(body), chunk_size):
+            yield body[i : i + chunk_size]
+
+    return SimpleNamespace(content=SimpleNamespace(iter_chunked=_iter_chunked))
+
+
+def _collect(body: bytes, chunk_size: int) -> list:
+    async def _run() -> list:
+        return [row async for row in _iter_json_array(_response(body, chunk_size))]
+
+    return asyncio.run(_run())
+
+
+ROWS = [{"timestamp": f"2026-10-14 10:{i:02d}:00", "production": i * 10.5, "note": "ü€"} for i in range(20)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 64, 100_000])
+def test_json_array_survives_any_chunk_boundary(chunk_size: int) -> None:
+    # Multi-byte UTF-8 characters get split across chunks too.
+    body = json.dumps(ROWS, ensure_ascii=False, indent=1).encode()
+
+    assert _collect(body, chunk_size) == ROWS
+
+
+def test_json_array_skips_non_object_elements() -> None:
+    assert _collect(b' [1, {"a": 1}, "x", null, {"b": [2]}] ', 4) == [{"a": 1}, {"b": [2]}]
+    assert _collect(b"[]", 1) == []
+
+
+@pytest.mark.parametrize("body", [b'{"rows": []}', b"null", b"<html>"])
+def test_json_array_rejects_other_documents(body: bytes) -> None:
+    with pytest.raises(ValueError, match="Expected a JSON array"):
+        _collect(body, 4)
+
+
+@pytest.mark.parametrize("body", [b"", b'[{"a": 1}, {"b"', b'[{"a": 1}'])
+def test_json_array_rejects_truncated_body(body: bytes) -> None:
+    with pytest.raises(ValueError, match="Truncated"):
+        _collect(body, 4)
+
+
+def test_json_array_bounds_element_size(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(api, "JSON_STREAM_MAX_ELEMENT_BYTES", 64)
+    body = json.dumps([{"a": 1}, {"blob": "x" * 200}]).encode()
+
+    with pytest.raises(ValueError, match="too large"):
+        _collect(body, 16)
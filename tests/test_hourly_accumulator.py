@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.sunflow.backfill import HourlyEnergyAccumulator  # noqa: E402
+from custom_components.sunflow.history import MAX_SAMPLE_GAP_SECONDS  # noqa: E402
+
+T0 = datetime(2026, 10, 14, 10, 0, tzinfo=timezone.utc)
+
+
+def _at(minutes: float) -> datetime:
+    return T0 + timedelta(minutes=minutes)
+
+
+def test_power_is_booked_to_the_hour_the_interval_starts_in() -> None:
+    acc = HourlyEnergyAccumulator()
+    acc.add(_at(0), (1200.0, 600.0))
+    acc.add(_at(30), (600.0, 600.0))
+    # Starts at 10:50 and ends at 11:10; all of it counts for 10:00.
+    acc.add(_at(50), (3000.0, 0.0))
+    acc.add(_at(70), (0.0, 0.0))
+
+    assert acc.pop_complete() == [(T0, [1200 / 2 + 600 / 3 + 3000 / 3, 600 / 2 + 600 / 3])]
+    assert acc.last_timestamp == _at(70)
+
+
+def test_latest_hour_stays_open_until_a_later_row() -> None:
+    acc = HourlyEnergyAccumulator()
+    acc.add(_at(0), (1000.0,))
+    acc.add(_at(30), (1000.0,))
+
+    assert acc.pop_complete() == []
+    acc.add(_at(60), (0.0,))
+    assert acc.pop_complete() == [(T0, [1000.0])]
+    # Popped hours are gone.
+    assert acc.pop_complete() == []
+
+
+def test_explicit_cutoff() -> None:
+    acc = HourlyEnergyAccumulator()
+    acc.add(_at(0), (1000.0,))
+    acc.add(_at(30), (1000.0,))
+
+    assert acc.pop_complete(before=_at(60)) == [(T0, [500.0])]
+
+
+def test_duplicates_and_out_of_order_rows_are_ignored() -> None:
+    acc = HourlyEnergyAccumulator()
+    acc.add(_at(0), (1000.0,))
+    acc.add(_at(0), (9999.0,))  # overlapping window boundary
+    acc.add(_at(30), (1000.0,))
+    acc.add(_at(10), (9999.0,))
+    acc.add(_at(60), (0.0,))
+
+    assert acc.pop_complete() == [(T0, [1000.0])]
+
+
+def test_gap_longer_than_max_is_not_bridged() -> None:
+    acc = HourlyEnergyAccumulator()
+    acc.add(_at(0), (1000.0,))
+    acc.add(_at(MAX_SAMPLE_GAP_SECONDS / 60 + 1), (1000.0,))
+    acc.add(_at(MAX_SAMPLE_GAP_SECONDS / 60 + 31), (0.0,))
+
+    # Only the half hour after the gap is counted; the hour before it has nothing.
+    assert acc.pop_complete(before=_at(24 * 60)) == [(T0 + timedelta(hours=1), [500.0])]
+
+
+def test_empty_accumulator() -> None:
+    acc = HourlyEnergyAccumulator()
+
+    assert acc.pop_complete() == []
+    assert acc.last_timestamp is None
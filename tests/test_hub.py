@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+import math
+from types import SimpleNamespace
+
+from aiohttp import TCPConnector
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE  # noqa: E402
+
+from custom_components.sunflow import hub as hub_module  # noqa: E402
+from custom_components.sunflow.hub import SunflowHub  # noqa: E402
+
+
+class _FailingCoordinator:
+    push_active = False
+    config_entry = None
+    last_update_success = False
+
+    def __init__(self, error: BaseException) -> None:
+        self.poll_interval = timedelta(seconds=10)
+        self._error = error
+
+    async def async_refresh(self) -> None:
+        raise self._error
+
+
+@pytest.mark.parametrize("error", [RuntimeError("boom"), asyncio.CancelledError()])
+def test_refresh_error_keeps_entry_scheduled(monkeypatch: pytest.MonkeyPatch, error: BaseException) -> None:
+    monkeypatch.setattr(hub_module, "async_call_later", lambda hass, delay, action: lambda: None)
+    hass = SimpleNamespace(bus=SimpleNamespace(async_listen_once=lambda event, listener: None))
+    hub = SunflowHub(hass)
+    coordinator = _FailingCoordinator(error)
+    hub.async_register("entry", coordinator)
+
+    # As _async_on_timer does while the refresh is in flight.
+    hub._next_due["entry"] = math.inf
+
+    async def _run() -> None:
+        with pytest.raises(type(error)):
+            await hub._async_refresh("entry")
+
+    asyncio.run(_run())
+    assert hub._next_due["entry"] != math.inf
+    assert hub._scheduled_at == hub._next_due["entry"]
+
+
+def test_session_uses_hub_connector_and_closes_on_shutdown(monkeypatch: pytest.MonkeyPatch) -> None:
+    connector_kwargs = {}
+
+    def _connector(**kwargs):
+        connector_kwargs.update(kwargs)
+        return TCPConnector(**kwargs)
+
+    monkeypatch.setattr(hub_module, "TCPConnector", _connector)
+    listeners = {}
+    hass = SimpleNamespace(bus=SimpleNamespace(async_listen_once=listeners.__setitem__))
+    hub = SunflowHub(hass)
+
+    async def _run() -> None:
+        session = hub.session
+        assert hub.session is session
+        assert connector_kwargs["limit_per_host"] == hub_module.HUB_CONNECTION_LIMIT_PER_HOST
+        assert connector_kwargs["ttl_dns_cache"] == hub_module.HUB_DNS_CACHE_TTL_SECONDS
+        assert connector_kwargs["keepalive_timeout"] == hub_module.HUB_KEEPALIVE_TIMEOUT_SECONDS
+        assert session.connector.limit == hub_module.HUB_CONNECTION_LIMIT
+        assert session.headers["User-Agent"]
+
+        await listeners[EVENT_HOMEASSISTANT_CLOSE](None)
+        assert session.closed
+        assert session.connector is None or session.connector.closed
+
+    asyncio.run(_run())
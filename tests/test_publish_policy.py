@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.sunflow.const import (  # noqa: E402
+    CONF_PUBLISH_DEADBAND_PERCENT,
+    CONF_PUBLISH_DEADBAND_W,
+    CONF_PUBLISH_HEARTBEAT_SECONDS,
+    CONF_PUBLISH_MIN_INTERVAL_SECONDS,
+    DEFAULT_PUBLISH_HEARTBEAT_SECONDS,
+)
+from custom_components.sunflow.coordinator import PublishPolicy  # noqa: E402
+
+
+def test_defaults_publish_every_change() -> None:
+    policy = PublishPolicy.from_options({})
+
+    assert not policy.enabled
+    assert policy.heartbeat_seconds == DEFAULT_PUBLISH_HEARTBEAT_SECONDS
+    assert policy.should_publish(100, 101, 0, absolute=True, relative=True)
+    assert not policy.should_publish(100, 100, 0, absolute=True, relative=True)
+
+
+def test_from_options_falls_back_on_invalid_values() -> None:
+    policy = PublishPolicy.from_options(
+        {
+            CONF_PUBLISH_DEADBAND_W: "25",
+            CONF_PUBLISH_DEADBAND_PERCENT: None,
+            CONF_PUBLISH_MIN_INTERVAL_SECONDS: "soon",
+            CONF_PUBLISH_HEARTBEAT_SECONDS: 60,
+        }
+    )
+
+    assert policy == PublishPolicy(deadband_w=25, deadband_percent=0, min_interval_seconds=0, heartbeat_seconds=60)
+    assert policy.enabled
+
+
+def test_absolute_deadband_applies_to_power_sensors_only() -> None:
+    policy = PublishPolicy(deadband_w=50)
+
+    assert not policy.should_publish(1000, 1050, 10, absolute=True)
+    assert policy.should_publish(1000, 1051, 10, absolute=True)
+    assert policy.should_publish(1000, 949, 10, absolute=True)
+    # Sensors that didn't opt in see every change.
+    assert policy.should_publish(1000, 1001, 10)
+
+
+def test_relative_deadband_scales_with_previous_value() -> None:
+    policy = PublishPolicy(deadband_percent=10)
+
+    assert not policy.should_publish(80, 87, 10, relative=True)
+    assert policy.should_publish(80, 89, 10, relative=True)
+    # At 0 the band is 0, so any change is published.
+    assert policy.should_publish(0, 1, 10, relative=True)
+
+
+def test_larger_band_wins_when_both_apply() -> None:
+    policy = PublishPolicy(deadband_w=20, deadband_percent=5)
+
+    assert not policy.should_publish(1000, 1040, 10, absolute=True, relative=True)
+    assert not policy.should_publish(100, 115, 10, absolute=True, relative=True)
+    assert policy.should_publish(100, 121, 10, absolute=True, relative=True)
+
+
+def test_min_interval_holds_back_changes() -> None:
+    policy = PublishPolicy(min_interval_seconds=30)
+
+    assert not policy.should_publish(1000, 5000, 29, absolute=True)
+    assert policy.should_publish(1000, 5000, 30, absolute=True)
+
+
+def test_heartbeat_publishes_unchanged_values() -> None:
+    policy = PublishPolicy(deadband_w=50, min_interval_seconds=600, heartbeat_seconds=300)
+
+    assert not policy.should_publish(1000, 1000, 299, absolute=True)
+    # The heartbeat beats the min interval and the deadband.
+    assert policy.should_publish(1000, 1000, 300, absolute=True)
+
+
+@pytest.mark.parametrize(("previous", "value"), [(None, 5), (5, None), ("charging", "idle")])
+def test_unknown_and_non_numeric_states_bypass_the_policy(previous, value) -> None:
+    policy = PublishPolicy(deadband_w=1000, min_interval_seconds=600)
+
+    assert policy.should_publish(previous, value, 0, absolute=True)
+    assert not policy.should_publish(value, value, 0, absolute=True)
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from aiohttp import ClientError  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.sunflow import coordinator as coordinator_module  # noqa: E402
+from custom_components.sunflow.api import ENDPOINT_INFO, ENDPOINT_REALTIME, SunflowStreamNotSupported  # noqa: E402
+from custom_components.sunflow.coordinator import SunflowDataUpdateCoordinator  # noqa: E402
+from custom_components.sunflow.metrics import SunflowMetrics  # noqa: E402
+
+ENTRY = SimpleNamespace(
+    entry_id="test",
+    title="Sunflow",
+    options={},
+    pref_disable_polling=False,
+    async_on_unload=lambda _func: None,
+)
+
+
+def _frame(pv: int) -> dict:
+    return {"power": {"pv": pv, "load": 400, "grid": 0, "battery": 0}}
+
+
+class _StreamClient:
+    """Plays back one scripted outcome per connection: a list of frames, or an exception."""
+
+    def __init__(self, connections: list) -> None:
+        self.metrics = SunflowMetrics()
+        self.connections = connections
+        self.info: object = {"version": "1.0"}
+
+    async def async_stream_realtime(self):
+        outcome = self.connections.pop(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        for frame in outcome:
+            yield frame
+        raise ClientError("stream closed")
+
+    async def async_get_many(self, ttls):
+        if isinstance(self.info, BaseException):
+            raise self.info
+        return {ENDPOINT_INFO: self.info}
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Record reconnect delays without waiting; jitter is pinned to 1."""
+    delays: list[float] = []
+    real_sleep = asyncio.sleep
+
+    async def _sleep(delay: float) -> None:
+        delays.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr(coordinator_module.asyncio, "sleep", _sleep)
+    monkeypatch.setattr(coordinator_module, "random", SimpleNamespace(uniform=lambda _a, _b: 1.0))
+    return delays
+
+
+def _run_push(tmp_path: Path, client: _StreamClient, check=None) -> SunflowDataUpdateCoordinator:
+    async def _run() -> SunflowDataUpdateCoordinator:
+        hass = HomeAssistant(str(tmp_path))
+        coordinator = SunflowDataUpdateCoordinator(hass, ENTRY, client, "http://sunflow")
+        refreshes = []
+
+        async def _request_refresh() -> None:
+            refreshes.append(coordinator.push_active)
+
+        coordinator.async_request_refresh = _request_refresh
+        coordinator.refreshes = refreshes
+        await coordinator.async_run_push()
+        return coordinator
+
+    return asyncio.run(_run())
+
+
+def test_reconnect_backs_off_and_resets_after_frames(tmp_path: Path, sleeps: list[float]) -> None:
+    client = _StreamClient(
+        [
+            ClientError("refused"),
+            ClientError("refused"),
+            ClientError("refused"),
+            [_frame(100)],
+            ClientError("refused"),
+            SunflowStreamNotSupported("gone"),
+        ]
+    )
+
+    coordinator = _run_push(tmp_path, client)
+
+    # Doubling while the server refuses; back to the minimum once a frame got through.
+    assert sleeps == [1, 2, 4, 1, 2]
+    # The drop after a live stream refreshes right away instead of waiting for the next poll.
+    assert coordinator.refreshes == [False]
+    assert coordinator.push_active is False
+
+
+def test_backoff_is_capped(tmp_path: Path, sleeps: list[float]) -> None:
+    client = _StreamClient([ClientError("refused")] * 10 + [SunflowStreamNotSupported("gone")])
+
+    _run_push(tmp_path, client)
+
+    assert max(sleeps) == coordinator_module.PUSH_RECONNECT_MAX_SECONDS
+    assert sleeps[-1] == coordinator_module.PUSH_RECONNECT_MAX_SECONDS
+
+
+def test_missing_stream_falls_back_to_polling(tmp_path: Path, sleeps: list[float]) -> None:
+    coordinator = _run_push(tmp_path, _StreamClient([SunflowStreamNotSupported("404")]))
+
+    assert sleeps == []
+    assert coordinator.push_active is False
+    assert coordinator.data is None
+
+
+def test_info_failure_keeps_stream_and_previous_info(tmp_path: Path, sleeps: list[float]) -> None:
+    client = _StreamClient([[_frame(100), _frame(200), _frame(300)], SunflowStreamNotSupported("gone")])
+    seen = []
+
+    async def _get_many(ttls):
+        seen.append(len(seen))
+        if len(seen) > 1:
+            raise asyncio.TimeoutError
+        return {ENDPOINT_INFO: {"version": "1.0"}}
+
+    client.async_get_many = _get_many
+
+    coordinator = _run_push(tmp_path, client)
+
+    # All three frames were applied on the same connection despite the info failures.
+    assert len(seen) == 3
+    assert sleeps == [1]
+    assert coordinator.data[ENDPOINT_REALTIME] == _frame(300)
+    assert coordinator.data[ENDPOINT_INFO] == {"version": "1.0"}
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.sunflow.api import ENDPOINT_INFO, ENDPOINT_REALTIME, SunflowRealtime
+from custom_components.sunflow.metrics import SunflowMetrics
+
+
+def test_from_payload_decodes_nested_sections() -> None:
+    state = SunflowRealtime.from_payload(
+        {
+            "power": {"pv": 1200, "load": "400.5", "grid": -800, "battery": 150},
+            "battery": {"soc": 80, "state": "discharging"},
+            "energy": {"today": {"production": 7.25}},
+            "autonomy": 93,
+        }
+    )
+
+    assert (state.pv_power, state.load_power, state.grid_power) == (1200, 400.5, -800)
+    assert state.battery_power == 150.0 and state.battery_discharge_power == 150.0
+    assert (state.battery_soc, state.battery_state) == (80, "discharging")
+    assert state.energy_today_production == 7.25
+    assert state.autonomy == 93 and state.self_consumption is None
+
+
+@pytest.mark.parametrize("payload", [None, {}, {"power": None, "battery": [], "energy": {"today": "n/a"}}])
+def test_missing_or_malformed_sections_read_as_unknown(payload) -> None:
+    assert SunflowRealtime.from_payload(payload) == SunflowRealtime()
+
+
+@pytest.mark.parametrize("payload", [[{"power": {}}], "error", 42])
+def test_non_object_payload_is_rejected(payload) -> None:
+    with pytest.raises(ValueError, match="JSON object"):
+        SunflowRealtime.from_payload(payload)
+
+
+def test_non_object_payload_fails_the_refresh(tmp_path: Path) -> None:
+    pytest.importorskip("homeassistant")
+    from homeassistant.core import HomeAssistant
+
+    from custom_components.sunflow.coordinator import SunflowDataUpdateCoordinator
+
+    class _Client:
+        metrics = SunflowMetrics()
+
+        async def async_get_many(self, ttls):
+            return {ENDPOINT_INFO: None, ENDPOINT_REALTIME: ["not", "an", "object"]}
+
+    entry = SimpleNamespace(
+        entry_id="test", title="Sunflow", options={}, pref_disable_polling=False, async_on_unload=lambda _func: None
+    )
+
+    async def _run() -> None:
+        hass = HomeAssistant(str(tmp_path))
+        coordinator = SunflowDataUpdateCoordinator(hass, entry, _Client(), "http://sunflow")
+        await coordinator.async_refresh()
+
+        assert not coordinator.last_update_success
+        assert coordinator.last_success_time is None
+
+    asyncio.run(_run())
@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+from aiohttp import ClientConnectionError, ClientResponseError
+import pytest
+
+from custom_components.sunflow import api
+from custom_components.sunflow.api import (
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_MAX_OPEN_SECONDS,
+    CIRCUIT_OPEN_SECONDS,
+    RETRY_BUDGET_MAX_TOKENS,
+    RETRY_MAX_ATTEMPTS,
+    CircuitBreaker,
+    RetryBudget,
+    SunflowCircuitOpen,
+    SunflowClient,
+)
+
+PATH = "/api/data"
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    # Only the client's view of time; the event loop keeps the real clock.
+    clock = _Clock()
+    monkeypatch.setattr(api, "time", SimpleNamespace(monotonic=clock.monotonic, perf_counter=time.perf_counter))
+    # No jitter, so retry delays are 0 and tests don't wait.
+    monkeypatch.setattr(api, "random", SimpleNamespace(uniform=lambda _a, _b: 0.0))
+    return clock
+
+
+def _status_error(status: int) -> ClientResponseError:
+    return ClientResponseError(SimpleNamespace(real_url=PATH), (), status=status)
+
+
+def _open(breaker: CircuitBreaker) -> None:
+    for _ in range(CIRCUIT_FAILURE_THRESHOLD):
+        breaker.record_failure()
+
+
+def test_breaker_opens_after_threshold(clock: _Clock) -> None:
+    breaker = CircuitBreaker()
+    for _ in range(CIRCUIT_FAILURE_THRESHOLD - 1):
+        breaker.record_failure()
+    assert breaker.before_request() is False
+
+    breaker.record_failure()
+    assert (breaker.state, breaker.opens) == (CircuitBreaker.OPEN, 1)
+    with pytest.raises(SunflowCircuitOpen):
+        breaker.before_request()
+    with pytest.raises(SunflowCircuitOpen):
+        breaker.raise_if_open()
+
+
+def test_breaker_success_resets_failure_count(clock: _Clock) -> None:
+    breaker = CircuitBreaker()
+    for _ in range(CIRCUIT_FAILURE_THRESHOLD - 1):
+        breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_breaker_half_open_allows_a_single_probe(clock: _Clock) -> None:
+    breaker = CircuitBreaker()
+    _open(breaker)
+    clock.now += CIRCUIT_OPEN_SECONDS
+
+    assert breaker.before_request() is True
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    with pytest.raises(SunflowCircuitOpen, match="probe"):
+        breaker.before_request()
+
+    breaker.record_success()
+    breaker.release_probe()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.before_request() is False
+
+
+def test_failed_probe_doubles_open_period_up_to_max(clock: _Clock) -> None:
+    breaker = CircuitBreaker()
+    _open(breaker)
+    open_seconds = CIRCUIT_OPEN_SECONDS
+    for _ in range(6):
+        clock.now += open_seconds
+        assert breaker.before_request() is True
+        breaker.record_failure()
+        breaker.release_probe()
+        open_seconds = min(open_seconds * 2, CIRCUIT_MAX_OPEN_SECONDS)
+
+        clock.now += open_seconds - 1
+        with pytest.raises(SunflowCircuitOpen):
+            breaker.before_request()
+        clock.now += 1 - open_seconds
+
+    assert open_seconds == CIRCUIT_MAX_OPEN_SECONDS
+
+
+def test_retry_budget_caps_retries() -> None:
+    budget = RetryBudget()
+    withdrawn = 0
+    while budget.try_withdraw():
+        withdrawn += 1
+    assert withdrawn == RETRY_BUDGET_MAX_TOKENS
+
+    # Each request earns back a tenth of a retry (ten deposits sum to a hair below 1.0).
+    for _ in range(9):
+        budget.deposit()
+    assert not budget.try_withdraw()
+    budget.deposit()
+    budget.deposit()
+    assert budget.try_withdraw()
+
+    # Idle periods don't bank more than the cap.
+    for _ in range(1000):
+        budget.deposit()
+    assert sum(budget.try_withdraw() for _ in range(100)) == RETRY_BUDGET_MAX_TOKENS
+
+
+class _Once:
+    """Stands in for SunflowClient._get_json_once: plays back outcomes, optionally gated."""
+
+    def __init__(self, *outcomes) -> None:
+        self.outcomes = list(outcomes)
+        self.calls = 0
+        self.gate: asyncio.Event | None = None
+
+    async def __call__(self, base_url: str, path: str, budget: float):
+        self.calls += 1
+        if self.gate is not None:
+            await self.gate.wait()
+        outcome = self.outcomes.pop(0) if len(self.outcomes) > 1 else self.outcomes[0]
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+
+def _client(once: _Once) -> SunflowClient:
+    client = SunflowClient(session=None, base_url="http://sunflow")
+    client._get_json_once = once
+    return client
+
+
+def test_transient_errors_are_retried(clock: _Clock) -> None:
+    once = _Once(ClientConnectionError(), asyncio.TimeoutError(), {"ok": 1})
+    client = _client(once)
+
+    assert asyncio.run(client._get_json(PATH)) == {"ok": 1}
+    assert once.calls == 3
+    assert client.metrics.endpoint(PATH).retries == 2
+    assert client.circuit_breaker.state == CircuitBreaker.CLOSED
+
+
+def test_retries_stop_after_max_attempts(clock: _Clock) -> None:
+    once = _Once(_status_error(503))
+    client = _client(once)
+
+    with pytest.raises(ClientResponseError):
+        asyncio.run(client._get_json(PATH))
+    assert once.calls == RETRY_MAX_ATTEMPTS
+
+
+@pytest.mark.parametrize(
+    ("error", "proxied"),
+    [(_status_error(404), False), (_status_error(503), True)],
+)
+def test_server_answers_are_not_retried(clock: _Clock, error: Exception, proxied: bool) -> None:
+    once = _Once(error)
+    client = _client(once)
+    for _ in range(CIRCUIT_FAILURE_THRESHOLD - 1):
+        client.circuit_breaker.record_failure()
+
+    with pytest.raises(ClientResponseError):
+        asyncio.run(client._get_json(PATH, proxied=proxied))
+    assert once.calls == 1
+    # The server answered, so it counts as up.
+    client.circuit_breaker.record_failure()
+    assert client.circuit_breaker.state == CircuitBreaker.CLOSED
+
+
+def test_empty_retry_budget_skips_retry(clock: _Clock) -> None:
+    once = _Once(ClientConnectionError(), {"ok": 1})
+    client = _client(once)
+    while client._retry_budget.try_withdraw():
+        pass
+
+    with pytest.raises(ClientConnectionError):
+        asyncio.run(client._get_json(PATH))
+    assert once.calls == 1
+
+
+def test_open_circuit_rejects_without_a_request(clock: _Clock) -> None:
+    once = _Once({"ok": 1})
+    client = _client(once)
+    _open(client.circuit_breaker)
+
+    with pytest.raises(SunflowCircuitOpen):
+        asyncio.run(client._get_json(PATH))
+    assert once.calls == 0
+    assert client.metrics.endpoint(PATH).circuit_rejections == 1
+
+
+def test_concurrent_requests_share_one_fetch(clock: _Clock) -> None:
+    once = _Once({"ok": 1})
+    client = _client(once)
+
+    async def _run() -> None:
+        once.gate = asyncio.Event()
+        first = asyncio.create_task(client._get_json(PATH))
+        second = asyncio.create_task(client._get_json(PATH))
+        await asyncio.sleep(0)
+        once.gate.set()
+        assert await first == await second == {"ok": 1}
+        # Done; the next call starts a new request.
+        await client._get_json(PATH)
+
+    asyncio.run(_run())
+    assert once.calls == 2
+    assert client.metrics.endpoint(PATH).coalesced == 1
+
+
+def test_one_caller_giving_up_does_not_cancel_the_shared_request(clock: _Clock) -> None:
+    once = _Once({"ok": 1})
+    client = _client(once)
+
+    async def _run() -> None:
+        once.gate = asyncio.Event()
+        first = asyncio.create_task(client._get_json(PATH))
+        second = asyncio.create_task(client._get_json(PATH))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        once.gate.set()
+        assert await second == {"ok": 1}
+        assert first.cancelled()
+
+    asyncio.run(_run())
+    assert once.calls == 1
+
+
+def test_request_is_cancelled_when_every_caller_gives_up(clock: _Clock) -> None:
+    once = _Once({"ok": 1})
+    client = _client(once)
+
+    async def _run() -> None:
+        once.gate = asyncio.Event()
+        caller = asyncio.create_task(client._get_json(PATH))
+        await asyncio.sleep(0)
+        task = client._inflight[PATH].task
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0)
+        assert PATH not in client._inflight
+
+    asyncio.run(_run())
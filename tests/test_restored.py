@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.sunflow.api import ENDPOINT_INFO, ENDPOINT_REALTIME  # noqa: E402
+from custom_components.sunflow.coordinator import SunflowDataUpdateCoordinator  # noqa: E402
+from custom_components.sunflow.metrics import SunflowMetrics  # noqa: E402
+from custom_components.sunflow.sensor import REALTIME_SENSORS, SunflowRealtimeSensor  # noqa: E402
+
+PAYLOAD = {"power": {"pv": 1200, "load": 400, "grid": -800, "battery": 0}, "battery": {"soc": 80}}
+
+
+class _FakeClient:
+    def __init__(self) -> None:
+        self.metrics = SunflowMetrics()
+
+    async def async_get_many(self, ttls):
+        return {ENDPOINT_INFO: None, ENDPOINT_REALTIME: dict(PAYLOAD)}
+
+
+def test_restored_flag_clears_after_first_live_refresh(tmp_path: Path) -> None:
+    entry = SimpleNamespace(
+        entry_id="test",
+        title="Sunflow",
+        options={},
+        pref_disable_polling=False,
+        async_on_unload=lambda _func: None,
+    )
+
+    async def _run() -> None:
+        hass = HomeAssistant(str(tmp_path))
+        coordinator = SunflowDataUpdateCoordinator(hass, entry, _FakeClient(), "http://sunflow")
+        sensor = SunflowRealtimeSensor(coordinator, entry, REALTIME_SENSORS[0])
+
+        # Same payload as the live one, so always_update=False alone would not notify.
+        assert coordinator.async_restore(None, dict(PAYLOAD))
+        assert sensor.extra_state_attributes == {"restored": True, "last_live_update": None}
+
+        notified = []
+        coordinator.async_add_listener(lambda: notified.append(coordinator.restored))
+        await coordinator.async_refresh()
+
+        assert coordinator.last_update_success
+        assert notified and notified[-1] is False
+        attributes = sensor.extra_state_attributes
+        assert attributes["restored"] is False
+        assert attributes["last_live_update"] is not None
+
+    asyncio.run(_run())
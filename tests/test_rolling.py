@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from custom_components.sunflow.api import SunflowRealtime
+from custom_components.sunflow.rolling import ROLLING_CAPACITY, ROLLING_FIELDS, ROLLING_WINDOWS, RollingPowerStats
+
+
+def _realtime(pv: float, load: float = 0, grid: float = 0, battery: float = 0) -> SunflowRealtime:
+    return SunflowRealtime(pv_power=pv, load_power=load, grid_power=grid, battery_power=battery)
+
+
+def test_empty_stats() -> None:
+    assert RollingPowerStats().stats("pv", 60) is None
+
+
+def test_window_mean_min_max() -> None:
+    stats = RollingPowerStats()
+    for ts, pv in ((0, 300), (10, 100), (20, 200), (30, 100)):
+        stats.add_sample(ts, _realtime(pv, grid=-pv))
+
+    assert stats.stats("pv", 60) == {"mean": 175.0, "min": 100, "max": 300, "samples": 4}
+    assert stats.stats("grid", 60) == {"mean": -175.0, "min": -300, "max": -100, "samples": 4}
+
+
+def test_old_samples_leave_the_short_window_only() -> None:
+    stats = RollingPowerStats()
+    stats.add_sample(0, _realtime(5000))
+    stats.add_sample(30, _realtime(100))
+    stats.add_sample(60, _realtime(200))
+
+    # Exactly 60 s old is out of the 1-minute window; the max falls back to the next one.
+    assert stats.stats("pv", 60) == {"mean": 150.0, "min": 100, "max": 200, "samples": 2}
+    assert stats.stats("pv", 300)["max"] == 5000
+    assert stats.stats("pv", 900)["samples"] == 3
+
+
+def test_duplicate_and_out_of_order_samples_are_ignored() -> None:
+    stats = RollingPowerStats()
+    stats.add_sample(10, _realtime(100))
+    stats.add_sample(10, _realtime(9999))
+    stats.add_sample(5, _realtime(-9999))
+
+    assert stats.stats("pv", 60) == {"mean": 100.0, "min": 100, "max": 100, "samples": 1}
+
+
+def test_matches_brute_force_across_ring_wraparound() -> None:
+    rng = random.Random(1)
+    stats = RollingPowerStats()
+    history: list[tuple[float, tuple[float, ...]]] = []
+    ts = 0.0
+    # Mostly sub-second steps, so the ring (not the window length) bounds the 15-minute window.
+    for step in range(3 * ROLLING_CAPACITY + 17):
+        ts += 30.0 if rng.random() < 0.005 else rng.choice((0.25, 0.5, 1.0))
+        # Plateaus and repeated values exercise ties in the monotonic queues.
+        values = tuple(float(rng.choice((-500, 0, 100, 100, 250, rng.randint(-3000, 3000)))) for _ in ROLLING_FIELDS)
+        stats.add_sample(ts, _realtime(*values))
+        history.append((ts, values))
+        if step % 7:
+            continue
+        kept = history[-ROLLING_CAPACITY:]
+        for seconds in ROLLING_WINDOWS:
+            window = [values for sample_ts, values in kept if ts - sample_ts < seconds]
+            for i, field in enumerate(ROLLING_FIELDS):
+                column = [values[i] for values in window]
+                assert stats.stats(field, seconds) == {
+                    "mean": pytest.approx(round(sum(column) / len(column), 1), abs=0.11),
+                    "min": min(column),
+                    "max": max(column),
+                    "samples": len(column),
+                }
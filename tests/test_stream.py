@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import asyncio
+
+from aiohttp import ClientSession, web
+from aiohttp.test_utils import TestServer
+import pytest
+
+from custom_components.sunflow.api import SunflowClient, SunflowStreamNotSupported
+
+SSE_BODY = (
+    ": keep-alive\n\n"
+    'data: {"power": {"pv": 1}}\n\n'
+    # Multi-line data is joined with newlines.
+    "event: realtime\n"
+    'data: {"power":\n'
+    'data:  {"pv": 2}}\n\n'
+    # Other event types and non-JSON frames are ignored.
+    "event: ping\n"
+    'data: {"power": {"pv": 99}}\n\n'
+    "data: not json\n\n"
+    'data: [1, 2]\n\n'
+    # CRLF line endings.
+    'data: {"power": {"pv": 3}}\r\n\r\n'
+)
+
+
+async def _frames(handler) -> list[dict]:
+    app = web.Application()
+    app.router.add_get("/api/stream", handler)
+    server = TestServer(app)
+    await server.start_server()
+    try:
+        async with ClientSession() as session:
+            client = SunflowClient(session=session, base_url=str(server.make_url("")))
+            return [frame async for frame in client.async_stream_realtime()]
+    finally:
+        await server.close()
+
+
+def test_stream_parses_server_sent_events() -> None:
+    async def handler(request: web.Request) -> web.StreamResponse:
+        resp = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await resp.prepare(request)
+        # Split mid-event, as it would arrive over the network.
+        await resp.write(SSE_BODY[:40].encode())
+        await resp.write(SSE_BODY[40:].encode())
+        return resp
+
+    frames = asyncio.run(_frames(handler))
+
+    assert frames == [{"power": {"pv": 1}}, {"power": {"pv": 2}}, {"power": {"pv": 3}}]
+
+
+@pytest.mark.parametrize("status", [404, 405, 501])
+def test_missing_stream_endpoint_is_not_supported(status: int) -> None:
+    async def handler(request: web.Request) -> web.Response:
+        return web.Response(status=status)
+
+    with pytest.raises(SunflowStreamNotSupported):
+        asyncio.run(_frames(handler))
+
+
+def test_non_event_stream_response_is_not_supported() -> None:
+    # Older servers answer unknown paths with the SPA's index.html.
+    async def handler(request: web.Request) -> web.Response:
+        return web.Response(text="<html></html>", content_type="text/html")
+
+    with pytest.raises(SunflowStreamNotSupported):
+        asyncio.run(_frames(handler))
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from homeassistant.components.sensor import SensorStateClass  # noqa: E402
+from homeassistant.util import dt as dt_util  # noqa: E402
+
+from custom_components.sunflow.sensor import ANALYTICS_SENSORS, SunflowAnalyticsSensor  # noqa: E402
+
+MONTHLY = {"fixed_tariff_cost_month", "dynamic_tariff_cost_month", "dynamic_tariff_savings_month"}
+
+
+def test_monthly_tariff_sensors_reset_at_start_of_month() -> None:
+    entry = SimpleNamespace(entry_id="test", title="Sunflow")
+    coordinator = SimpleNamespace(data=None)
+    now = dt_util.now()
+
+    for description in ANALYTICS_SENSORS:
+        sensor = SunflowAnalyticsSensor(coordinator, entry, description, "EUR")
+        if description.key not in MONTHLY:
+            assert sensor.last_reset is None
+            continue
+        assert description.state_class == SensorStateClass.TOTAL
+        reset = dt_util.as_local(sensor.last_reset)
+        assert (reset.year, reset.month, reset.day, reset.hour, reset.minute) == (now.year, now.month, 1, 0, 0)